@@ -4,10 +4,25 @@ import random
 import datetime
 from datetime import timedelta
 import time
+import json
+import re
+import gzip
+import hashlib
+import itertools
+import queue
+import tempfile
+import threading
 import requests
 import numpy as np
 import uuid
-from flask import Flask, request, jsonify, render_template, g
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from flask import Flask, request, jsonify, render_template, g, Response, stream_with_context, send_file, url_for
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from jinja2 import FileSystemBytecodeCache
 
 # Import real sports API service
 try:
@@ -21,6 +36,7 @@ except ImportError as e:
 try:
     import firebase_admin
     from firebase_admin import credentials, firestore, auth
+    from google.api_core.exceptions import Aborted as FirestoreAborted, NotFound as FirestoreNotFound
     FIREBASE_AVAILABLE = True
     # Print statement moved to app initialization function to prevent duplicates
 except ImportError as e:
@@ -48,11 +64,18 @@ except ImportError as e:
         def delete(self): 
             pass
     firestore = MockFirestore()
+    
+    class FirestoreNotFound(Exception):
+        """Stand-in for google.api_core NotFound; the mock never raises it"""
+    
+    class FirestoreAborted(Exception):
+        """Stand-in for google.api_core Aborted; the mock never raises it"""
 
 # Import standardized schemas
 from schemas import (
     InvestorSchema, StrategySchema, ModelSchema, InvestorStatus, StrategyType, Sport,
-    RiskManagement, PerformanceMetrics, SchemaValidator
+    RiskManagement, PerformanceMetrics, SchemaValidator, MarketType,
+    MODEL_STATUS_VALUES, INVESTOR_STATUS_VALUES, STRATEGY_TYPE_VALUES, SPORT_VALUES, MARKET_TYPE_VALUES
 )
 from data_service import data_service
 
@@ -63,10 +86,16 @@ from error_handling import (
     create_error_response, validate_required_fields, error_monitor
 )
 from api_documentation import validate_endpoint_request, Post9APIDocumentation
-from security import SecurityManager, require_authentication, rate_limit, sanitize_request_data
+from security import (
+    SecurityManager, InputSanitizer, create_redis_client, require_authentication, rate_limit, sanitize_request_data
+)
 from model_registry import model_registry, ModelStatus
 from data_validation import data_validator, data_processor
 from user_engagement import engagement_system
+from metrics import (
+    PREDICTION_LATENCY, FIRESTORE_LATENCY, JSON_ENCODE_LATENCY,
+    record_cache_lookup, record_model_request, mount_metrics_endpoint
+)
 
 # Import core betting logic to avoid code duplication
 from betting_logic import simulate_single_bet, simulate_real_world_bet
@@ -77,10 +106,12 @@ try:
     sys.path.append(os.path.dirname(__file__))
     
     from ml.model_manager import model_manager
+    from ml.prediction_batcher import PredictionBatcher, PredictionBatcherFull
     from analytics.advanced_stats import AdvancedSportsAnalyzer, generate_demo_analytics_data
     from models.neural_predictor import SportsNeuralPredictor, generate_demo_training_data
     from models.ensemble_predictor import SportsEnsemblePredictor
     ML_AVAILABLE = True
+    BASIC_ML_ONLY = False
     # Print statement moved to app initialization function
 except ImportError as e:
     try:
@@ -93,6 +124,20 @@ except ImportError as e:
         ML_AVAILABLE = False
         BASIC_ML_ONLY = False
 
+# The demo/basic endpoints use the basic predictor in either ML mode - load it once up front
+if ML_AVAILABLE and not BASIC_ML_ONLY:
+    try:
+        from ml.basic_predictor import BasicSportsPredictor, BasicAnalyzer, generate_demo_data
+    except ImportError:
+        pass
+
+# Import psutil optionally for system metrics
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Import training queue management - print statements moved to initialization
 try:
     from training_queue import training_queue
@@ -104,7 +149,7 @@ except ImportError as e:
 # Import performance matrix and sport models - print statements moved to initialization
 try:
     from performance_matrix import performance_matrix
-    from sport_models import SportsModelFactory, Sport, ModelType
+    from sport_models import SportsModelFactory, Sport, ModelType, ModelConfig
     PERFORMANCE_MATRIX_AVAILABLE = True
     SPORT_MODELS_AVAILABLE = True
     # Print statement moved to app initialization function
@@ -128,9 +173,20 @@ try:
 except ImportError as e:
     DATA_PIPELINE_AVAILABLE = False
 
+# Import professional data pipeline - aliased where app.py endpoints reuse the names
+try:
+    from professional_data_pipeline import (
+        pipeline_manager,
+        submit_data_job as submit_pipeline_job,
+        toggle_data_source as toggle_pipeline_source
+    )
+    PROFESSIONAL_PIPELINE_AVAILABLE = True
+except ImportError as e:
+    PROFESSIONAL_PIPELINE_AVAILABLE = False
+
 # Import and initialize betting service - print statements moved to initialization
 try:
-    from sportsbook_api import BettingExecutionService
+    from sportsbook_api import BettingExecutionService, BetRequest, BetType
     # Initialize with live betting disabled for safety
     betting_service = BettingExecutionService(enabled=False)
     BETTING_SERVICE_AVAILABLE = True
@@ -139,6 +195,40 @@ except ImportError as e:
     BETTING_SERVICE_AVAILABLE = False
     betting_service = None
 
+# orjson is optional - falls back to Flask's stdlib json provider when missing
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson for request parsing and jsonify"""
+        
+        # Datetimes are passed through to DefaultJSONProvider.default so output matches stdlib Flask
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        
+        def dumps(self, obj, **kwargs):
+            # Flask always passes separators (orjson output is already compact) and indent for pretty printing
+            option = self.option
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            if kwargs.get('sort_keys'):
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+# Flask-SocketIO is optional - training progress falls back to HTTP polling without it
+try:
+    from flask_socketio import SocketIO, join_room
+    SOCKETIO_AVAILABLE = True
+except ImportError:
+    SOCKETIO_AVAILABLE = False
+
 # Global flag to prevent duplicate initialization
 _app_initialized = False
 
@@ -157,7 +247,7 @@ def initialize_app():
         print(f"[WARNING] Running in MOCK MODE - no real database connections!")
         
     if ML_AVAILABLE:
-        if hasattr(globals(), 'BASIC_ML_ONLY') and BASIC_ML_ONLY:
+        if BASIC_ML_ONLY:
             print("Basic ML components loaded as fallback")
         else:
             print("Advanced ML components loaded successfully")
@@ -190,7 +280,7 @@ def initialize_app():
             )
             logger.info("Real sports API service initialized successfully")
         except Exception as e:
-            logger.warning(f"Failed to initialize real sports API service: {e}")
+            logger.warning("Failed to initialize real sports API service: %s", e)
             real_sports_service = None
     else:
         real_sports_service = None
@@ -200,7 +290,7 @@ def initialize_app():
     # Validate configuration
     config_warnings = validate_config(config)
     for warning in config_warnings:
-        logger.warning(f"Configuration warning: {warning}")
+        logger.warning("Configuration warning: %s", warning)
 
     # --- Firebase Initialization ---
     # Load the path to the service account key from an environment variable
@@ -218,12 +308,12 @@ def initialize_app():
             cred_path = config.database.service_account_path
             if not cred_path or not os.path.exists(cred_path):
                 print("[ERROR] Demo mode disabled but no valid Firebase credentials found")
-                logger.error(f"[CONFIG] Demo mode disabled but credentials missing or invalid: {cred_path}")
+                logger.error("[CONFIG] Demo mode disabled but credentials missing or invalid: %s", cred_path)
                 raise ValueError("Cannot disable demo mode without valid Firebase credentials")
             
             if 'demo' in cred_path:
                 print("[ERROR] Demo mode disabled but using demo credentials")
-                logger.error(f"[CONFIG] Demo mode disabled but demo credentials detected: {cred_path}")
+                logger.error("[CONFIG] Demo mode disabled but demo credentials detected: %s", cred_path)
                 raise ValueError("Cannot disable demo mode while using demo credentials")
             
             # Force production mode
@@ -257,11 +347,11 @@ def initialize_app():
     except Exception as e:
         if config.disable_demo_mode:
             print(f"[ERROR] Demo mode disabled but initialization failed: {e}")
-            logger.error(f"[CONFIG] Demo mode disabled but Firebase initialization failed: {e}")
+            logger.error("[CONFIG] Demo mode disabled but Firebase initialization failed: %s", e)
             raise
         else:
             print("[ERROR] Firebase initialization failed - falling back to DEMO MODE")
-            logger.error(f"[DEMO MODE] Firebase initialization failed, running with mock data: {e}")
+            logger.error("[DEMO MODE] Firebase initialization failed, running with mock data: %s", e)
             demo_mode = True
             db = None
 
@@ -310,6 +400,12 @@ app_id = None
 firebase_config = None
 external_api_key = None
 
+# Page templates compiled at startup outside development
+PAGE_TEMPLATES = (
+    'index.html', 'demo.html', 'terms.html', 'privacy.html',
+    'ml_dashboard.html', 'scores.html', 'troubleshoot.html'
+)
+
 def create_app():
     """Create the Flask application"""
     # Initialize the app components first
@@ -318,6 +414,18 @@ def create_app():
     # Create Flask app
     app = Flask(__name__)
     app.secret_key = config.secret_key
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
+    mount_metrics_endpoint(app)
+
+    # Templates only change on deploy outside development: skip per-render mtime checks
+    # and compile the pages once up front
+    if not config.debug:
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        # With no directory Jinja uses a per-user 0700 cache dir and refuses one owned by anyone else
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        for template_name in PAGE_TEMPLATES:
+            app.jinja_env.get_template(template_name)
 
     # Initialize security manager
     app.security_manager = SecurityManager(config.secret_key)
@@ -327,6 +435,128 @@ def create_app():
 # Create the Flask app
 app = create_app()
 
+# Seed performance demo data off the request path; endpoints still call ensure_demo_data(),
+# which waits on the same lock if a request arrives before the warmup finishes
+if PERFORMANCE_MATRIX_AVAILABLE and config.ml.warm_demo_data:
+    threading.Thread(target=performance_matrix.ensure_demo_data, name='performance-demo-warmup', daemon=True).start()
+
+# WebSocket channel for pushed training progress (clients emit 'subscribe' with a job_id).
+# With several gunicorn workers, REDIS_URL relays emits to clients connected to any worker
+socketio = SocketIO(app, message_queue=os.getenv('REDIS_URL')) if SOCKETIO_AVAILABLE else None
+
+if socketio:
+    @socketio.on('subscribe')
+    def subscribe_training_job(data):
+        """Join the room that receives progress events for a training job"""
+        job_id = (data or {}).get('job_id')
+        if job_id:
+            join_room(job_id)
+
+def emit_training_progress(job_id, event):
+    """Push a training progress event to clients subscribed to the job"""
+    socketio.emit(f'train:{job_id}', event, to=job_id)
+
+def _iso_datetime_default(obj):
+    """Stdlib JSON fallback that writes datetimes as ISO 8601 instead of HTTP dates"""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    return app.json.default(obj)
+
+def encode_json(payload, iso_datetimes=False):
+    """Encode a payload to JSON bytes, straight from orjson when available"""
+    if not ORJSON_AVAILABLE:
+        with JSON_ENCODE_LATENCY.labels(encoder='stdlib').time():
+            if iso_datetimes:
+                return json.dumps(payload, default=_iso_datetime_default).encode()
+            return app.json.dumps(payload).encode()
+    option = ORJSONProvider.option
+    if iso_datetimes:
+        # Let orjson write datetimes natively (ISO 8601) rather than passing them through to Flask
+        option &= ~orjson.OPT_PASSTHROUGH_DATETIME
+    with JSON_ENCODE_LATENCY.labels(encoder='orjson').time():
+        return orjson.dumps(payload, default=app.json.default, option=option)
+
+def ojsonify(payload, status=200, iso_datetimes=False):
+    """Build a JSON response without round-tripping the body through str"""
+    return app.response_class(encode_json(payload, iso_datetimes), status=status, mimetype='application/json')
+
+# Placeholder string values ("@@name@@") left open in prerendered JSON bodies
+_PRERENDER_PLACEHOLDER = re.compile(rb'"@@(\w+)@@"')
+
+def prerender_json(payload):
+    """Encode a static JSON payload once, splitting it around "@@name@@" placeholder values"""
+    return _PRERENDER_PLACEHOLDER.split(app.json.dumps(payload).encode())
+
+def prerendered_response(parts, status=200, **values):
+    """Build a JSON response from prerender_json() parts, filling placeholders from values"""
+    chunks = list(parts)
+    for i in range(1, len(chunks), 2):
+        chunks[i] = app.json.dumps(values[chunks[i].decode()]).encode()
+    return app.response_class(b''.join(chunks), status=status, mimetype='application/json')
+
+def precompress_json(payload):
+    """Encode a static JSON payload once, keeping plain and gzip-compressed bodies"""
+    body = encode_json(payload)
+    return body, gzip.compress(body)
+
+def precompressed_response(bodies, status=200):
+    """Serve a precompress_json() body pair, sending the gzip body when the client accepts it"""
+    body, gzipped = bodies
+    if 'gzip' in request.accept_encodings:
+        response = app.response_class(gzipped, status=status, mimetype='application/json')
+        response.content_encoding = 'gzip'
+    else:
+        response = app.response_class(body, status=status, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
+
+def gzip_stream(chunks, compresslevel=1):
+    """Gzip a stream of text chunks incrementally, yielding compressed bytes as they fill"""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # +16: gzip framing
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+def cacheable_response(response, max_age, public=True):
+    """Tag a JSON response with a body ETag and Cache-Control, answering 304 on a matching If-None-Match"""
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    response.cache_control.max_age = max_age
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    return response.make_conditional(request)
+
+# Mixed into revision ETags so counters restarting with the process never match a stale client copy
+REVISION_ETAG_SEED = uuid.uuid4().hex
+
+def revision_response(revision, build):
+    """Answer 304 for a matching If-None-Match without building the body, otherwise tag build()'s response"""
+    etag = hashlib.blake2b(f"{REVISION_ETAG_SEED}|{revision}".encode(), digest_size=8).hexdigest()
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def require_feature(available, name):
+    """Swap an endpoint for a constant 500 response when its optional component failed to import"""
+    def decorator(f):
+        if available:
+            return f
+        body = encode_json({'success': False, 'message': f'{name} not available'})
+        
+        @wraps(f)
+        def unavailable(*args, **kwargs):
+            return app.response_class(body, status=500, mimetype='application/json')
+        return unavailable
+    return decorator
+
 # Professional request tracking middleware
 @app.before_request
 def before_request():
@@ -334,16 +564,15 @@ def before_request():
     g.request_id = str(uuid.uuid4())
     g.start_time = time.time()
     
-    logger.info(f"Request started: {request.method} {request.path} [ID: {g.request_id}]")
+    logger.info("Request started: %s %s [ID: %s]", request.method, request.path, g.request_id)
 
 @app.after_request  
 def after_request(response):
     """Log request completion and performance metrics"""
     duration = time.time() - g.start_time
     
-    logger.info(f"Request completed: {request.method} {request.path} "
-               f"[ID: {g.request_id}] [Status: {response.status_code}] "
-               f"[Duration: {duration:.3f}s]")
+    logger.info("Request completed: %s %s [ID: %s] [Status: %s] [Duration: %.3fs]",
+                request.method, request.path, g.request_id, response.status_code, duration)
     
     # Add security headers
     response.headers['X-Content-Type-Options'] = 'nosniff'
@@ -388,6 +617,41 @@ def get_user_collections(user_id):
         'bets': db.collection(f'users/{user_id}/bets')
     }
 
+# --- Timestamp Helpers ---
+
+# Cached ISO timestamp shared by requests landing in the same ~10ms tick
+_NOW_ISO_RESOLUTION = 0.01
+_now_iso_cache = (float('-inf'), '')  # (monotonic tick, value) - swapped as one tuple so threads never see a torn pair
+
+def now_iso():
+    """Return the current local time as an ISO string, cached at ~10ms resolution"""
+    global _now_iso_cache
+    tick = time.monotonic()
+    cached_tick, value = _now_iso_cache
+    if tick - cached_tick > _NOW_ISO_RESOLUTION:
+        value = datetime.datetime.now().isoformat()
+        _now_iso_cache = (tick, value)
+    return value
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+    return datetime.datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+@lru_cache(maxsize=4096)
+def format_date(value):
+    """Format a date or datetime as YYYY-MM-DD, cached since the same dates recur across requests"""
+    return value.strftime('%Y-%m-%d')
+
+@lru_cache(maxsize=1)
+def _date_stamp(minute):
+    """Format the local date as YYYYMMDD; minute only keys the cache"""
+    return time.strftime('%Y%m%d')
+
+def today_stamp():
+    """Return today's local date as YYYYMMDD for filenames, recomputed at most once a minute"""
+    return _date_stamp(int(time.time()) // 60)
+
 # --- Sports Data Helper Functions ---
 
 def get_investor_sport(investor_data, default=None):
@@ -417,9 +681,9 @@ def get_investor_sport(investor_data, default=None):
     if not investor_sport:
         investor_sport = default
         if default:
-            logger.warning(f"No sport preference found in investor data, defaulting to {investor_sport}")
+            logger.warning("No sport preference found in investor data, defaulting to %s", investor_sport)
         else:
-            logger.debug(f"No sport preference found in investor data and no default specified")
+            logger.debug("No sport preference found in investor data and no default specified")
     
     return investor_sport
 
@@ -437,7 +701,7 @@ def get_sports_games_data(sport='NBA', max_games=10):
     try:
         # Try to use real sports API first
         if real_sports_service and config.api.sports_api_key and not config.disable_demo_mode:
-            logger.info(f"[DATA] Fetching real sports data for {sport}")
+            logger.info("[DATA] Fetching real sports data for %s", sport)
             real_games = real_sports_service.get_current_games(sport)
             
             if real_games and len(real_games) > 0:
@@ -450,16 +714,16 @@ def get_sports_games_data(sport='NBA', max_games=10):
                 
                 # Check if we're using real data or emergency fallback
                 data_source = "REAL API DATA" if real_games[0].get('real_data', False) else "EMERGENCY FALLBACK"
-                logger.info(f"[SUCCESS] Successfully fetched {len(limited_games)} {data_source} games for {sport}")
+                logger.info("[SUCCESS] Successfully fetched %s %s games for %s", len(limited_games), data_source, sport)
                 return limited_games
         
         # Fallback to demo data
-        logger.info(f"[FALLBACK] Using demo sports data for {sport} (no real API available)")
+        logger.info("[FALLBACK] Using demo sports data for %s (no real API available)", sport)
         return get_demo_games_data(sport, max_games)
         
     except Exception as e:
-        logger.error(f"[ERROR] Error fetching sports data: {e}")
-        logger.info(f"[FALLBACK] Falling back to demo data for {sport}")
+        logger.error("[ERROR] Error fetching sports data: %s", e)
+        logger.info("[FALLBACK] Falling back to demo data for %s", sport)
         return get_demo_games_data(sport, max_games)
 
 def get_demo_games_data(sport='NBA', max_games=10):
@@ -533,14 +797,14 @@ def get_demo_games_data(sport='NBA', max_games=10):
     return sport_games[:max_games]
 
 # --- API Endpoints ---
+
+# The OpenAPI spec is built from static endpoint definitions - encode it once
+API_DOCS_RESPONSE = precompress_json(Post9APIDocumentation.generate_openapi_spec())
+
 @app.route('/api/docs')
 def api_documentation():
     """API documentation endpoint"""
-    try:
-        openapi_spec = Post9APIDocumentation.generate_openapi_spec()
-        return jsonify(openapi_spec)
-    except Exception as e:
-        return create_error_response(e)
+    return precompressed_response(API_DOCS_RESPONSE)
 
 @app.route('/api/health')
 def health_check():
@@ -829,27 +1093,29 @@ def page_not_found(e):
 @app.errorhandler(500)
 def internal_server_error(e):
     """Handle 500 errors"""
-    app.logger.error(f'Server Error: {e}')
+    app.logger.error('Server Error: %s', e)
     return jsonify({'error': 'Internal server error', 'success': False}), 500
 
 @app.errorhandler(Exception)
 def handle_exception(e):
     """Handle uncaught exceptions"""
-    app.logger.error(f'Unhandled Exception: {e}')
+    app.logger.error('Unhandled Exception: %s', e)
     return jsonify({'error': 'An unexpected error occurred', 'success': False}), 500
 
+def anonymous_auth_token():
+    """Sign a custom token for a new anonymous uid - user data is keyed by uid, so tokens are never shared"""
+    uid = f"anon-user-{uuid.uuid4().hex}"
+    auth_token = auth.create_custom_token(uid)
+    return auth_token.decode('utf-8') if auth_token else None
+
 @app.route('/')
 def home():
     """Renders the main dashboard page."""
     try:
-        auth_token = None
-        
         if not demo_mode and firebase_admin._apps:
-            # Create a custom token for anonymous sign-in
+            # Custom token for anonymous sign-in
             # For a production app, you'd want to handle user authentication more securely
-            uid = f"anon-user-{random.randint(1000, 9999)}"
-            auth_token = auth.create_custom_token(uid)
-            auth_token_str = auth_token.decode('utf-8') if auth_token else None
+            auth_token_str = anonymous_auth_token()
         else:
             # Demo mode - provide a dummy token
             auth_token_str = "demo_auth_token"
@@ -861,17 +1127,36 @@ def home():
                                demo_mode=demo_mode,
                                demo_warning="[MOCK] DEMO MODE - All data is MOCK/FAKE for testing purposes [MOCK]" if demo_mode else None)
     except Exception as e:
-        app.logger.error(f'Error in home route: {e}')
+        app.logger.error('Error in home route: %s', e)
         return render_template('index.html',
                                firebase_config=firebase_config,
                                auth_token="demo_auth_token",
                                demo_mode=True,
                                demo_warning="[MOCK] DEMO MODE - All data is MOCK/FAKE for testing purposes [MOCK]")
 
+# firebase_config is fixed once initialize_app() has run
+FIREBASE_CONFIG_RESPONSE = precompress_json(firebase_config)
+
 @app.route('/api/firebase-config', methods=['GET'])
 def get_firebase_config():
     """Provides the client-side Firebase config securely."""
-    return jsonify(firebase_config)
+    return precompressed_response(FIREBASE_CONFIG_RESPONSE)
+
+# Investor counters summed server-side by Firestore for /api/overall-stats
+OVERALL_STATS_FIELDS = ('total_profit', 'total_bets', 'total_wagered', 'total_wins', 'total_losses')
+
+def sum_investor_stats():
+    """Sum the overall-stats counters across all investors in one Firestore aggregation query"""
+    field, *rest = OVERALL_STATS_FIELDS
+    query = investors_collection.sum(field, alias=field)
+    for field in rest:
+        query = query.sum(field, alias=field)
+    
+    totals = dict.fromkeys(OVERALL_STATS_FIELDS, 0)
+    for results in query.get():
+        for result in results:
+            totals[result.alias] = result.value or 0
+    return totals
 
 @app.route('/api/overall-stats', methods=['GET'])
 def get_overall_stats():
@@ -879,20 +1164,12 @@ def get_overall_stats():
     if not db:
         return jsonify({'success': False, 'message': 'Database not initialized.'}), 500
     try:
-        investors_ref = investors_collection.stream()
-        total_profit = 0
-        total_bets = 0
-        total_wagered = 0
-        total_wins = 0
-        total_losses = 0
-
-        for investor_doc in investors_ref:
-            investor_data = investor_doc.to_dict()
-            total_profit += investor_data.get('total_profit', 0)
-            total_bets += investor_data.get('total_bets', 0)
-            total_wagered += investor_data.get('total_wagered', 0)
-            total_wins += investor_data.get('total_wins', 0)
-            total_losses += investor_data.get('total_losses', 0)
+        totals = sum_investor_stats()
+        total_profit = totals['total_profit']
+        total_bets = totals['total_bets']
+        total_wagered = totals['total_wagered']
+        total_wins = totals['total_wins']
+        total_losses = totals['total_losses']
         
         win_rate = (total_wins / total_bets) * 100 if total_bets > 0 else 0
         
@@ -954,7 +1231,7 @@ def add_investor():
                 detected_sport = model_metadata.sport
                 sport_auto_detected = True
                 sport_detection_source = 'model_metadata'
-                logger.info(f"Auto-detected sport '{detected_sport.value}' from model {model_id} during investor creation")
+                logger.info("Auto-detected sport '%s' from model %s during investor creation", detected_sport.value, model_id)
             else:
                 # Fallback: try to extract sport from model_id pattern
                 model_parts = model_id.lower().split('_')
@@ -972,7 +1249,7 @@ def add_investor():
                         detected_sport = sport_mapping[part]
                         sport_auto_detected = True
                         sport_detection_source = 'model_id_pattern'
-                        logger.info(f"Auto-detected sport '{detected_sport.value}' from model ID pattern during investor creation")
+                        logger.info("Auto-detected sport '%s' from model ID pattern during investor creation", detected_sport.value)
                         break
         
         # Set sport filter
@@ -1027,7 +1304,7 @@ def add_investor():
         
         investor_ref.set(firestore_data)
         
-        logger.info(f"Investor created successfully: {investor_id} by user {user_id}")
+        logger.info("Investor created successfully: %s by user %s", investor_id, user_id)
         
         return jsonify({
             'success': True, 
@@ -1042,9 +1319,84 @@ def add_investor():
     except ValueError as e:
         raise ValidationError(f"Invalid numeric value: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to add investor: {e}")
+        logger.error("Failed to add investor: %s", e)
         raise ValidationError(f'Failed to add investor: {e}')
 
+# Simulated bets are read with one get_all and written in parallel WriteBatches
+INVESTOR_SIMULATION_MAX = 500  # investors per batch simulation request
+INVESTOR_WRITE_BATCH_SIZE = 50
+INVESTOR_WRITE_RETRIES = 3
+INVESTOR_WRITE_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix='investor-write')
+
+def simulated_bet_updates(bet_receipt):
+    """Build the Firestore update recording a simulated bet on an investor"""
+    updates = {
+        'total_bets': firestore.Increment(1),
+        'current_balance': bet_receipt['new_balance'],
+        'total_wagered': firestore.Increment(bet_receipt['wager']),
+        'total_profit': firestore.Increment(bet_receipt['payout']),
+        'last_updated': datetime.datetime.now().isoformat(),
+        'bet_history': firestore.ArrayUnion([bet_receipt])
+    }
+
+    if bet_receipt['outcome'] == 'W':
+        updates['total_wins'] = firestore.Increment(1)
+    else:
+        updates['total_losses'] = firestore.Increment(1)
+    return updates
+
+def commit_investor_updates(writes):
+    """Commit (investor_ref, updates) pairs as one WriteBatch, retrying when Firestore aborts it"""
+    for attempt in range(INVESTOR_WRITE_RETRIES):
+        batch = db.batch()
+        for investor_ref, updates in writes:
+            batch.update(investor_ref, updates)
+        try:
+            with FIRESTORE_LATENCY.labels(op='batch_commit').time():
+                batch.commit()
+            return
+        except FirestoreAborted:
+            # An aborted batch applied nothing, so it is safe to resend
+            if attempt == INVESTOR_WRITE_RETRIES - 1:
+                raise
+
+def simulate_investor_bets(investor_ids, owner_id=None):
+    """Simulate one bet for each investor.
+    
+    Returns (receipts, failed_ids): receipts for committed investors keyed by id, and the ids whose
+    write chunk failed. Missing investors, and investors not created by owner_id when given, are skipped.
+    """
+    investor_refs = [investors_collection.document(investor_id) for investor_id in dict.fromkeys(investor_ids)]
+    
+    receipts = {}
+    writes = []
+    with FIRESTORE_LATENCY.labels(op='get_all').time():
+        investor_docs = list(db.get_all(investor_refs))
+    for investor_doc in investor_docs:
+        if not investor_doc.exists:
+            continue
+        investor = investor_doc.to_dict()
+        if owner_id is not None and investor.get('created_by') != owner_id:
+            continue
+        bet_receipt = simulate_single_bet(investor)
+        receipts[investor_doc.id] = bet_receipt
+        writes.append((investor_doc.reference, simulated_bet_updates(bet_receipt)))
+    
+    chunks = [writes[i:i + INVESTOR_WRITE_BATCH_SIZE] for i in range(0, len(writes), INVESTOR_WRITE_BATCH_SIZE)]
+    futures = [INVESTOR_WRITE_POOL.submit(commit_investor_updates, chunk) for chunk in chunks]
+    
+    failed_ids = []
+    for chunk, future in zip(chunks, futures):
+        error = future.exception()
+        if error is None:
+            continue
+        # Each chunk is its own WriteBatch, so a failed chunk applied nothing
+        logger.error("Failed to commit simulated bets for %d investors: %s", len(chunk), error)
+        for investor_ref, _ in chunk:
+            failed_ids.append(investor_ref.id)
+            del receipts[investor_ref.id]
+    return receipts, failed_ids
+
 @app.route('/api/investors/simulate', methods=['POST'])
 def simulate_investor_bet():
     """Simulates a single bet for a investor and updates its record."""
@@ -1056,43 +1408,60 @@ def simulate_investor_bet():
         if not investor_id:
             return jsonify({'success': False, 'message': 'Investor ID is required.'}), 400
 
-        investor_ref = investors_collection.document(investor_id)
-        investor_doc = investor_ref.get()
-
-        if not investor_doc.exists:
+        receipts, failed_ids = simulate_investor_bets([investor_id])
+        if failed_ids:
+            return jsonify({'success': False, 'message': 'Failed to simulate bet.'}), 500
+        if investor_id not in receipts:
             return jsonify({'success': False, 'message': 'Investor not found.'}), 404
-
-        investor_data = investor_doc.to_dict()
-        bet_receipt = simulate_single_bet(investor_data)
-        
-        updates = {
-            'total_bets': firestore.Increment(1),
-            'current_balance': bet_receipt['new_balance'],
-            'total_wagered': firestore.Increment(bet_receipt['wager']),
-            'total_profit': firestore.Increment(bet_receipt['payout']),
-            'last_updated': datetime.datetime.now().isoformat()
-        }
-
-        if bet_receipt['outcome'] == 'W':
-            updates['total_wins'] = firestore.Increment(1)
-        else:
-            updates['total_losses'] = firestore.Increment(1)
-        
-        investor_ref.update({
-            **updates,
-            'bet_history': firestore.ArrayUnion([bet_receipt])
-        })
         
         return jsonify({
             'success': True,
             'message': 'Bet simulated successfully.',
-            'receipt': bet_receipt
+            'receipt': receipts[investor_id]
         })
 
     except Exception as e:
         print(f"Failed to simulate bet: {e}")
         return jsonify({'success': False, 'message': f'Failed to simulate bet: {e}'}), 500
 
+@app.route('/api/investors/simulate/batch', methods=['POST'])
+@handle_errors
+@require_authentication
+@rate_limit(requests_per_hour=100)
+def simulate_investor_bets_batch():
+    """Simulates one bet for each of several of the caller's investors with batched reads and writes."""
+    if not db:
+        return jsonify({'success': False, 'message': 'Database not initialized.'}), 500
+    
+    data = request.get_json(silent=True) or {}
+    investor_ids = data.get('investor_ids')
+    if not isinstance(investor_ids, list) or not investor_ids:
+        raise ValidationError("investor_ids must be a non-empty list", field='investor_ids')
+    if len(investor_ids) > INVESTOR_SIMULATION_MAX:
+        raise ValidationError(f"At most {INVESTOR_SIMULATION_MAX} investors per request", field='investor_ids')
+    if not all(isinstance(investor_id, str) and investor_id and '/' not in investor_id for investor_id in investor_ids):
+        raise ValidationError("investor_ids must be non-empty strings without '/'", field='investor_ids')
+    
+    user_id = g.current_user.get('user_id')
+    try:
+        receipts, failed_ids = simulate_investor_bets(investor_ids, owner_id=user_id)
+    except Exception as e:
+        logger.error("Failed to simulate bets: %s", e)
+        return jsonify({'success': False, 'message': 'Failed to simulate bets.'}), 500
+    
+    # Committed receipts are returned even when another chunk failed, so callers know what was applied
+    failed = set(failed_ids)
+    return jsonify({
+        'success': not failed_ids,
+        'message': f'{len(receipts)} bets simulated successfully.',
+        'receipts': receipts,
+        'failed': failed_ids,
+        'not_found': [
+            investor_id for investor_id in dict.fromkeys(investor_ids)
+            if investor_id not in receipts and investor_id not in failed
+        ]
+    }), 500 if failed_ids else 200
+
 @app.route('/api/investors/<investor_id>', methods=['PUT'])
 @handle_errors
 @require_authentication
@@ -1106,7 +1475,7 @@ def update_investor(investor_id):
         
         # Handle demo mode - return success without actual database operation
         if not db or not FIREBASE_AVAILABLE:
-            logger.info(f"Demo mode: Simulating update for investor {investor_id}")
+            logger.info("Demo mode: Simulating update for investor %s", investor_id)
             return jsonify({
                 'success': True,
                 'message': 'Investor updated successfully (Demo Mode).',
@@ -1149,6 +1518,7 @@ def update_investor(investor_id):
 
         # Update the investor
         investor_ref.update(update_data)
+        invalidate_investor_doc(user_id, investor_id)
         
         return jsonify({
             'success': True,
@@ -1157,7 +1527,7 @@ def update_investor(investor_id):
         })
 
     except Exception as e:
-        logger.error(f"Failed to update investor: {e}")
+        logger.error("Failed to update investor: %s", e)
         return jsonify({'success': False, 'message': 'Failed to update investor'}), 500
 
 @app.route('/api/strategies', methods=['POST'])
@@ -1407,7 +1777,7 @@ def get_strategy_picks(strategy_id):
         investor_ref = db.collection(f'users/{user_id}/investors').document(investor_id)
         investor_doc = investor_ref.get()
         if not investor_doc.exists:
-            logger.warning(f"Investor {investor_id} not found for user {user_id}. Falling back to demo picks.")
+            logger.warning("Investor %s not found for user %s. Falling back to demo picks.", investor_id, user_id)
             # Instead of hard error, provide demo picks
             demo_picks = generate_demo_strategy_picks(strategy_id)
             return jsonify({
@@ -1424,7 +1794,7 @@ def get_strategy_picks(strategy_id):
         # Check if investor has a strategy assigned (protection for investors without strategies)
         assigned_strategy = investor_data.get('assigned_strategy_id')
         if not assigned_strategy:
-            logger.warning(f"Investor {investor_id} has no strategy assigned. Providing demo picks.")
+            logger.warning("Investor %s has no strategy assigned. Providing demo picks.", investor_id)
             demo_picks = generate_demo_strategy_picks(strategy_id or 'default')
             return jsonify({
                 'success': True,
@@ -1444,7 +1814,7 @@ def get_strategy_picks(strategy_id):
         strategy_ref = db.collection(f'users/{user_id}/strategies').document(effective_strategy_id)
         strategy_doc = strategy_ref.get()
         if not strategy_doc.exists:
-            logger.warning(f"Strategy {effective_strategy_id} not found for user {user_id}. Falling back to demo picks.")
+            logger.warning("Strategy %s not found for user %s. Falling back to demo picks.", effective_strategy_id, user_id)
             # Instead of returning 404, provide demo picks as fallback
             demo_picks = generate_demo_strategy_picks(effective_strategy_id)
             return jsonify({
@@ -1473,7 +1843,7 @@ def get_strategy_picks(strategy_id):
             picks = generate_real_strategy_picks(strategy_data, investor_data, max_bets - bets_this_week)
             data_source = 'real'
         except Exception as real_error:
-            logger.warning(f"Failed to generate real strategy picks, falling back to demo: {real_error}")
+            logger.warning("Failed to generate real strategy picks, falling back to demo: %s", real_error)
             picks = generate_strategy_picks(strategy_data, investor_data, max_bets - bets_this_week)
             data_source = 'demo_fallback'
         
@@ -1550,7 +1920,7 @@ def generate_expected_value_picks(strategy_data, investor_data, max_picks):
     # Default to NBA if no sport specified
     if not investor_sport:
         investor_sport = 'NBA'
-        logger.info(f"No sport specified for expected value picks, defaulting to {investor_sport}")
+        logger.info("No sport specified for expected value picks, defaulting to %s", investor_sport)
     
     all_games = get_sports_games_data(investor_sport, max_picks * 2)  # Get more than needed for filtering
     
@@ -1978,7 +2348,7 @@ def get_available_investments():
         
         # Check if demo mode is disabled (production mode)
         if config.disable_demo_mode:
-            logger.error(f"Production mode: Sports API failed, no fallback available: {e}")
+            logger.error("Production mode: Sports API failed, no fallback available: %s", e)
             return jsonify({
                 'success': False,
                 'message': f'Sports API unavailable in production mode: {e.response.text if hasattr(e, "response") else str(e)}',
@@ -1988,7 +2358,7 @@ def get_available_investments():
             }), 503
         else:
             # Demo mode - fallback to demo data
-            logger.warning(f"Demo mode: Sports API failed, falling back to demo data: {e}")
+            logger.warning("Demo mode: Sports API failed, falling back to demo data: %s", e)
             return jsonify({
                 'success': True,
                 'investments': generate_demo_investments(),
@@ -2003,7 +2373,7 @@ def get_available_investments():
         
         # Check if demo mode is disabled (production mode)
         if config.disable_demo_mode:
-            logger.error(f"Production mode: Network error accessing sports API, no fallback available: {e}")
+            logger.error("Production mode: Network error accessing sports API, no fallback available: %s", e)
             return jsonify({
                 'success': False,
                 'message': f'Network error in production mode: {str(e)}',
@@ -2013,7 +2383,7 @@ def get_available_investments():
             }), 503
         else:
             # Demo mode - fallback to demo data
-            logger.warning(f"Demo mode: Network error accessing sports API, falling back to demo data: {e}")
+            logger.warning("Demo mode: Network error accessing sports API, falling back to demo data: %s", e)
             return jsonify({
                 'success': True,
                 'investments': generate_demo_investments(),
@@ -2025,11 +2395,11 @@ def get_available_investments():
             }), 200
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        logger.error(f"Unexpected error in investments API: {e}")
+        logger.error("Unexpected error in investments API: %s", e)
         
         # Check if demo mode is disabled (production mode)
         if config.disable_demo_mode:
-            logger.error(f"Production mode: Unexpected error, no fallback available: {e}")
+            logger.error("Production mode: Unexpected error, no fallback available: %s", e)
             return jsonify({
                 'success': False,
                 'message': f'Service error in production mode: {str(e)}',
@@ -2075,7 +2445,6 @@ def generate_demo_investments():
     """
     print("[DEMO] GENERATING FAKE INVESTMENT DATA for demo purposes")
     import random
-    from datetime import datetime, timedelta
     
     demo_games = [
         {'sport': 'NBA', 'team1': 'Lakers', 'team2': 'Warriors'},
@@ -2091,8 +2460,9 @@ def generate_demo_investments():
     sportsbooks = ['DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet']
     
     investments = []
+    now = datetime.datetime.now()
     for i, game in enumerate(demo_games):
-        commence_time = datetime.now() + timedelta(hours=random.randint(1, 72))
+        commence_time = now + timedelta(hours=random.randint(1, 72))
         
         # Generate multiple sportsbooks for each game
         bookmakers = []
@@ -2291,7 +2661,7 @@ def get_investor_recommendations():
         
         if can_use_real_data:
             print(f"🟢 GENERATING REAL INVESTOR RECOMMENDATIONS for user {user_id}")
-            logger.info(f"Attempting to generate real investor recommendations for user {user_id}")
+            logger.info("Attempting to generate real investor recommendations for user %s", user_id)
             try:
                 recommendations = generate_real_investor_recommendations(user_id)
                 return jsonify({
@@ -2302,7 +2672,7 @@ def get_investor_recommendations():
                 }), 200
             except Exception as real_error:
                 print(f"🟡 REAL RECOMMENDATIONS FAILED, falling back to demo: {real_error}")
-                logger.warning(f"Failed to generate real recommendations, falling back to demo: {real_error}")
+                logger.warning("Failed to generate real recommendations, falling back to demo: %s", real_error)
                 # Fallback to demo recommendations if real data fails
                 recommendations = generate_demo_investor_recommendations()
                 return jsonify({
@@ -2440,7 +2810,7 @@ def generate_real_investor_recommendations(user_id):
     Uses real investors, strategies, and current sports games
     """
     print("[BOT_RECS] GENERATING REAL INVESTOR RECOMMENDATIONS using live data")
-    logger.info(f"Generating real investor recommendations for user {user_id}")
+    logger.info("Generating real investor recommendations for user %s", user_id)
     
     recommendations = {}
     
@@ -2457,9 +2827,9 @@ def generate_real_investor_recommendations(user_id):
                     investor_data['investor_id'] = investor_doc.id
                     user_investors.append(investor_data)
                     
-                logger.info(f"Found {len(user_investors)} active investors for user {user_id}")
+                logger.info("Found %s active investors for user %s", len(user_investors), user_id)
             except Exception as e:
-                logger.error(f"Failed to fetch user investors from Firestore: {e}")
+                logger.error("Failed to fetch user investors from Firestore: %s", e)
                 
         # Also try to get from data service if available
         try:
@@ -2467,9 +2837,9 @@ def generate_real_investor_recommendations(user_id):
             service_investors = data_service.list_investors({'created_by': user_id, 'active_status': 'RUNNING'})
             for investor in service_investors:
                 user_investors.append(investor.to_dict())
-            logger.info(f"Found additional {len(service_investors)} investors from data service")
+            logger.info("Found additional %s investors from data service", len(service_investors))
         except Exception as e:
-            logger.debug(f"Data service not available or failed: {e}")
+            logger.debug("Data service not available or failed: %s", e)
         
         # If no real investors found, don't create sample investors with multiple sports
         # This prevents fetching data for sports the user doesn't actually have
@@ -2497,9 +2867,9 @@ def generate_real_investor_recommendations(user_id):
                 for game in games:
                     game['sport'] = sport
                     all_games.append(game)
-                logger.info(f"Retrieved {len(games)} games for {sport}")
+                logger.info("Retrieved %s games for %s", len(games), sport)
             except Exception as e:
-                logger.error(f"Failed to get games for {sport}: {e}")
+                logger.error("Failed to get games for %s: %s", sport, e)
         
         if not all_games:
             logger.warning("No games available, cannot generate recommendations")
@@ -2517,16 +2887,16 @@ def generate_real_investor_recommendations(user_id):
                     if recommendation:
                         game_recommendations.append(recommendation)
                 except Exception as e:
-                    logger.error(f"Failed to generate recommendation for investor {investor.get('investor_id', 'unknown')}: {e}")
+                    logger.error("Failed to generate recommendation for investor %s: %s", investor.get('investor_id', 'unknown'), e)
             
             if game_recommendations:
                 recommendations[game_id] = game_recommendations
         
-        logger.info(f"Generated recommendations for {len(recommendations)} games")
+        logger.info("Generated recommendations for %s games", len(recommendations))
         return recommendations
         
     except Exception as e:
-        logger.error(f"Failed to generate real investor recommendations: {e}")
+        logger.error("Failed to generate real investor recommendations: %s", e)
         raise e
 
 def _generate_investor_recommendation_for_game(investor, game):
@@ -2640,7 +3010,7 @@ def _generate_investor_recommendation_for_game(investor, game):
         return recommendation
         
     except Exception as e:
-        logger.error(f"Error generating investor recommendation: {e}")
+        logger.error("Error generating investor recommendation: %s", e)
         return None
 
 def generate_demo_strategy_picks(strategy_id):
@@ -2691,7 +3061,7 @@ def generate_real_strategy_picks(strategy_data, investor_data, max_picks):
     [REAL] REAL STRATEGY PICKS GENERATOR [REAL]
     Generate real strategy picks using actual sports data and investor configuration
     """
-    logger.info(f"Generating real strategy picks for strategy {strategy_data.get('name', 'unknown')}")
+    logger.info("Generating real strategy picks for strategy %s", strategy_data.get('name', 'unknown'))
     
     try:
         # Get investor's sport preference using helper function
@@ -2700,13 +3070,13 @@ def generate_real_strategy_picks(strategy_data, investor_data, max_picks):
         # Default to NBA if no sport specified
         if not investor_sport:
             investor_sport = 'NBA'
-            logger.info(f"No sport specified for real strategy picks, defaulting to {investor_sport}")
+            logger.info("No sport specified for real strategy picks, defaulting to %s", investor_sport)
         
         # Get real games data for the investor's sport
         real_games = get_sports_games_data(investor_sport, max_picks * 2)  # Get more than needed for filtering
         
         if not real_games:
-            logger.warning(f"No real games available for {investor_sport}, falling back to demo")
+            logger.warning("No real games available for %s, falling back to demo", investor_sport)
             raise Exception(f"No real games available for {investor_sport}")
         
         # Generate picks based on strategy type
@@ -2726,11 +3096,11 @@ def generate_real_strategy_picks(strategy_data, investor_data, max_picks):
             pick['real_data'] = True
             pick['data_source'] = 'live_sports_api'
         
-        logger.info(f"Generated {len(picks)} real strategy picks")
+        logger.info("Generated %s real strategy picks", len(picks))
         return picks
         
     except Exception as e:
-        logger.error(f"Failed to generate real strategy picks: {e}")
+        logger.error("Failed to generate real strategy picks: %s", e)
         raise e
 
 def generate_real_expected_value_picks(strategy_data, investor_data, games, max_picks):
@@ -3044,7 +3414,7 @@ def get_models_for_investor():
                 real_models = model_registry.list_models(status=ModelStatus.TRAINED)
                 if real_models:
                     print(f"🟢 FOUND {len(real_models)} REAL TRAINED MODELS for investor dropdown")
-                    logger.info(f"Found {len(real_models)} real trained models for investor dropdown")
+                    logger.info("Found %s real trained models for investor dropdown", len(real_models))
                     
                     models_for_dropdown = []
                     for model in real_models:
@@ -3068,7 +3438,7 @@ def get_models_for_investor():
                     })
         except Exception as e:
             print(f"🟡 Failed to get real models from registry: {e}")
-            logger.warning(f"Failed to get real models from registry: {e}")
+            logger.warning("Failed to get real models from registry: %s", e)
         
         # Check if demo mode is disabled (production mode)
         if config.disable_demo_mode:
@@ -3129,7 +3499,7 @@ def get_models_for_investor():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get models for investor dropdown: {e}")
+        logger.error("Failed to get models for investor dropdown: %s", e)
         return jsonify({'success': False, 'message': f'Failed to get models: {e}'}), 500
 
 def list_models():
@@ -3315,7 +3685,7 @@ def get_performance_analytics():
             'success': True,
             'analytics': analytics_data,
             'period': time_period,
-            'generated_at': datetime.datetime.now().isoformat()
+            'generated_at': now_iso()
         }), 200
         
     except Exception as e:
@@ -3334,7 +3704,7 @@ def list_ml_models():
         sport = request.args.get('sport')
         status = request.args.get('status')
         
-        if globals().get('BASIC_ML_ONLY', False):
+        if BASIC_ML_ONLY:
             # Return basic model info for demo
             return jsonify({
                 'success': True,
@@ -3358,6 +3728,34 @@ def list_ml_models():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Default feature values for demo predictions, per sport
+DEMO_GAME_TEMPLATES = {
+    'NBA': {
+        'home_team_ppg': 110,
+        'away_team_ppg': 108,
+        'home_win_pct': 0.6,
+        'away_win_pct': 0.55,
+        'home_pace': 100,
+        'away_pace': 98
+    },
+    'NFL': {
+        'home_team_off_yards': 350,
+        'away_team_off_yards': 340,
+        'home_win_pct': 0.6,
+        'away_win_pct': 0.55
+    }
+}
+DEMO_GAME_TEMPLATE_DEFAULT = {
+    'home_win_pct': 0.6,
+    'away_win_pct': 0.55,
+    'home_score_avg': 105,
+    'away_score_avg': 100
+}
+
+# Trained demo predictors keyed by sport: (predictor, training_results)
+_demo_predictors = {}
+_demo_predictors_lock = threading.Lock()
+
 @app.route('/api/ml/demo/predict', methods=['POST'])
 def demo_prediction():
     """Make a demo prediction using any available trained model"""
@@ -3366,42 +3764,27 @@ def demo_prediction():
     
     try:
         data = request.json or {}
-        sport = data.get('sport', 'NBA')
+        sport = str(data.get('sport', 'NBA')).upper()
+        
+        # Only supported sports reach the predictor cache, so it stays bounded
+        if sport not in SUPPORTED_SPORTS:
+            return jsonify({'success': False, 'error': f"Unsupported sport: {sport}"}), 400
         
         # Check if we have basic ML only
-        if globals().get('BASIC_ML_ONLY', False):
+        if BASIC_ML_ONLY:
             # Use basic predictor
-            from ml.basic_predictor import BasicSportsPredictor, generate_demo_data
-            predictor = BasicSportsPredictor(sport)
-            
-            # Generate and train on demo data
-            demo_training_data = generate_demo_data(sport, 1000)
-            training_results = predictor.train_model(demo_training_data)
+            # Demo training data is seeded, so train once per sport and reuse the predictor
+            with _demo_predictors_lock:
+                cached = _demo_predictors.get(sport)
+                if cached is None:
+                    predictor = BasicSportsPredictor(sport)
+                    training_results = predictor.train_model(generate_demo_data(sport, 1000))
+                    cached = _demo_predictors[sport] = (predictor, training_results)
+            predictor, training_results = cached
             
-            # Generate sample game data
-            if sport == 'NBA':
-                game_data = {
-                    'home_team_ppg': data.get('home_team_ppg', 110),
-                    'away_team_ppg': data.get('away_team_ppg', 108),
-                    'home_win_pct': data.get('home_win_pct', 0.6),
-                    'away_win_pct': data.get('away_win_pct', 0.55),
-                    'home_pace': data.get('home_pace', 100),
-                    'away_pace': data.get('away_pace', 98)
-                }
-            elif sport == 'NFL':
-                game_data = {
-                    'home_team_off_yards': data.get('home_team_off_yards', 350),
-                    'away_team_off_yards': data.get('away_team_off_yards', 340),
-                    'home_win_pct': data.get('home_win_pct', 0.6),
-                    'away_win_pct': data.get('away_win_pct', 0.55)
-                }
-            else:
-                game_data = {
-                    'home_win_pct': data.get('home_win_pct', 0.6),
-                    'away_win_pct': data.get('away_win_pct', 0.55),
-                    'home_score_avg': data.get('home_score_avg', 105),
-                    'away_score_avg': data.get('away_score_avg', 100)
-                }
+            # Generate sample game data from the sport template, overridden by request values
+            template = DEMO_GAME_TEMPLATES.get(sport, DEMO_GAME_TEMPLATE_DEFAULT)
+            game_data = {**template, **{k: data[k] for k in template.keys() & data.keys()}}
             
             # Make prediction
             prediction = predictor.predict_game(game_data)
@@ -3437,8 +3820,7 @@ def calculate_kelly_basic():
         if win_probability is None or odds is None:
             return jsonify({'error': 'win_probability and odds are required'}), 400
         
-        if globals().get('BASIC_ML_ONLY', False):
-            from ml.basic_predictor import BasicAnalyzer
+        if BASIC_ML_ONLY:
             kelly_result = BasicAnalyzer.calculate_kelly_criterion(win_probability, odds, bankroll)
         else:
             # Use advanced analyzer when available
@@ -3453,8 +3835,8 @@ def calculate_kelly_basic():
 
 @app.route('/api/ml/basic/train', methods=['POST'])
 @handle_errors
-@require_authentication  
-@rate_limit(requests_per_hour=20)  # Lower limit for resource-intensive operations
+@rate_limit(requests_per_hour=20)  # Lower limit for resource-intensive operations; checked before auth and body parsing
+@require_authentication
 @sanitize_request_data(required_fields=['sport'], optional_fields=['num_samples', 'model_type'])
 def train_basic_model():
     """Train a basic statistical model with professional validation"""
@@ -3473,8 +3855,6 @@ def train_basic_model():
         if num_samples < 100 or num_samples > config.ml.max_training_samples:
             raise ValidationError(f"Number of samples must be between 100 and {config.ml.max_training_samples}", field='num_samples')
         
-        from ml.basic_predictor import BasicSportsPredictor, generate_demo_data
-        
         # Create basic predictor
         predictor = BasicSportsPredictor(sport)
         
@@ -3490,8 +3870,8 @@ def train_basic_model():
         importance = predictor.get_feature_importance()
         
         # Log training completion
-        logger.info(f"Model training completed for {sport} with {num_samples} samples "
-                   f"in {training_duration:.2f}s by user {g.current_user.get('user_id')}")
+        logger.info("Model training completed for %s with %s samples in %.2fs by user %s",
+                    sport, num_samples, training_duration, g.current_user.get('user_id'))
         
         return jsonify({
             'success': True,
@@ -3511,7 +3891,7 @@ def train_basic_model():
     except ValueError as e:
         raise ValidationError(f"Invalid numeric value: {str(e)}")
     except Exception as e:
-        logger.error(f"Model training failed: {e}")
+        logger.error("Model training failed: %s", e)
         raise ValidationError(f'Model training failed: {e}')
 
 # --- PROFESSIONAL MODEL REGISTRY ENDPOINTS ---
@@ -3568,7 +3948,7 @@ def get_models():
                         'production_mode': True
                     }), 503
             except Exception as e:
-                logger.error(f"Failed to get models in production mode: {e}")
+                logger.error("Failed to get models in production mode: %s", e)
                 return jsonify({
                     'success': False,
                     'message': f'Failed to get models: {e}',
@@ -3614,7 +3994,7 @@ def get_models():
             })
         
     except Exception as e:
-        logger.error(f"Failed to get models: {e}")
+        logger.error("Failed to get models: %s", e)
         return create_error_response(e)
 
 @app.route('/api/models/registry', methods=['GET'])
@@ -3673,7 +4053,7 @@ def list_registered_models():
         })
         
     except Exception as e:
-        logger.error(f"Failed to list registered models: {e}")
+        logger.error("Failed to list registered models: %s", e)
         raise ValidationError(f'Failed to list models: {e}')
 
 @app.route('/api/models/register', methods=['POST'])
@@ -3705,7 +4085,7 @@ def register_new_model():
             hyperparameters=data.get('hyperparameters', {})
         )
         
-        logger.info(f"Model registered: {model_id} by user {user_id}")
+        logger.info("Model registered: %s by user %s", model_id, user_id)
         
         return jsonify({
             'success': True,
@@ -3715,7 +4095,7 @@ def register_new_model():
         }), 201
         
     except Exception as e:
-        logger.error(f"Model registration failed: {e}")
+        logger.error("Model registration failed: %s", e)
         raise ValidationError(f'Model registration failed: {e}')
 
 @app.route('/api/models/<model_id>/status', methods=['PUT'])
@@ -3739,7 +4119,7 @@ def update_model_status(model_id):
         # Update model status
         model_registry.update_model_status(model_id, status, performance_metrics)
         
-        logger.info(f"Model {model_id} status updated to {status.value}")
+        logger.info("Model %s status updated to %s", model_id, status.value)
         
         return jsonify({
             'success': True,
@@ -3750,7 +4130,7 @@ def update_model_status(model_id):
     except ValueError as e:
         raise ResourceNotFoundError('Model', model_id)
     except Exception as e:
-        logger.error(f"Failed to update model status: {e}")
+        logger.error("Failed to update model status: %s", e)
         raise ValidationError(f'Failed to update model status: {e}')
 
 # --- DATA VALIDATION ENDPOINTS ---
@@ -3787,10 +4167,11 @@ def validate_data_quality():
         # Validate data quality
         quality_report = data_validator.validate_sports_data(raw_data, sport)
         
-        logger.info(f"Data validation completed for {sport}: {quality_report.overall_quality.value}")
+        logger.info("Data validation completed for %s: %s", sport, quality_report.overall_quality.value)
         
-        # Convert report to dict and handle numpy types
-        report_dict = {
+        # Scalar report fields are small; issues/recommendations grow with the input
+        # and are streamed record by record instead of buffered into one body
+        report_header = {
             'overall_quality': quality_report.overall_quality.value,
             'total_records': convert_numpy_types(quality_report.total_records),
             'valid_records': convert_numpy_types(quality_report.valid_records),
@@ -3798,23 +4179,49 @@ def validate_data_quality():
             'outlier_percentage': convert_numpy_types(quality_report.outlier_percentage),
             'duplicate_percentage': convert_numpy_types(quality_report.duplicate_percentage),
             'quality_score': convert_numpy_types(quality_report.quality_score),
-            'issues': quality_report.issues,
-            'recommendations': quality_report.recommendations,
             'timestamp': quality_report.timestamp
         }
         
-        return jsonify({
-            'success': True,
-            'quality_report': report_dict,
-            'validation_version': '2.0'
-        })
+        def generate():
+            yield '{"success":true,"validation_version":"2.0","quality_report":'
+            yield json.dumps(report_header)[:-1]
+            for field in ('issues', 'recommendations'):
+                yield f',"{field}":['
+                for i, item in enumerate(getattr(quality_report, field)):
+                    yield (',' if i else '') + json.dumps(convert_numpy_types(item))
+                yield ']'
+            yield '}}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Data validation failed: {e}")
+        logger.error("Data validation failed: %s", e)
         raise ValidationError(f'Data validation failed: {e}')
 
 # --- USER ENGAGEMENT ENDPOINTS ---
 
+# Engagement analytics aggregate over all users; cached and invalidated on preference/report writes
+ENGAGEMENT_ANALYTICS_CACHE_TTL = 300  # 5 minutes
+_engagement_analytics_cache = None  # (analytics, timestamp)
+
+def get_cached_engagement_analytics():
+    """Return engagement analytics, recomputing at most once per cache TTL"""
+    global _engagement_analytics_cache
+    if _engagement_analytics_cache is not None:
+        analytics, timestamp = _engagement_analytics_cache
+        if time.time() - timestamp < ENGAGEMENT_ANALYTICS_CACHE_TTL:
+            record_cache_lookup('engagement_analytics', hit=True)
+            return analytics
+    record_cache_lookup('engagement_analytics', hit=False)
+    analytics = engagement_system.get_engagement_analytics()
+    _engagement_analytics_cache = (analytics, time.time())
+    return analytics
+
+def invalidate_engagement_analytics_cache():
+    """Drop cached engagement analytics after user preference or report changes"""
+    global _engagement_analytics_cache
+    _engagement_analytics_cache = None
+
 @app.route('/api/user/preferences', methods=['POST'])
 @handle_errors
 @require_authentication
@@ -3840,8 +4247,9 @@ def set_user_preferences():
             email=email,
             preferences=user_data
         )
+        invalidate_engagement_analytics_cache()
         
-        logger.info(f"User preferences set for {user_id}")
+        logger.info("User preferences set for %s", user_id)
         
         return jsonify({
             'success': True,
@@ -3855,7 +4263,7 @@ def set_user_preferences():
         })
         
     except Exception as e:
-        logger.error(f"Failed to set user preferences: {e}")
+        logger.error("Failed to set user preferences: %s", e)
         raise ValidationError(f'Failed to set preferences: {e}')
 
 @app.route('/api/reports/weekly/send', methods=['POST'])
@@ -3868,14 +4276,15 @@ def send_weekly_reports():
         
         # In production, check admin permissions
         if not user_id or 'admin' not in g.current_user.get('permissions', []):
-            logger.warning(f"Non-admin user {user_id} attempted to send weekly reports")
+            logger.warning("Non-admin user %s attempted to send weekly reports", user_id)
         
         target_day = request.json.get('target_day') if request.is_json else None
         
         # Send reports
         result = engagement_system.send_weekly_reports(target_day)
+        invalidate_engagement_analytics_cache()
         
-        logger.info(f"Weekly reports sent: {result['sent_count']} successful, {result['failed_count']} failed")
+        logger.info("Weekly reports sent: %s successful, %s failed", result['sent_count'], result['failed_count'])
         
         return jsonify({
             'success': True,
@@ -3884,7 +4293,7 @@ def send_weekly_reports():
         })
         
     except Exception as e:
-        logger.error(f"Failed to send weekly reports: {e}")
+        logger.error("Failed to send weekly reports: %s", e)
         raise ValidationError(f'Failed to send weekly reports: {e}')
 
 @app.route('/api/engagement/analytics', methods=['GET'])
@@ -3893,7 +4302,7 @@ def send_weekly_reports():
 def get_engagement_analytics():
     """Get user engagement analytics"""
     try:
-        analytics = engagement_system.get_engagement_analytics()
+        analytics = get_cached_engagement_analytics()
         
         return jsonify({
             'success': True,
@@ -3901,7 +4310,7 @@ def get_engagement_analytics():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get engagement analytics: {e}")
+        logger.error("Failed to get engagement analytics: %s", e)
         raise ValidationError(f'Failed to get analytics: {e}')
 
 # --- ADVANCED SYSTEM MONITORING ---
@@ -3912,8 +4321,8 @@ def get_engagement_analytics():
 def get_system_metrics():
     """Get comprehensive system metrics and performance data"""
     try:
-        import psutil
-        import os
+        if not PSUTIL_AVAILABLE:
+            raise ImportError("psutil not installed")
         
         # System metrics
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -3971,7 +4380,7 @@ def get_system_metrics():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get system metrics: {e}")
+        logger.error("Failed to get system metrics: %s", e)
         raise ValidationError(f'Failed to get system metrics: {e}')
 
 @app.route('/api/analytics/basic', methods=['GET'])
@@ -3998,14 +4407,12 @@ def get_basic_analytics():
             })
         
         # Analyze performance
-        if globals().get('BASIC_ML_ONLY', False):
-            from ml.basic_predictor import BasicAnalyzer
+        if BASIC_ML_ONLY:
             performance = BasicAnalyzer.analyze_betting_performance(demo_results)
         else:
             performance = {'error': 'Advanced analytics not available'}
         
         # Kelly analysis for sample bet
-        from ml.basic_predictor import BasicAnalyzer
         kelly_sample = BasicAnalyzer.calculate_kelly_criterion(0.58, 1.85, 1000)
         
         return jsonify({
@@ -4013,11 +4420,15 @@ def get_basic_analytics():
             'performance_analysis': performance,
             'kelly_sample': kelly_sample,
             'sport': sport,
-            'generated_at': datetime.datetime.now().isoformat()
+            'generated_at': now_iso()
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Filter options advertised by the model gallery
+GALLERY_AVAILABLE_SPORTS = ('NBA', 'NFL', 'MLB')
+GALLERY_AVAILABLE_TYPES = ('statistical', 'ensemble', 'neural')
+
 @app.route('/api/models/gallery', methods=['GET'])
 def get_model_gallery():
     """Get model gallery with filtering capabilities"""
@@ -4076,9 +4487,9 @@ def get_model_gallery():
             'success': True,
             'models': filtered_models,
             'total_count': len(filtered_models),
-            'available_sports': ['NBA', 'NFL', 'MLB'],
-            'available_types': ['statistical', 'ensemble', 'neural'],
-            'basic_mode': globals().get('BASIC_ML_ONLY', False)
+            'available_sports': GALLERY_AVAILABLE_SPORTS,
+            'available_types': GALLERY_AVAILABLE_TYPES,
+            'basic_mode': BASIC_ML_ONLY
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -4119,6 +4530,133 @@ def create_model():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Demo/fallback responses for the model endpoints, encoded once at import time
+DEMO_TRAIN_RESPONSE = prerender_json({
+    'success': True,
+    'job_id': '@@job_id@@',
+    'message': 'Training started (demo mode)'
+})
+DEMO_TRAINING_STATUS_RESPONSE = prerender_json({
+    'success': True,
+    'status': 'completed',
+    'progress': 100,
+    'message': 'Training completed (demo mode)'
+})
+DEMO_PREDICTION_RESPONSE = prerender_json({
+    'success': True,
+    'prediction': {
+        'predicted_outcome': 'Home Win',
+        'confidence': 0.72,
+        'probabilities': {'Home Win': 0.72, 'Away Win': 0.28}
+    },
+    'model_id': '@@model_id@@',
+    'demo_mode': True
+})
+DEMO_PERFORMANCE_RESPONSE = prerender_json({
+    'success': True,
+    'performance': {
+        'accuracy': 0.682,
+        'precision': 0.671,
+        'recall': 0.694,
+        'f1_score': 0.682,
+        'predictions_count': 45,
+        'average_confidence': 0.74
+    },
+    'model_id': '@@model_id@@',
+    'demo_mode': True
+})
+DEMO_MODEL_DETAILS_RESPONSE = prerender_json({
+    'success': True,
+    'model': {
+        'id': '@@model_id@@',
+        'name': '@@name@@',
+        'architecture': 'LSTM with Weather Data',
+        'sport': 'NBA',
+        'status': 'active',
+        'created_at': '@@created_at@@',
+        'accuracy': 68.2,
+        'predictions': 2847,
+        'roi': 12.3,
+        'sharpe_ratio': 1.45,
+        'max_drawdown': 8.4,
+        'win_rate': 67.5,
+        'training': {
+            'epochs': 75,
+            'batch_size': 32,
+            'learning_rate': 0.001
+        },
+        'features': [
+            {'name': 'Team Offensive Rating', 'importance': 85},
+            {'name': 'Defensive Efficiency', 'importance': 78},
+            {'name': 'Rest Days', 'importance': 72},
+            {'name': 'Home/Away', 'importance': 65},
+            {'name': 'Weather Conditions', 'importance': 58},
+            {'name': 'Injury Report', 'importance': 52}
+        ],
+        'recent_predictions': [
+            {
+                'game': 'Lakers vs Warriors',
+                'prediction': 'Lakers +3.5',
+                'confidence': 82,
+                'result': 'Win',
+                'date': '2 days ago'
+            },
+            {
+                'game': 'Chiefs vs Bills',
+                'prediction': 'Under 47.5',
+                'confidence': 76,
+                'result': 'Loss',
+                'date': '4 days ago'
+            },
+            {
+                'game': 'Celtics vs Heat',
+                'prediction': 'Celtics ML',
+                'confidence': 89,
+                'result': 'Win',
+                'date': '1 week ago'
+            }
+        ]
+    },
+    'demo_mode': True
+})
+
+# Returned by get_model_details when it fails, to keep the UI functional
+DEMO_MODEL_FALLBACK_RESPONSE = prerender_json({
+    'success': True,
+    'model': {
+        'id': '@@model_id@@',
+        'name': '@@name@@',
+        'architecture': 'Error Fallback',
+        'sport': 'NBA',
+        'status': 'error',
+        'created_at': '@@created_at@@',
+        'accuracy': 50.0,
+        'predictions': 0,
+        'roi': 0.0,
+        'sharpe_ratio': 0.0,
+        'max_drawdown': 0.0,
+        'win_rate': 50.0,
+        'training': {'epochs': 0, 'batch_size': 0, 'learning_rate': 0},
+        'features': [],
+        'recent_predictions': []
+    },
+    'demo_mode': True,
+    'error': '@@error@@'
+})
+
+def demo_fallback(template, placeholders):
+    """Serve a prerendered demo payload (placeholders from route kwargs, plus 'error') when the handler raises"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s failed, serving demo fallback: %s", f.__name__, e)
+                return prerendered_response(template, error=str(e), **placeholders(**kwargs))
+        return decorated_function
+    return decorator
+
 @app.route('/api/models/train', methods=['POST'])
 def train_model():
     """Train a model asynchronously"""
@@ -4136,17 +4674,18 @@ def train_model():
             'optimize_hyperparams': data.get('optimize_hyperparams', True)
         }
         
+        record_model_request('train', demo=not ML_AVAILABLE)
         if not ML_AVAILABLE:
             # Return demo response with simulated training
-            job_id = f"train_job_{int(time.time())}"
-            return jsonify({
-                'success': True,
-                'job_id': job_id,
-                'message': 'Training started (demo mode)'
-            }), 200
-        
-        # Start async training
-        job_id = model_manager.train_model_async(model_id, training_config)
+            return prerendered_response(DEMO_TRAIN_RESPONSE, job_id=f"train_job_{int(time.time())}")
+        
+        # Start async training; progress is pushed over WebSocket when available,
+        # with get_training_status kept for polling clients and reconnects
+        job_id = model_manager.train_model_async(
+            model_id,
+            training_config,
+            progress_callback=emit_training_progress if socketio else None
+        )
         
         return jsonify({
             'success': True,
@@ -4161,14 +4700,10 @@ def train_model():
 def get_training_status(job_id):
     """Get training job status"""
     try:
+        record_model_request('training_status', demo=not ML_AVAILABLE)
         if not ML_AVAILABLE:
             # Return demo status
-            return jsonify({
-                'success': True,
-                'status': 'completed',
-                'progress': 100,
-                'message': 'Training completed (demo mode)'
-            }), 200
+            return prerendered_response(DEMO_TRAINING_STATUS_RESPONSE)
         
         status = model_manager.get_training_status(job_id)
         
@@ -4180,33 +4715,142 @@ def get_training_status(job_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Background pool for model inference so prediction requests don't hold Flask workers
+PREDICTION_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='predict')
+PREDICTION_JOB_TTL = 600  # seconds an unpolled prediction result is kept
+_prediction_jobs = {}  # request_id -> (future, model_id, submitted_at)
+_prediction_jobs_lock = threading.Lock()
+
+# With REDIS_URL set, prediction job records are shared so any gunicorn worker can answer a status poll.
+# Without it they only live in the worker that took the prediction, and the status endpoint needs sticky sessions
+prediction_job_store = create_redis_client()
+
+def store_prediction_job(request_id, record):
+    """Save a prediction job record to the shared store for PREDICTION_JOB_TTL seconds"""
+    try:
+        prediction_job_store.set(f'prediction_job:{request_id}', encode_json(record), ex=PREDICTION_JOB_TTL)
+    except Exception as e:
+        logger.warning("Failed to store prediction job %s: %s", request_id, e)
+
+def load_prediction_job(request_id):
+    """Read a prediction job record from the shared store, or None"""
+    try:
+        record = prediction_job_store.get(f'prediction_job:{request_id}')
+    except Exception as e:
+        logger.warning("Failed to load prediction job %s: %s", request_id, e)
+        return None
+    return json.loads(record) if record else None
+
+# Concurrent single-game predictions for the same model are scored together in micro-batches
+prediction_batcher = None
+if ML_AVAILABLE and not BASIC_ML_ONLY:
+    def timed_predict_batch(model_id, games):
+        """model_manager.predict_batch with batch latency recorded"""
+        with PREDICTION_LATENCY.labels(path='batched').time():
+            return model_manager.predict_batch(model_id, games)
+    
+    prediction_batcher = PredictionBatcher(
+        timed_predict_batch,
+        max_batch_size=config.ml.max_batch_size,
+        batch_timeout_ms=config.ml.batch_timeout_ms
+    )
+
+def submit_prediction(model_id, game_data):
+    """Queue a model prediction and return its request ID"""
+    request_id = str(uuid.uuid4())
+    if prediction_batcher is not None:
+        # The batcher's dispatcher resolves the future, so batches aren't capped by the pool width
+        future = prediction_batcher.submit(model_id, game_data)
+    else:
+        future = PREDICTION_POOL.submit(model_manager.predict_game, model_id, game_data)
+    now = time.time()
+    
+    if prediction_job_store is not None:
+        store_prediction_job(request_id, {'status': 'pending', 'model_id': model_id})
+        
+        def publish_result(done):
+            error = done.exception()
+            prediction = {'error': f'Prediction failed: {error}'} if error else done.result()
+            store_prediction_job(request_id, {'status': 'completed', 'model_id': model_id, 'prediction': prediction})
+        future.add_done_callback(publish_result)
+    
+    with _prediction_jobs_lock:
+        # Drop results nobody came back for
+        expired = [rid for rid, (_, _, submitted_at) in _prediction_jobs.items() if now - submitted_at > PREDICTION_JOB_TTL]
+        for rid in expired:
+            del _prediction_jobs[rid]
+        _prediction_jobs[request_id] = (future, model_id, now)
+    
+    return request_id
+
 @app.route('/api/models/<model_id>/predict', methods=['POST'])
 def model_predict(model_id):
     """Make prediction using specific model"""
     try:
+        record_model_request('predict', demo=not ML_AVAILABLE)
+        if not ML_AVAILABLE:
+            # Return demo prediction without parsing the request body
+            return prerendered_response(DEMO_PREDICTION_RESPONSE, model_id=model_id)
+        
         data = request.json
         
-        if not ML_AVAILABLE:
-            # Return demo prediction
+        # Only known models get a batcher queue
+        if model_id not in model_manager.model_metadata:
+            return jsonify({'success': False, 'error': 'Model not found'}), 404
+        
+        # Run inference in the background; clients poll the status endpoint for the result
+        try:
+            request_id = submit_prediction(model_id, data)
+        except PredictionBatcherFull as e:
+            return jsonify({'success': False, 'error': str(e)}), 503
+        
+        return jsonify({
+            'success': True,
+            'status': 'pending',
+            'request_id': request_id,
+            'model_id': model_id
+        }), 202
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/models/predict/status/<request_id>', methods=['GET'])
+def get_prediction_status(request_id):
+    """Get the status or result of a queued model prediction"""
+    try:
+        with _prediction_jobs_lock:
+            job = _prediction_jobs.get(request_id)
+            if job is not None:
+                future, model_id, _ = job
+                if future.done():
+                    del _prediction_jobs[request_id]
+        
+        if job is not None:
+            status = 'completed' if future.done() else 'pending'
+            prediction = future.result() if status == 'completed' else None
+        else:
+            # Submitted to another worker - fall back to the shared store
+            record = load_prediction_job(request_id) if prediction_job_store is not None else None
+            if record is None:
+                return jsonify({'success': False, 'error': 'Prediction request not found'}), 404
+            status, model_id, prediction = record['status'], record['model_id'], record.get('prediction')
+        
+        if status == 'pending':
             return jsonify({
                 'success': True,
-                'prediction': {
-                    'predicted_outcome': 'Home Win',
-                    'confidence': 0.72,
-                    'probabilities': {'Home Win': 0.72, 'Away Win': 0.28}
-                },
-                'model_id': model_id,
-                'demo_mode': True
+                'status': 'pending',
+                'request_id': request_id,
+                'model_id': model_id
             }), 200
         
-        prediction = model_manager.predict_game(model_id, data)
-        
         if 'error' in prediction:
             return jsonify({'success': False, 'error': prediction['error']}), 400
         
         return jsonify({
             'success': True,
+            'status': 'completed',
             'prediction': prediction,
+            'request_id': request_id,
             'model_id': model_id
         }), 200
         
@@ -4217,21 +4861,10 @@ def model_predict(model_id):
 def get_model_performance(model_id):
     """Get model performance metrics"""
     try:
+        record_model_request('performance', demo=not ML_AVAILABLE)
         if not ML_AVAILABLE:
             # Return demo performance data
-            return jsonify({
-                'success': True,
-                'performance': {
-                    'accuracy': 0.682,
-                    'precision': 0.671,
-                    'recall': 0.694,
-                    'f1_score': 0.682,
-                    'predictions_count': 45,
-                    'average_confidence': 0.74
-                },
-                'model_id': model_id,
-                'demo_mode': True
-            }), 200
+            return prerendered_response(DEMO_PERFORMANCE_RESPONSE, model_id=model_id)
         
         performance = model_manager.get_model_performance(model_id)
         
@@ -4248,143 +4881,72 @@ def get_model_performance(model_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/models/<model_id>/details', methods=['GET'])
+@demo_fallback(DEMO_MODEL_FALLBACK_RESPONSE, lambda model_id: {
+    'model_id': model_id,
+    'name': f'Fallback Model {model_id}',
+    'created_at': now_iso()
+})
 def get_model_details(model_id):
     """Get detailed model information"""
-    try:
-        if not ML_AVAILABLE:
-            # Return demo model details
-            from datetime import datetime, timedelta
-            return jsonify({
-                'success': True,
-                'model': {
-                    'id': model_id,
-                    'name': f'Demo Model {model_id}',
-                    'architecture': 'LSTM with Weather Data',
-                    'sport': 'NBA',
-                    'status': 'active',
-                    'created_at': (datetime.now() - timedelta(days=30)).isoformat(),
-                    'accuracy': 68.2,
-                    'predictions': 2847,
-                    'roi': 12.3,
-                    'sharpe_ratio': 1.45,
-                    'max_drawdown': 8.4,
-                    'win_rate': 67.5,
-                    'training': {
-                        'epochs': 75,
-                        'batch_size': 32,
-                        'learning_rate': 0.001
-                    },
-                    'features': [
-                        {'name': 'Team Offensive Rating', 'importance': 85},
-                        {'name': 'Defensive Efficiency', 'importance': 78},
-                        {'name': 'Rest Days', 'importance': 72},
-                        {'name': 'Home/Away', 'importance': 65},
-                        {'name': 'Weather Conditions', 'importance': 58},
-                        {'name': 'Injury Report', 'importance': 52}
-                    ],
-                    'recent_predictions': [
-                        {
-                            'game': 'Lakers vs Warriors',
-                            'prediction': 'Lakers +3.5',
-                            'confidence': 82,
-                            'result': 'Win',
-                            'date': '2 days ago'
-                        },
-                        {
-                            'game': 'Chiefs vs Bills',
-                            'prediction': 'Under 47.5',
-                            'confidence': 76,
-                            'result': 'Loss',
-                            'date': '4 days ago'
-                        },
-                        {
-                            'game': 'Celtics vs Heat',
-                            'prediction': 'Celtics ML',
-                            'confidence': 89,
-                            'result': 'Win',
-                            'date': '1 week ago'
-                        }
-                    ]
-                },
-                'demo_mode': True
-            }), 200
-        
-        model_info = model_manager.get_model_info(model_id)
-        
-        if 'error' in model_info:
-            # Return demo data instead of 400 error for better user experience
-            from datetime import datetime, timedelta
-            return jsonify({
-                'success': True,
-                'model': {
-                    'id': model_id,
-                    'name': f'Demo Model {model_id}',
-                    'architecture': 'Basic Statistical Model',
-                    'sport': model_id.split('_')[-1].upper() if '_' in model_id else 'NBA',
-                    'status': 'demo',
-                    'created_at': (datetime.now() - timedelta(days=15)).isoformat(),
-                    'accuracy': 64.8,
-                    'predictions': 1247,
-                    'roi': 8.7,
-                    'sharpe_ratio': 1.21,
-                    'max_drawdown': 11.2,
-                    'win_rate': 62.3,
-                    'training': {
-                        'epochs': 0,
-                        'batch_size': 0,
-                        'learning_rate': 0
-                    },
-                    'features': [
-                        {'name': 'Team Strength', 'importance': 75},
-                        {'name': 'Recent Form', 'importance': 68},
-                        {'name': 'Home Advantage', 'importance': 55},
-                        {'name': 'Head to Head', 'importance': 45}
-                    ],
-                    'recent_predictions': [
-                        {
-                            'game': 'Team A vs Team B',
-                            'prediction': 'Team A -2.5',
-                            'confidence': 75,
-                            'result': 'Win',
-                            'date': '1 day ago'
-                        }
-                    ]
-                },
-                'demo_mode': True,
-                'note': 'Model not found, showing demo data'
-            }), 200
-        
-        return jsonify({
-            'success': True,
-            'model': model_info,
-            'model_id': model_id
-        }), 200
-        
-    except Exception as e:
-        # Even for exceptions, return demo data to keep UI functional
-        from datetime import datetime, timedelta
-        return jsonify({
+    record_model_request('details', demo=not ML_AVAILABLE)
+    if not ML_AVAILABLE:
+        # Return demo model details
+        return prerendered_response(
+            DEMO_MODEL_DETAILS_RESPONSE,
+            model_id=model_id,
+            name=f'Demo Model {model_id}',
+            created_at=(datetime.datetime.now() - timedelta(days=30)).isoformat()
+        )
+    
+    model_info = model_manager.get_model_info(model_id)
+    
+    if 'error' in model_info:
+        # Return demo data instead of 400 error for better user experience
+        return ojsonify({
             'success': True,
             'model': {
                 'id': model_id,
-                'name': f'Fallback Model {model_id}',
-                'architecture': 'Error Fallback',
-                'sport': 'NBA',
-                'status': 'error',
-                'created_at': datetime.now().isoformat(),
-                'accuracy': 50.0,
-                'predictions': 0,
-                'roi': 0.0,
-                'sharpe_ratio': 0.0,
-                'max_drawdown': 0.0,
-                'win_rate': 50.0,
-                'training': {'epochs': 0, 'batch_size': 0, 'learning_rate': 0},
-                'features': [],
-                'recent_predictions': []
+                'name': f'Demo Model {model_id}',
+                'architecture': 'Basic Statistical Model',
+                'sport': model_id.split('_')[-1].upper() if '_' in model_id else 'NBA',
+                'status': 'demo',
+                'created_at': (datetime.datetime.now() - timedelta(days=15)).isoformat(),
+                'accuracy': 64.8,
+                'predictions': 1247,
+                'roi': 8.7,
+                'sharpe_ratio': 1.21,
+                'max_drawdown': 11.2,
+                'win_rate': 62.3,
+                'training': {
+                    'epochs': 0,
+                    'batch_size': 0,
+                    'learning_rate': 0
+                },
+                'features': [
+                    {'name': 'Team Strength', 'importance': 75},
+                    {'name': 'Recent Form', 'importance': 68},
+                    {'name': 'Home Advantage', 'importance': 55},
+                    {'name': 'Head to Head', 'importance': 45}
+                ],
+                'recent_predictions': [
+                    {
+                        'game': 'Team A vs Team B',
+                        'prediction': 'Team A -2.5',
+                        'confidence': 75,
+                        'result': 'Win',
+                        'date': '1 day ago'
+                    }
+                ]
             },
             'demo_mode': True,
-            'error': str(e)
+            'note': 'Model not found, showing demo data'
         }), 200
+    
+    return ojsonify({
+        'success': True,
+        'model': model_info,
+        'model_id': model_id
+    }), 200
 
 @app.route('/api/strategies/model-based', methods=['POST'])
 def create_model_based_strategy():
@@ -4404,6 +4966,7 @@ def create_model_based_strategy():
         new_strategy_ref = strategies_collection_user.document()
         strategy_id = new_strategy_ref.id
         
+        timestamp = datetime.datetime.now().isoformat()
         strategy_data = {
             'id': strategy_id,
             'name': data.get('name', f'ML Strategy ({model_id})'),
@@ -4423,8 +4986,8 @@ def create_model_based_strategy():
                 'total_profit': 0.0,
                 'roi': 0.0
             },
-            'created_at': datetime.datetime.now().isoformat(),
-            'updated_at': datetime.datetime.now().isoformat()
+            'created_at': timestamp,
+            'updated_at': timestamp
         }
         
         new_strategy_ref.set(strategy_data)
@@ -4438,12 +5001,44 @@ def create_model_based_strategy():
     except Exception as e:
         return jsonify({'success': False, 'message': f'Failed to create strategy: {e}'}), 500
 
+# Short-lived cache of user investor documents read by the model endpoints below
+INVESTOR_DOC_CACHE_TTL = 30  # seconds
+INVESTOR_DOC_CACHE_MAX_SIZE = 4096
+_investor_doc_cache = {}  # (user_id, investor_id) -> ((exists, data), timestamp)
+
+def get_investor_doc(user_id, investor_id):
+    """Return (exists, data) for a user's investor document, cached for a short TTL"""
+    key = (user_id, investor_id)
+    cached = _investor_doc_cache.get(key)
+    if cached is not None:
+        investor, timestamp = cached
+        if time.time() - timestamp < INVESTOR_DOC_CACHE_TTL:
+            record_cache_lookup('investor_doc', hit=True)
+            return investor
+    record_cache_lookup('investor_doc', hit=False)
+    
+    with FIRESTORE_LATENCY.labels(op='investor_get').time():
+        investor_doc = db.collection(f'users/{user_id}/investors').document(investor_id).get()
+    investor = (investor_doc.exists, investor_doc.to_dict() if investor_doc.exists else None)
+    
+    if len(_investor_doc_cache) >= INVESTOR_DOC_CACHE_MAX_SIZE:
+        _investor_doc_cache.clear()
+    _investor_doc_cache[key] = (investor, time.time())
+    return investor
+
+def invalidate_investor_doc(user_id, investor_id):
+    """Drop a cached investor document after it is written"""
+    _investor_doc_cache.pop((user_id, investor_id), None)
+
+# First underscore-delimited sport token in a model ID, e.g. "nfl_ensemble_123456"
+MODEL_ID_SPORT_PATTERN = re.compile(r'(?:^|_)(nfl|nba|mlb|nhl|ncaaf|ncaab)(?=_|$)')
+
 @app.route('/api/investors/<investor_id>/assign-model', methods=['POST'])
-def assign_model_to_investor():
+def assign_model_to_investor(investor_id):
     """Assign a trained model to a investor for recommendations and auto-detect sport"""
     try:
         data = request.json
-        investor_id = data.get('investor_id')
+        investor_id = data.get('investor_id', investor_id)
         model_id = data.get('model_id')
         user_id = data.get('user_id')
         
@@ -4459,39 +5054,21 @@ def assign_model_to_investor():
         
         if model_metadata:
             detected_sport = model_metadata.sport
-            logger.info(f"Auto-detected sport '{detected_sport}' from model {model_id}")
+            logger.info("Auto-detected sport '%s' from model %s", detected_sport, model_id)
         else:
             # Fallback: try to extract sport from model_id if it follows naming convention
             # e.g., "nfl_ensemble_123456" or "nba_lstm_789012"
-            model_parts = model_id.lower().split('_')
-            sport_mapping = {
-                'nfl': 'NFL',
-                'nba': 'NBA', 
-                'mlb': 'MLB',
-                'nhl': 'NHL',
-                'ncaaf': 'NCAAF',
-                'ncaab': 'NCAAB'
-            }
-            
-            for part in model_parts:
-                if part in sport_mapping:
-                    detected_sport = sport_mapping[part]
-                    logger.info(f"Auto-detected sport '{detected_sport}' from model ID pattern")
-                    break
+            match = MODEL_ID_SPORT_PATTERN.search(model_id.lower())
+            if match:
+                detected_sport = match.group(1).upper()
+                logger.info("Auto-detected sport '%s' from model ID pattern", detected_sport)
         
         # Update investor configuration to use the model
-        user_investors_collection = db.collection(f'users/{user_id}/investors')
-        investor_ref = user_investors_collection.document(investor_id)
-        investor_doc = investor_ref.get()
-        
-        if not investor_doc.exists:
-            return jsonify({'success': False, 'message': 'Investor not found'}), 404
-        
-        # Prepare update data
+        timestamp = datetime.datetime.now().isoformat()
         update_data = {
             'assigned_model_id': model_id,
-            'model_assigned_at': datetime.datetime.now().isoformat(),
-            'last_updated': datetime.datetime.now().isoformat()
+            'model_assigned_at': timestamp,
+            'last_updated': timestamp
         }
         
         # Auto-update sport if detected
@@ -4500,7 +5077,13 @@ def assign_model_to_investor():
             update_data['sport_auto_detected'] = True
             update_data['sport_detected_from'] = 'model_metadata' if model_metadata else 'model_id_pattern'
         
-        investor_ref.update(update_data)
+        # update() fails with NotFound for missing documents, so no existence read is needed
+        try:
+            with FIRESTORE_LATENCY.labels(op='investor_update').time():
+                db.collection(f'users/{user_id}/investors').document(investor_id).update(update_data)
+        except FirestoreNotFound:
+            return jsonify({'success': False, 'message': 'Investor not found'}), 404
+        invalidate_investor_doc(user_id, investor_id)
         
         response_message = f'Model {model_id} assigned to investor {investor_id}'
         if detected_sport:
@@ -4516,7 +5099,7 @@ def assign_model_to_investor():
         }), 200
         
     except Exception as e:
-        logger.error(f"Failed to assign model to investor: {e}")
+        logger.error("Failed to assign model to investor: %s", e)
         return jsonify({'success': False, 'message': f'Failed to assign model: {e}'}), 500
 
 @app.route('/api/investors/<investor_id>/model-recommendations', methods=['GET'])
@@ -4526,30 +5109,28 @@ def get_investor_model_recommendations(investor_id):
         user_id = request.args.get('user_id')
         
         if not user_id:
-            return jsonify({'success': False, 'message': 'User ID required'}), 400
+            return ojsonify({'success': False, 'message': 'User ID required'}), 400
         
         if not db:
-            return jsonify({'success': False, 'message': 'Database not initialized.'}), 500
+            return ojsonify({'success': False, 'message': 'Database not initialized.'}), 500
         
         # Get investor data from user-specific collection
-        user_investors_collection = db.collection(f'users/{user_id}/investors')
-        investor_ref = user_investors_collection.document(investor_id)
-        investor_doc = investor_ref.get()
+        investor_exists, investor_data = get_investor_doc(user_id, investor_id)
         
-        if not investor_doc.exists:
-            return jsonify({'success': False, 'message': 'Investor not found'}), 404
+        if not investor_exists:
+            return ojsonify({'success': False, 'message': 'Investor not found'}), 404
         
-        investor_data = investor_doc.to_dict()
         assigned_model_id = investor_data.get('assigned_model_id')
         
         if not assigned_model_id:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'recommendations': [],
                 'message': 'No model assigned to this investor'
             }), 200
         
         # Get current games data (in demo mode, use sample data)
+        commence_time = datetime.datetime.now().isoformat()
         sample_games = [
             {
                 'game_id': 'game_1',
@@ -4557,7 +5138,7 @@ def get_investor_model_recommendations(investor_id):
                 'sport': 'NBA',
                 'home_team': 'Lakers',
                 'away_team': 'Warriors',
-                'commence_time': datetime.datetime.now().isoformat()
+                'commence_time': commence_time
             },
             {
                 'game_id': 'game_2',
@@ -4565,28 +5146,32 @@ def get_investor_model_recommendations(investor_id):
                 'sport': 'NBA',
                 'home_team': 'Celtics',
                 'away_team': 'Heat',
-                'commence_time': datetime.datetime.now().isoformat()
+                'commence_time': commence_time
             }
         ]
         
         recommendations = []
         
-        for game in sample_games:
-            # Use model manager to get predictions if available
-            if ML_AVAILABLE:
-                prediction = model_manager.predict_game(assigned_model_id, {
-                    'sport': game['sport'],
-                    'home_team': game['home_team'],
-                    'away_team': game['away_team']
-                })
-            else:
-                # Demo prediction
-                prediction = {
-                    'predicted_outcome': 'Home Win',
-                    'confidence': 0.72,
-                    'probabilities': {'Home Win': 0.72, 'Away Win': 0.28}
-                }
-            
+        # Use model manager to get predictions if available, scoring all games in one batch
+        if ML_AVAILABLE:
+            with PREDICTION_LATENCY.labels(path='recommendations').time():
+                predictions = model_manager.predict_batch(assigned_model_id, [
+                    {
+                        'sport': game['sport'],
+                        'home_team': game['home_team'],
+                        'away_team': game['away_team']
+                    }
+                    for game in sample_games
+                ])
+        else:
+            # Demo prediction
+            predictions = [{
+                'predicted_outcome': 'Home Win',
+                'confidence': 0.72,
+                'probabilities': {'Home Win': 0.72, 'Away Win': 0.28}
+            } for _ in sample_games]
+        
+        for game, prediction in zip(sample_games, predictions):
             if 'error' not in prediction:
                 confidence = prediction.get('confidence', 0.5) * 100
                 
@@ -4606,7 +5191,7 @@ def get_investor_model_recommendations(investor_id):
                         'model_id': assigned_model_id
                     })
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'recommendations': recommendations,
             'investor_id': investor_id,
@@ -4615,7 +5200,34 @@ def get_investor_model_recommendations(investor_id):
         }), 200
         
     except Exception as e:
-        return jsonify({'success': False, 'message': f'Failed to get recommendations: {e}'}), 500
+        return ojsonify({'success': False, 'message': f'Failed to get recommendations: {e}'}), 500
+
+DEMO_FEED_MAX_AGE = 300  # seconds clients and proxies may reuse a demo feed response
+
+@lru_cache(maxsize=64)
+def render_demo_recent_scores(sport, days, day):
+    """Encoded demo recent scores payload, generated once per sport/days/day"""
+    return encode_json({
+        'success': True,
+        'scores': generate_demo_recent_scores(sport, days),
+        'sport_filter': sport,
+        'days_back': days,
+        'generated_at': now_iso()
+    })
+
+@lru_cache(maxsize=64)
+def render_demo_standings(sport, day):
+    """Encoded demo standings payload, generated once per sport/day"""
+    return encode_json({
+        'success': True,
+        'standings': generate_demo_standings(sport),
+        'sport_filter': sport,
+        'generated_at': now_iso()
+    })
+
+def demo_feed_response(body):
+    """Serve a shared demo payload with a body ETag, since each worker generates its own random data"""
+    return cacheable_response(app.response_class(body, mimetype='application/json'), DEMO_FEED_MAX_AGE)
 
 @app.route('/api/recent-scores', methods=['GET'])
 def get_recent_scores():
@@ -4623,212 +5235,226 @@ def get_recent_scores():
     try:
         sport = request.args.get('sport', 'all')
         days = int(request.args.get('days', 7))  # Last 7 days by default
+        today = datetime.date.today()
         
-        # Generate demo recent scores data
-        recent_scores = generate_demo_recent_scores(sport, days)
-        
-        return jsonify({
-            'success': True,
-            'scores': recent_scores,
-            'sport_filter': sport,
-            'days_back': days,
-            'generated_at': datetime.datetime.now().isoformat()
-        })
+        # Demo recent scores are generated once per sport/days/day and shared by all clients
+        body = render_demo_recent_scores(sport, days, today)
+        return demo_feed_response(body)
         
     except Exception as e:
-        logger.error(f"Failed to get recent scores: {e}")
-        return jsonify({'success': False, 'message': f'Failed to get scores: {e}'}), 500
+        logger.error("Failed to get recent scores: %s", e)
+        return ojsonify({'success': False, 'message': f'Failed to get scores: {e}'}), 500
 
 @app.route('/api/standings', methods=['GET'])
 def get_division_standings():
     """Get division standings for all sports"""
     try:
         sport = request.args.get('sport', 'all')
+        today = datetime.date.today()
         
-        # Generate demo standings data
-        standings = generate_demo_standings(sport)
-        
-        return jsonify({
-            'success': True,
-            'standings': standings,
-            'sport_filter': sport,
-            'generated_at': datetime.datetime.now().isoformat()
-        })
+        # Demo standings are generated once per sport/day and shared by all clients
+        body = render_demo_standings(sport, today)
+        return demo_feed_response(body)
         
     except Exception as e:
-        logger.error(f"Failed to get standings: {e}")
-        return jsonify({'success': False, 'message': f'Failed to get standings: {e}'}), 500
+        logger.error("Failed to get standings: %s", e)
+        return ojsonify({'success': False, 'message': f'Failed to get standings: {e}'}), 500
+
+# Teams and score range per sport for demo recent scores
+DEMO_SCORE_SPORTS = {
+    'NFL': {
+        'teams': ('Chiefs', 'Bills', 'Cowboys', 'Eagles', 'Patriots', '49ers', 'Packers', 'Ravens'),
+        'score_range': (10, 35)
+    },
+    'NBA': {
+        'teams': ('Lakers', 'Warriors', 'Celtics', 'Heat', 'Bulls', 'Knicks', 'Nets', 'Sixers'),
+        'score_range': (85, 125)
+    },
+    'MLB': {
+        'teams': ('Yankees', 'Red Sox', 'Dodgers', 'Giants', 'Astros', 'Angels', 'Mets', 'Cubs'),
+        'score_range': (2, 12)
+    },
+    'NHL': {
+        'teams': ('Rangers', 'Bruins', 'Kings', 'Sharks', 'Blackhawks', 'Red Wings', 'Flyers', 'Penguins'),
+        'score_range': (1, 6)
+    }
+}
 
 def generate_demo_recent_scores(sport_filter='all', days_back=7):
     """Generate demo recent scores data"""
-    import random
-    from datetime import datetime, timedelta
+    rng = np.random.default_rng()
     
     scores = []
-    sports_data = {
-        'NFL': {
-            'teams': ['Chiefs', 'Bills', 'Cowboys', 'Eagles', 'Patriots', '49ers', 'Packers', 'Ravens'],
-            'score_range': (10, 35)
-        },
-        'NBA': {
-            'teams': ['Lakers', 'Warriors', 'Celtics', 'Heat', 'Bulls', 'Knicks', 'Nets', 'Sixers'],
-            'score_range': (85, 125)
-        },
-        'MLB': {
-            'teams': ['Yankees', 'Red Sox', 'Dodgers', 'Giants', 'Astros', 'Angels', 'Mets', 'Cubs'],
-            'score_range': (2, 12)
-        },
-        'NHL': {
-            'teams': ['Rangers', 'Bruins', 'Kings', 'Sharks', 'Blackhawks', 'Red Wings', 'Flyers', 'Penguins'],
-            'score_range': (1, 6)
-        }
-    }
     
     # Determine which sports to include
-    if sport_filter != 'all' and sport_filter in sports_data:
+    if sport_filter != 'all' and sport_filter in DEMO_SCORE_SPORTS:
         sports_to_include = [sport_filter]
     else:
-        sports_to_include = list(sports_data.keys())
+        sports_to_include = list(DEMO_SCORE_SPORTS)
     
-    # Generate scores for each day
+    # Format each day's date strings once rather than per game
+    now = datetime.datetime.now()
+    game_days = []
     for day_offset in range(days_back):
-        game_date = datetime.now() - timedelta(days=day_offset)
-        
-        for sport in sports_to_include:
-            sport_info = sports_data[sport]
-            teams = sport_info['teams']
-            score_min, score_max = sport_info['score_range']
-            
-            # Generate 2-4 games per sport per day
-            num_games = random.randint(2, 4)
+        game_date = now - timedelta(days=day_offset)
+        game_days.append((game_date.strftime('%Y%m%d'), game_date.strftime('%Y-%m-%d'), game_date.strftime('%I:%M %p')))
+    
+    # Generate scores per sport, drawing every game's teams and scores in one batch
+    for sport in sports_to_include:
+        sport_info = DEMO_SCORE_SPORTS[sport]
+        teams = sport_info['teams']
+        score_min, score_max = sport_info['score_range']
+        
+        # Generate 2-4 games per sport per day
+        game_day_index = np.repeat(np.arange(len(game_days)), rng.integers(2, 5, size=len(game_days)))
+        num_games = len(game_day_index)
+        
+        # Offsetting the away index by 1..n-1 guarantees a different team than home
+        home_index = rng.integers(0, len(teams), size=num_games)
+        away_index = (home_index + rng.integers(1, len(teams), size=num_games)) % len(teams)
+        
+        home_scores = rng.integers(score_min, score_max + 1, size=num_games)
+        away_scores = rng.integers(score_min, score_max + 1, size=num_games)
+        
+        # Ensure home team has slight advantage (60% win rate)
+        home_boost = (rng.random(num_games) < 0.6) & (home_scores <= away_scores)
+        home_scores[home_boost] = away_scores[home_boost] + rng.integers(1, 4, size=int(home_boost.sum()))
+        
+        for day, home, away, home_score, away_score in zip(
+            game_day_index.tolist(), home_index.tolist(), away_index.tolist(),
+            home_scores.tolist(), away_scores.tolist()
+        ):
+            date_key, date_str, game_time = game_days[day]
+            home_team = teams[home]
+            away_team = teams[away]
             
-            for _ in range(num_games):
-                home_team = random.choice(teams)
-                away_team = random.choice([t for t in teams if t != home_team])
-                
-                home_score = random.randint(score_min, score_max)
-                away_score = random.randint(score_min, score_max)
-                
-                # Ensure home team has slight advantage (60% win rate)
-                if random.random() < 0.6:
-                    if home_score <= away_score:
-                        home_score = away_score + random.randint(1, 3)
-                
-                scores.append({
-                    'id': f"{sport.lower()}_{game_date.strftime('%Y%m%d')}_{home_team}_{away_team}",
-                    'sport': sport,
-                    'date': game_date.strftime('%Y-%m-%d'),
-                    'home_team': home_team,
-                    'away_team': away_team,
-                    'home_score': home_score,
-                    'away_score': away_score,
-                    'winner': home_team if home_score > away_score else away_team,
-                    'game_time': game_date.strftime('%I:%M %p'),
-                    'status': 'Final'
-                })
+            scores.append({
+                'id': f"{sport.lower()}_{date_key}_{home_team}_{away_team}",
+                'sport': sport,
+                'date': date_str,
+                'home_team': home_team,
+                'away_team': away_team,
+                'home_score': home_score,
+                'away_score': away_score,
+                'winner': home_team if home_score > away_score else away_team,
+                'game_time': game_time,
+                'status': 'Final'
+            })
     
     # Sort by date (most recent first)
-    scores.sort(key=lambda x: x['date'], reverse=True)
+    scores.sort(key=itemgetter('date'), reverse=True)
     
     return scores
 
+# Divisions and teams per sport for demo standings
+DEMO_STANDINGS_DIVISIONS = {
+    'NFL': {
+        'AFC East': ('Bills', 'Patriots', 'Jets', 'Dolphins'),
+        'AFC North': ('Ravens', 'Steelers', 'Browns', 'Bengals'),
+        'AFC South': ('Titans', 'Colts', 'Texans', 'Jaguars'),
+        'AFC West': ('Chiefs', 'Chargers', 'Raiders', 'Broncos'),
+        'NFC East': ('Eagles', 'Cowboys', 'Giants', 'Commanders'),
+        'NFC North': ('Packers', 'Vikings', 'Bears', 'Lions'),
+        'NFC South': ('Saints', 'Falcons', 'Panthers', 'Buccaneers'),
+        'NFC West': ('49ers', 'Seahawks', 'Rams', 'Cardinals')
+    },
+    'NBA': {
+        'Atlantic': ('Celtics', 'Nets', 'Knicks', 'Sixers', 'Raptors'),
+        'Central': ('Bucks', 'Bulls', 'Cavaliers', 'Pistons', 'Pacers'),
+        'Southeast': ('Heat', 'Hawks', 'Hornets', 'Magic', 'Wizards'),
+        'Northwest': ('Nuggets', 'Timberwolves', 'Thunder', 'Blazers', 'Jazz'),
+        'Pacific': ('Warriors', 'Lakers', 'Clippers', 'Suns', 'Kings'),
+        'Southwest': ('Mavericks', 'Rockets', 'Grizzlies', 'Pelicans', 'Spurs')
+    },
+    'MLB': {
+        'AL East': ('Yankees', 'Red Sox', 'Blue Jays', 'Rays', 'Orioles'),
+        'AL Central': ('Twins', 'Guardians', 'White Sox', 'Tigers', 'Royals'),
+        'AL West': ('Astros', 'Angels', 'Mariners', 'Rangers', 'Athletics'),
+        'NL East': ('Braves', 'Mets', 'Phillies', 'Marlins', 'Nationals'),
+        'NL Central': ('Brewers', 'Cardinals', 'Cubs', 'Reds', 'Pirates'),
+        'NL West': ('Dodgers', 'Padres', 'Giants', 'Rockies', 'Diamondbacks')
+    }
+}
+
+# (games played range, max losses, max wins) used for demo standings records per sport
+STANDINGS_RECORD_RANGES = {
+    'NFL': ((14, 17), 15, 17),
+    'NBA': ((75, 82), 60, 65),
+    'MLB': ((155, 162), 100, 110)
+}
+
+# One row per team while a division's standings are generated and sorted
+STANDINGS_RECORD_DTYPE = np.dtype([
+    ('team', 'U20'),
+    ('games_played', 'i4'),
+    ('wins', 'i4'),
+    ('losses', 'i4'),
+    ('win_pct', 'f8')
+])
+
 def generate_demo_standings(sport_filter='all'):
     """Generate demo division standings data"""
-    import random
+    rng = np.random.default_rng()
     
     standings = {}
     
-    sports_divisions = {
-        'NFL': {
-            'AFC East': ['Bills', 'Patriots', 'Jets', 'Dolphins'],
-            'AFC North': ['Ravens', 'Steelers', 'Browns', 'Bengals'],
-            'AFC South': ['Titans', 'Colts', 'Texans', 'Jaguars'],
-            'AFC West': ['Chiefs', 'Chargers', 'Raiders', 'Broncos'],
-            'NFC East': ['Eagles', 'Cowboys', 'Giants', 'Commanders'],
-            'NFC North': ['Packers', 'Vikings', 'Bears', 'Lions'],
-            'NFC South': ['Saints', 'Falcons', 'Panthers', 'Buccaneers'],
-            'NFC West': ['49ers', 'Seahawks', 'Rams', 'Cardinals']
-        },
-        'NBA': {
-            'Atlantic': ['Celtics', 'Nets', 'Knicks', 'Sixers', 'Raptors'],
-            'Central': ['Bucks', 'Bulls', 'Cavaliers', 'Pistons', 'Pacers'],
-            'Southeast': ['Heat', 'Hawks', 'Hornets', 'Magic', 'Wizards'],
-            'Northwest': ['Nuggets', 'Timberwolves', 'Thunder', 'Blazers', 'Jazz'],
-            'Pacific': ['Warriors', 'Lakers', 'Clippers', 'Suns', 'Kings'],
-            'Southwest': ['Mavericks', 'Rockets', 'Grizzlies', 'Pelicans', 'Spurs']
-        },
-        'MLB': {
-            'AL East': ['Yankees', 'Red Sox', 'Blue Jays', 'Rays', 'Orioles'],
-            'AL Central': ['Twins', 'Guardians', 'White Sox', 'Tigers', 'Royals'],
-            'AL West': ['Astros', 'Angels', 'Mariners', 'Rangers', 'Athletics'],
-            'NL East': ['Braves', 'Mets', 'Phillies', 'Marlins', 'Nationals'],
-            'NL Central': ['Brewers', 'Cardinals', 'Cubs', 'Reds', 'Pirates'],
-            'NL West': ['Dodgers', 'Padres', 'Giants', 'Rockies', 'Diamondbacks']
-        }
-    }
-    
     # Determine which sports to include
-    if sport_filter != 'all' and sport_filter in sports_divisions:
+    if sport_filter != 'all' and sport_filter in DEMO_STANDINGS_DIVISIONS:
         sports_to_include = [sport_filter]
     else:
-        sports_to_include = list(sports_divisions.keys())
+        sports_to_include = list(DEMO_STANDINGS_DIVISIONS)
     
     for sport in sports_to_include:
         standings[sport] = {}
         
-        for division, teams in sports_divisions[sport].items():
-            division_standings = []
+        games_range, max_losses, max_wins = STANDINGS_RECORD_RANGES[sport]
+        
+        for division, teams in DEMO_STANDINGS_DIVISIONS[sport].items():
+            # Generate realistic records for the whole division at once
+            records = np.empty(len(teams), dtype=STANDINGS_RECORD_DTYPE)
+            records['team'] = teams
+            records['games_played'] = rng.integers(games_range[0], games_range[1] + 1, size=len(teams))
+            records['wins'] = rng.integers(
+                np.maximum(0, records['games_played'] - max_losses),
+                np.minimum(records['games_played'], max_wins) + 1
+            )
+            records['losses'] = records['games_played'] - records['wins']
+            records['win_pct'] = np.round(records['wins'] / records['games_played'], 3)
             
-            for i, team in enumerate(teams):
-                # Generate realistic records
-                if sport == 'NFL':
-                    games_played = random.randint(14, 17)
-                    wins = random.randint(max(0, games_played - 15), games_played)
-                elif sport == 'NBA':
-                    games_played = random.randint(75, 82)
-                    wins = random.randint(max(0, games_played - 60), min(games_played, 65))
-                else:  # MLB
-                    games_played = random.randint(155, 162)
-                    wins = random.randint(max(0, games_played - 100), min(games_played, 110))
-                
-                losses = games_played - wins
-                win_pct = wins / games_played if games_played > 0 else 0
-                
-                # Games behind calculation (simplified)
-                gb = i * random.uniform(0.5, 3.0) if i > 0 else 0
-                
-                division_standings.append({
+            # Sort by win percentage (stable, so ties keep division order)
+            records = records[np.argsort(-records['win_pct'], kind='stable')]
+            
+            # Calculate actual games behind leader
+            leader = records[0]
+            games_behind = ((leader['wins'] - records['wins']) + (records['losses'] - leader['losses'])) / 2
+            games_behind[0] = 0
+            
+            division_standings = [
+                {
                     'team': team,
                     'wins': wins,
                     'losses': losses,
-                    'win_percentage': round(win_pct, 3),
+                    'win_percentage': win_pct,
                     'games_behind': round(gb, 1) if gb > 0 else '-',
                     'games_played': games_played,
-                    'position': i + 1
-                })
-            
-            # Sort by win percentage
-            division_standings.sort(key=lambda x: x['win_percentage'], reverse=True)
-            
-            # Update positions and games behind after sorting
-            for idx, team_data in enumerate(division_standings):
-                team_data['position'] = idx + 1
-                if idx == 0:
-                    team_data['games_behind'] = '-'
-                else:
-                    # Calculate actual games behind leader
-                    leader_wins = division_standings[0]['wins']
-                    leader_losses = division_standings[0]['losses']
-                    team_wins = team_data['wins']
-                    team_losses = team_data['losses']
-                    
-                    gb = ((leader_wins - team_wins) + (team_losses - leader_losses)) / 2
-                    team_data['games_behind'] = round(gb, 1) if gb > 0 else '-'
+                    'position': position
+                }
+                for position, ((team, games_played, wins, losses, win_pct), gb) in enumerate(
+                    zip(records.tolist(), games_behind.tolist()), start=1
+                )
+            ]
             
             standings[sport][division] = division_standings
     
     return standings
 
+# schema_type -> (parser, validator) for /api/schema/validate
+SCHEMA_VALIDATORS = {
+    'model': (ModelSchema.from_dict, SchemaValidator.validate_model),
+    'investor': (InvestorSchema.from_dict, SchemaValidator.validate_bot),
+    'strategy': (StrategySchema.from_dict, SchemaValidator.validate_strategy)
+}
+
 @app.route('/api/schema/validate', methods=['POST'])
 @handle_errors
 def validate_schema():
@@ -4844,34 +5470,19 @@ def validate_schema():
                 'message': 'schema_type and data are required'
             }), 400
         
-        validation_issues = []
-        
-        if schema_type == 'model':
-            try:
-                model = ModelSchema.from_dict(schema_data)
-                validation_issues = SchemaValidator.validate_model(model)
-            except Exception as e:
-                validation_issues.append(f"Schema parsing error: {str(e)}")
-                
-        elif schema_type == 'investor':
-            try:
-                investor = InvestorSchema.from_dict(schema_data)
-                validation_issues = SchemaValidator.validate_investor(investor)
-            except Exception as e:
-                validation_issues.append(f"Schema parsing error: {str(e)}")
-                
-        elif schema_type == 'strategy':
-            try:
-                strategy = StrategySchema.from_dict(schema_data)
-                validation_issues = SchemaValidator.validate_strategy(strategy)
-            except Exception as e:
-                validation_issues.append(f"Schema parsing error: {str(e)}")
-        else:
+        schema_handlers = SCHEMA_VALIDATORS.get(schema_type)
+        if not schema_handlers:
             return jsonify({
                 'success': False,
                 'message': f'Unknown schema type: {schema_type}'
             }), 400
         
+        from_dict, validate = schema_handlers
+        try:
+            validation_issues = validate(from_dict(schema_data))
+        except Exception as e:
+            validation_issues = [f"Schema parsing error: {str(e)}"]
+        
         return jsonify({
             'success': len(validation_issues) == 0,
             'validation_issues': validation_issues,
@@ -4880,80 +5491,97 @@ def validate_schema():
         })
         
     except Exception as e:
-        logger.error(f"Schema validation failed: {e}")
+        logger.error("Schema validation failed: %s", e)
         return jsonify({
             'success': False,
             'message': f'Validation failed: {str(e)}'
         }), 500
 
+# Schema info is static; enum values are materialized and encoded once at import
+SCHEMA_INFO_RESPONSE = prerender_json({
+    'success': True,
+    'schema_info': {
+        'version': '2.0.0',
+        'schemas': {
+            'model': {
+                'description': 'Machine learning model schema with performance tracking',
+                'required_fields': ['model_id', 'name', 'version', 'sport', 'created_by'],
+                'enums': {
+                    'sport': list(SPORT_VALUES),
+                    'status': list(MODEL_STATUS_VALUES),
+                    'market_types': list(MARKET_TYPE_VALUES)
+                }
+            },
+            'investor': {
+                'description': 'Automated investor/investor schema with risk management',
+                'required_fields': ['investor_id', 'name', 'current_balance', 'created_by'],
+                'enums': {
+                    'active_status': list(INVESTOR_STATUS_VALUES),
+                    'sport_filter': list(SPORT_VALUES)
+                }
+            },
+            'strategy': {
+                'description': 'Investment strategy schema with performance metrics',
+                'required_fields': ['strategy_id', 'name', 'strategy_type', 'created_by'],
+                'enums': {
+                    'strategy_type': list(STRATEGY_TYPE_VALUES)
+                }
+            }
+        },
+        'features': [
+            'Schema validation',
+            'Legacy data migration',
+            'Performance metrics tracking',
+            'Risk management configuration',
+            'Type safety with enums'
+        ]
+    }
+})
+
+SCHEMA_INFO_MAX_AGE = 86400  # schema descriptions only change on deploy
+
 @app.route('/api/schema/info', methods=['GET'])
 def get_schema_info():
     """Get information about available schemas"""
-    try:
-        schema_info = {
-            'version': '2.0.0',
-            'schemas': {
-                'model': {
-                    'description': 'Machine learning model schema with performance tracking',
-                    'required_fields': ['model_id', 'name', 'version', 'sport', 'created_by'],
-                    'enums': {
-                        'sport': [sport.value for sport in Sport],
-                        'status': [status.value for status in ModelStatus],
-                        'market_types': [market.value for market in MarketType]
-                    }
-                },
-                'investor': {
-                    'description': 'Automated investor/investor schema with risk management',
-                    'required_fields': ['investor_id', 'name', 'current_balance', 'created_by'],
-                    'enums': {
-                        'active_status': [status.value for status in InvestorStatus],
-                        'sport_filter': [sport.value for sport in Sport]
-                    }
-                },
-                'strategy': {
-                    'description': 'Investment strategy schema with performance metrics',
-                    'required_fields': ['strategy_id', 'name', 'strategy_type', 'created_by'],
-                    'enums': {
-                        'strategy_type': [stype.value for stype in StrategyType]
-                    }
-                }
-            },
-            'features': [
-                'Schema validation',
-                'Legacy data migration',
-                'Performance metrics tracking',
-                'Risk management configuration',
-                'Type safety with enums'
-            ]
-        }
-        
-        return jsonify({
-            'success': True,
-            'schema_info': schema_info
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get schema info: {e}")
-        return jsonify({
-            'success': False,
-            'message': f'Failed to get schema info: {str(e)}'
-        }), 500
+    return cacheable_response(prerendered_response(SCHEMA_INFO_RESPONSE), SCHEMA_INFO_MAX_AGE)
 
 @app.route('/scores')
 def scores_page():
     """Render the scores and standings page"""
     return render_template('scores.html')
 
+# Queue status is polled by every open dashboard; concurrent polls share one snapshot
+TRAINING_QUEUE_STATUS_TTL = 0.5  # seconds
+_training_queue_status_cache = None  # (status, timestamp)
+_training_queue_status_lock = threading.Lock()
+
+def get_cached_queue_status():
+    """Return the training queue status, computing it at most once per TTL across concurrent polls"""
+    global _training_queue_status_cache
+    with _training_queue_status_lock:
+        if _training_queue_status_cache is not None:
+            status, timestamp = _training_queue_status_cache
+            if time.monotonic() - timestamp < TRAINING_QUEUE_STATUS_TTL:
+                record_cache_lookup('training_queue_status', hit=True)
+                return status
+        record_cache_lookup('training_queue_status', hit=False)
+        status = training_queue.get_queue_status()
+        _training_queue_status_cache = (status, time.monotonic())
+        return status
+
+def invalidate_queue_status_cache():
+    """Drop the cached queue status after a job is submitted or cancelled"""
+    global _training_queue_status_cache
+    _training_queue_status_cache = None
+
 @app.route('/api/training/queue', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def get_training_queue():
     """Get current training queue status"""
-    if not TRAINING_QUEUE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Training queue not available'}), 500
-    
     try:
-        queue_status = training_queue.get_queue_status()
+        queue_status = get_cached_queue_status()
         
         return jsonify({
             'success': True,
@@ -4961,9 +5589,28 @@ def get_training_queue():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get training queue: {e}")
+        logger.error("Failed to get training queue: %s", e)
         raise ValidationError(f'Failed to get training queue: {e}')
 
+# Sports accepted by the training, performance, backtest and data pipeline endpoints
+SUPPORTED_SPORTS = frozenset(('NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB'))
+
+# Accepted values for training job submissions
+TRAINING_JOB_MODEL_TYPES = frozenset(('lstm_weather', 'ensemble', 'neural', 'statistical'))
+
+# Training config defaults, overridden by any matching request fields
+TRAINING_CONFIG_DEFAULTS = MappingProxyType({
+    'epochs': 50,
+    'batch_size': 32,
+    'learning_rate': 0.001,
+    'optimizer': 'adam',
+    'validation_split': 0.2
+})
+TRAINING_CONFIG_NUMERIC_FIELDS = (('epochs', int), ('batch_size', int), ('learning_rate', float))
+
+# Characters replaced with '_' when deriving a model_id from a model name
+MODEL_ID_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
 @app.route('/api/training/submit', methods=['POST'])
 @handle_errors
 @require_authentication
@@ -4981,17 +5628,16 @@ def submit_training_job():
             model_type = data.get('model_type', 'neural')
             sport = data.get('sport', 'NBA')
             
-            if sport not in ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']:
+            if sport not in SUPPORTED_SPORTS:
                 raise ValidationError("Invalid sport", field='sport')
             
-            if model_type not in ['lstm_weather', 'ensemble', 'neural', 'statistical']:
+            if model_type not in TRAINING_JOB_MODEL_TYPES:
                 raise ValidationError("Invalid model type", field='model_type')
             
             # Generate demo job ID
-            import time
             demo_job_id = f"demo_job_{int(time.time())}"
             
-            logger.info(f"Demo training job {demo_job_id} simulated for user {user_id}")
+            logger.info("Demo training job %s simulated for user %s", demo_job_id, user_id)
             
             return jsonify({
                 'success': True,
@@ -5002,7 +5648,7 @@ def submit_training_job():
             }), 201
             
         except Exception as e:
-            logger.error(f"Demo training job submission failed: {e}")
+            logger.error("Demo training job submission failed: %s", e)
             raise ValidationError(f'Demo training job submission failed: {e}')
     
     
@@ -5015,25 +5661,20 @@ def submit_training_job():
         model_type = data.get('model_type')
         sport = data.get('sport')
         
-        if sport not in ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']:
+        if sport not in SUPPORTED_SPORTS:
             raise ValidationError("Invalid sport", field='sport')
         
-        if model_type not in ['lstm_weather', 'ensemble', 'neural', 'statistical']:
+        if model_type not in TRAINING_JOB_MODEL_TYPES:
             raise ValidationError("Invalid model type", field='model_type')
         
         # Generate model_id from model_name
-        import re
-        model_id = re.sub(r'[^a-zA-Z0-9_]', '_', model_name.lower()) if model_name else f"{sport.lower()}_{model_type}"
+        model_id = MODEL_ID_INVALID_CHARS.sub('_', model_name.lower()) if model_name else f"{sport.lower()}_{model_type}"
         
         # Build training configuration
-        training_config = {
-            'epochs': int(data.get('epochs', 50)),
-            'batch_size': int(data.get('batch_size', 32)),
-            'learning_rate': float(data.get('learning_rate', 0.001)),
-            'model_name': model_name or f"{sport}_{model_type}_model",
-            'optimizer': data.get('optimizer', 'adam'),
-            'validation_split': data.get('validation_split', 0.2)
-        }
+        training_config = {**TRAINING_CONFIG_DEFAULTS, **{key: data[key] for key in TRAINING_CONFIG_DEFAULTS if key in data}}
+        for field, cast in TRAINING_CONFIG_NUMERIC_FIELDS:
+            training_config[field] = cast(training_config[field])
+        training_config['model_name'] = model_name or f"{sport}_{model_type}_model"
         
         # Validate configuration
         if training_config['epochs'] < 1 or training_config['epochs'] > 200:
@@ -5050,8 +5691,9 @@ def submit_training_job():
             user_id=user_id,
             training_config=training_config
         )
+        invalidate_queue_status_cache()
         
-        logger.info(f"Training job {job_id} submitted by user {user_id}")
+        logger.info("Training job %s submitted by user %s", job_id, user_id)
         
         return jsonify({
             'success': True,
@@ -5063,47 +5705,44 @@ def submit_training_job():
     except ValueError as e:
         raise ValidationError(f"Invalid numeric value: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to submit training job: {e}")
+        logger.error("Failed to submit training job: %s", e)
         raise ValidationError(f'Failed to submit training job: {e}')
 
 @app.route('/api/training/job/<job_id>', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def get_training_job_status(job_id):
     """Get status of a specific training job"""
-    if not TRAINING_QUEUE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Training queue not available'}), 500
-    
     try:
         job_status = training_queue.get_job_status(job_id)
         
         if not job_status:
             raise ResourceNotFoundError('Training Job', job_id)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'job': job_status
         })
         
     except Exception as e:
-        logger.error(f"Failed to get job status: {e}")
+        logger.error("Failed to get job status: %s", e)
         raise ValidationError(f'Failed to get job status: {e}')
 
 @app.route('/api/training/job/<job_id>/cancel', methods=['POST'])
 @handle_errors
 @require_authentication
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def cancel_training_job(job_id):
     """Cancel a training job"""
-    if not TRAINING_QUEUE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Training queue not available'}), 500
-    
     try:
         success = training_queue.cancel_job(job_id)
         
         if not success:
             raise ResourceNotFoundError('Training Job', job_id)
+        invalidate_queue_status_cache()
         
-        logger.info(f"Training job {job_id} cancelled")
+        logger.info("Training job %s cancelled", job_id)
         
         return jsonify({
             'success': True,
@@ -5111,49 +5750,60 @@ def cancel_training_job(job_id):
         })
         
     except Exception as e:
-        logger.error(f"Failed to cancel job: {e}")
+        logger.error("Failed to cancel job: %s", e)
         raise ValidationError(f'Failed to cancel job: {e}')
 
 @app.route('/api/training/user-jobs', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def get_user_training_jobs():
     """Get all training jobs for the current user"""
-    if not TRAINING_QUEUE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Training queue not available'}), 500
-    
     try:
         user_id = g.current_user.get('user_id')
         user_jobs = training_queue.get_user_jobs(user_id)
         
-        return jsonify({
-            'success': True,
-            'jobs': user_jobs,
-            'total_jobs': len(user_jobs)
-        })
+        # Jobs are encoded one at a time so long histories never sit in a single buffer
+        def generate():
+            yield b'{"success":true,"jobs":['
+            for i, job in enumerate(user_jobs):
+                yield (b',' if i else b'') + encode_json(job)
+            yield b'],"total_jobs":%d}' % len(user_jobs)
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get user jobs: {e}")
+        logger.error("Failed to get user jobs: %s", e)
         raise ValidationError(f'Failed to get user jobs: {e}')
 
+GPU_STATS_MAX_AGE = 5  # seconds - utilization moves quickly and the endpoint is per-user
+
+GPU_STATS_DTYPE = np.dtype([
+    ('memory_gb', 'f8'),
+    ('memory_used_gb', 'f8'),
+    ('utilization_percent', 'f8')
+])
+
 @app.route('/api/training/gpu-stats', methods=['GET'])
 @handle_errors  
 @require_authentication
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def get_gpu_stats():
     """Get current GPU resource statistics"""
-    if not TRAINING_QUEUE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Training queue not available'}), 500
-    
     try:
-        queue_status = training_queue.get_queue_status()
+        queue_status = get_cached_queue_status()
         gpu_stats = queue_status['gpu_resources']
         
-        # Calculate aggregated stats
-        total_memory = sum(gpu['memory_gb'] for gpu in gpu_stats)
-        used_memory = sum(gpu['memory_used_gb'] for gpu in gpu_stats)
-        avg_utilization = sum(gpu['utilization_percent'] for gpu in gpu_stats) / len(gpu_stats) if gpu_stats else 0
+        # Calculate aggregated stats from a single pass over the GPU records
+        gpu_array = np.fromiter(
+            ((gpu['memory_gb'], gpu['memory_used_gb'], gpu['utilization_percent']) for gpu in gpu_stats),
+            dtype=GPU_STATS_DTYPE, count=len(gpu_stats)
+        )
+        total_memory = float(gpu_array['memory_gb'].sum())
+        used_memory = float(gpu_array['memory_used_gb'].sum())
+        avg_utilization = float(gpu_array['utilization_percent'].mean()) if gpu_stats else 0
         
-        return jsonify({
+        return cacheable_response(ojsonify({
             'success': True,
             'gpu_stats': {
                 'individual_gpus': gpu_stats,
@@ -5165,10 +5815,10 @@ def get_gpu_stats():
                 'average_gpu_utilization': avg_utilization,
                 'active_training_jobs': queue_status['active_jobs']
             }
-        })
+        }), GPU_STATS_MAX_AGE, public=False)
         
     except Exception as e:
-        logger.error(f"Failed to get GPU stats: {e}")
+        logger.error("Failed to get GPU stats: %s", e)
         raise ValidationError(f'Failed to get GPU stats: {e}')
 
 # --- PERFORMANCE MATRIX ENDPOINTS ---
@@ -5176,45 +5826,43 @@ def get_gpu_stats():
 @app.route('/api/performance/matrix', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def get_performance_matrix():
     """Get model performance comparison matrix"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
         sport = request.args.get('sport')
         model_type = request.args.get('model_type')
         days_back = int(request.args.get('days_back', 30))
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
         # Get performance matrix as DataFrame
         matrix_df = performance_matrix.get_performance_matrix(sport, model_type, days_back)
         
         if matrix_df.empty:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'matrix': [],
                 'message': 'No performance data found for the specified criteria'
             })
         
-        # Convert DataFrame to list of dictionaries
+        # Convert DataFrame to list of dictionaries - encode_json keeps jsonify's date and float formats
         matrix_data = matrix_df.to_dict('records')
         
-        # Get summary statistics
+        # Get summary statistics with one aggregation pass over the numeric columns
+        stats = matrix_df[['Accuracy', 'ROI %']].agg(['mean', 'max'])
         summary = {
             'total_models': len(matrix_df),
-            'avg_accuracy': float(matrix_df['Accuracy'].mean()),
-            'best_accuracy': float(matrix_df['Accuracy'].max()),
-            'avg_roi': float(matrix_df['ROI %'].mean()),
-            'best_roi': float(matrix_df['ROI %'].max()),
-            'sports_covered': list(matrix_df['Sport'].unique()),
-            'model_types_covered': list(matrix_df['Model Type'].unique())
+            'avg_accuracy': float(stats.at['mean', 'Accuracy']),
+            'best_accuracy': float(stats.at['max', 'Accuracy']),
+            'avg_roi': float(stats.at['mean', 'ROI %']),
+            'best_roi': float(stats.at['max', 'ROI %']),
+            'sports_covered': matrix_df['Sport'].unique().tolist(),
+            'model_types_covered': matrix_df['Model Type'].unique().tolist()
         }
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'matrix': matrix_data,
             'summary': summary,
@@ -5226,18 +5874,16 @@ def get_performance_matrix():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get performance matrix: {e}")
+        logger.error("Failed to get performance matrix: %s", e)
         raise ValidationError(f'Failed to get performance matrix: {e}')
 
 @app.route('/api/performance/compare', methods=['POST'])
 @handle_errors
 @require_authentication
 @sanitize_request_data(required_fields=['model_ids'])
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def compare_models():
     """Compare specific models side by side"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
         data = g.sanitized_request_data
         model_ids = data.get('model_ids', [])
@@ -5249,12 +5895,11 @@ def compare_models():
             raise ValidationError("Maximum 10 models can be compared at once")
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
         comparison_data = performance_matrix.get_model_comparison(model_ids)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'comparison': comparison_data,
             'models_found': len(comparison_data),
@@ -5262,48 +5907,62 @@ def compare_models():
         })
         
     except Exception as e:
-        logger.error(f"Failed to compare models: {e}")
+        logger.error("Failed to compare models: %s", e)
         raise ValidationError(f'Failed to compare models: {e}')
 
+MODEL_COMPARISON_DATA_MAX_AGE = 300  # seconds
+
 @app.route('/api/models/comparison-data', methods=['GET'])
 @handle_errors
 def get_model_comparison_data():
     """Get comprehensive model comparison data for the comparison modal"""
     try:
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
-        # Get all available models for selection
-        all_models = []
+        # Group to the first entry seen per model - duplicates cost one hash probe
         model_lookup = {}
-        
         for entry in performance_matrix.performance_data:
-            if entry.model_id not in model_lookup:
-                model_lookup[entry.model_id] = entry
-                all_models.append({
-                    'model_id': entry.model_id,
-                    'display_name': f"{entry.sport} {entry.model_type.replace('_', ' ').title()} v{entry.version}",
-                    'sport': entry.sport,
-                    'model_type': entry.model_type,
-                    'version': entry.version,
-                    'accuracy': round(entry.accuracy * 100, 1),
-                    'training_date': entry.training_date.strftime('%Y-%m-%d'),
-                    'evaluation_date': entry.evaluation_date.strftime('%Y-%m-%d')
-                })
-        
-        # Sort by sport then by accuracy descending
-        all_models.sort(key=lambda x: (x['sport'], -x['accuracy']))
+            model_lookup.setdefault(entry.model_id, entry)
         
-        return jsonify({
+        # Sort by sport then by accuracy descending, formatting only the kept entries
+        entries = sorted(model_lookup.values(), key=lambda e: (e.sport, -round(e.accuracy * 100, 1)))
+        all_models = [
+            {
+                'model_id': entry.model_id,
+                'display_name': f"{entry.sport} {entry.model_type.replace('_', ' ').title()} v{entry.version}",
+                'sport': entry.sport,
+                'model_type': entry.model_type,
+                'version': entry.version,
+                'accuracy': round(entry.accuracy * 100, 1),
+                'training_date': format_date(entry.training_date),
+                'evaluation_date': format_date(entry.evaluation_date)
+            }
+            for entry in entries
+        ]
+        
+        return cacheable_response(ojsonify({
             'success': True,
             'available_models': all_models,
             'total_models': len(all_models)
-        })
+        }), MODEL_COMPARISON_DATA_MAX_AGE)
         
     except Exception as e:
-        logger.error(f"Failed to get model comparison data: {e}")
-        return jsonify({'success': False, 'message': f'Failed to get model data: {e}'}), 500
+        logger.error("Failed to get model comparison data: %s", e)
+        return ojsonify({'success': False, 'message': f'Failed to get model data: {e}'}), 500
+
+# Metric fields reported per model with their display scale and rounding precision
+PERFORMANCE_METRIC_FIELDS = attrgetter(
+    'accuracy', 'precision', 'recall', 'f1_score', 'roi_percentage',
+    'sharpe_ratio', 'max_drawdown', 'win_rate', 'profit_loss'
+)
+PERFORMANCE_METRIC_SCALE = np.array([100, 100, 100, 100, 1, 1, 1, 100, 1], dtype=float)
+PERFORMANCE_METRIC_PRECISION = 10.0 ** np.array([1, 1, 1, 1, 1, 2, 1, 1, 2])
+
+def round_performance_metrics(entry) -> list:
+    """Scale and round an entry's metric fields in one vectorized pass"""
+    values = np.array(PERFORMANCE_METRIC_FIELDS(entry), dtype=float) * PERFORMANCE_METRIC_SCALE
+    return (np.round(values * PERFORMANCE_METRIC_PRECISION) / PERFORMANCE_METRIC_PRECISION).tolist()
 
 @app.route('/api/models/detailed-comparison', methods=['POST'])
 @handle_errors
@@ -5318,19 +5977,18 @@ def get_detailed_model_comparison():
             raise ValidationError("Exactly 2 model IDs required for detailed comparison")
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
         comparison_result = {}
         
         for model_id in model_ids:
-            # Find the model entry
-            model_entries = [entry for entry in performance_matrix.performance_data if entry.model_id == model_id]
+            # Find the model entries through the per-model index
+            model_entries = performance_matrix.entries_by_model.get(model_id)
             
             if not model_entries:
                 continue
                 
-            latest_entry = max(model_entries, key=lambda x: x.evaluation_date)
+            latest_entry = performance_matrix.latest_by_model[model_id]
             
             # Get model architecture details
             architecture_info = get_model_architecture_info(latest_entry.model_type, latest_entry.parameters)
@@ -5344,6 +6002,9 @@ def get_detailed_model_comparison():
             # Performance trends (simulate historical data)
             performance_trends = generate_performance_trends(latest_entry, len(model_entries))
             
+            (accuracy, precision, recall, f1_score, roi_percentage,
+             sharpe_ratio, max_drawdown, win_rate, profit_loss) = round_performance_metrics(latest_entry)
+            
             comparison_result[model_id] = {
                 'basic_info': {
                     'model_id': model_id,
@@ -5354,17 +6015,17 @@ def get_detailed_model_comparison():
                     'tags': latest_entry.tags
                 },
                 'performance_metrics': {
-                    'accuracy': round(latest_entry.accuracy * 100, 1),
-                    'precision': round(latest_entry.precision * 100, 1),
-                    'recall': round(latest_entry.recall * 100, 1),
-                    'f1_score': round(latest_entry.f1_score * 100, 1),
-                    'roi_percentage': round(latest_entry.roi_percentage, 1),
-                    'sharpe_ratio': round(latest_entry.sharpe_ratio, 2),
-                    'max_drawdown': round(latest_entry.max_drawdown, 1),
-                    'win_rate': round(latest_entry.win_rate * 100, 1),
+                    'accuracy': accuracy,
+                    'precision': precision,
+                    'recall': recall,
+                    'f1_score': f1_score,
+                    'roi_percentage': roi_percentage,
+                    'sharpe_ratio': sharpe_ratio,
+                    'max_drawdown': max_drawdown,
+                    'win_rate': win_rate,
                     'total_predictions': latest_entry.total_predictions,
                     'correct_predictions': latest_entry.correct_predictions,
-                    'profit_loss': round(latest_entry.profit_loss, 2)
+                    'profit_loss': profit_loss
                 },
                 'architecture': architecture_info,
                 'training_data': training_info,
@@ -5373,78 +6034,166 @@ def get_detailed_model_comparison():
                 'parameters': latest_entry.parameters
             }
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'comparison': comparison_result,
             'models_compared': len(comparison_result)
         })
         
     except Exception as e:
-        logger.error(f"Failed to get detailed comparison: {e}")
+        logger.error("Failed to get detailed comparison: %s", e)
         raise ValidationError(f'Failed to get detailed comparison: {e}')
 
 
+MODEL_ARCHITECTURES = MappingProxyType({
+    'lstm_weather': {
+        'type': 'Recurrent Neural Network (LSTM)',
+        'description': 'Long Short-Term Memory network with weather integration',
+        'layers': (
+            'Input Layer (Features + Weather)',
+            'LSTM Layer with Dropout',
+            'Dense Layer (Fully Connected)',
+            'Output Layer (Probability)'
+        ),
+        'strengths': ('Temporal patterns', 'Weather correlation', 'Sequence modeling'),
+        'optimal_for': ('Weather-dependent sports', 'Time series patterns', 'NFL/MLB outdoor games')
+    },
+    'ensemble': {
+        'type': 'Ensemble Method',
+        'description': 'Combines multiple base models for improved prediction',
+        'layers': (
+            'Base Model 1 (Random Forest)',
+            'Base Model 2 (XGBoost)',
+            'Base Model 3 (Neural Network)',
+            'Meta-Learner (Voting/Stacking)'
+        ),
+        'strengths': ('High accuracy', 'Reduced overfitting', 'Robust predictions'),
+        'optimal_for': ('Complex patterns', 'High-stakes predictions', 'Tournament play')
+    },
+    'neural': {
+        'type': 'Deep Neural Network',
+        'description': 'Multi-layer feedforward neural network',
+        'layers': (
+            'Input Layer (Features)',
+            'Hidden Layer 1 ({neurons} neurons)',
+            'Hidden Layer 2 ({neurons} neurons)',
+            'Output Layer (Probability)'
+        ),
+        'strengths': ('Pattern recognition', 'Non-linear relationships', 'Feature learning'),
+        'optimal_for': ('Complex data patterns', 'Large datasets', 'Feature interactions')
+    },
+    'statistical': {
+        'type': 'Statistical Model',
+        'description': 'Traditional statistical approach with feature engineering',
+        'layers': (
+            'Feature Engineering',
+            'Statistical Analysis',
+            'Linear/Logistic Regression',
+            'Probability Output'
+        ),
+        'strengths': ('Interpretability', 'Fast training', 'Stable performance'),
+        'optimal_for': ('Simple patterns', 'Limited data', 'Baseline models')
+    }
+})
+
+UNKNOWN_MODEL_ARCHITECTURE = MappingProxyType({
+    'type': 'Unknown Model Type',
+    'description': 'Architecture information not available',
+    'layers': ('Input', 'Processing', 'Output'),
+    'strengths': ('Unknown',),
+    'optimal_for': ('General prediction',)
+})
+
+TRAINING_PERIODS = MappingProxyType({
+    'NBA': {'games_per_season': 82, 'season_months': 8, 'seasons_used': 3},
+    'NFL': {'games_per_season': 17, 'season_months': 6, 'seasons_used': 5},
+    'MLB': {'games_per_season': 162, 'season_months': 6, 'seasons_used': 3},
+    'NCAAF': {'games_per_season': 12, 'season_months': 4, 'seasons_used': 4},
+    'NCAAB': {'games_per_season': 35, 'season_months': 6, 'seasons_used': 3}
+})
+
+WEATHER_DEPENDENT_SPORTS = frozenset(('NFL', 'MLB', 'NCAAF'))
+
+# Pre-drawn demo data-quality percentages, cycled instead of sampled per call
+DATA_QUALITY_POOL_SIZE = 4096
+DATA_COMPLETENESS_POOL = [f"{v}%" for v in np.random.randint(92, 99, size=DATA_QUALITY_POOL_SIZE)]
+DATA_ACCURACY_POOL = [f"{v}%" for v in np.random.randint(95, 99, size=DATA_QUALITY_POOL_SIZE)]
+_data_quality_draws = itertools.count()
+
+MODEL_INPUT_FEATURES = MappingProxyType({
+    'NBA': (
+        'Team Offensive Rating', 'Team Defensive Rating', 'Pace Factor',
+        'Field Goal %', 'Three Point %', 'Free Throw %',
+        'Rebounds per Game', 'Assists per Game', 'Turnovers per Game',
+        'Home/Away Indicator', 'Rest Days', 'Back-to-Back Games',
+        'Head-to-Head Record', 'Current Win Streak', 'Recent Form (L10)'
+    ),
+    'NFL': (
+        'Passing Yards per Game', 'Rushing Yards per Game', 'Points per Game',
+        'Passing Yards Allowed', 'Rushing Yards Allowed', 'Points Allowed',
+        'Turnover Differential', 'Red Zone Efficiency', 'Third Down %',
+        'Home/Away Indicator', 'Division Opponent', 'Rest Days',
+        'Strength of Schedule', 'Injury Report Impact', 'Head-to-Head Record'
+    ),
+    'MLB': (
+        'Team ERA', 'Team Batting Average', 'On-Base Percentage',
+        'Slugging Percentage', 'Runs per Game', 'Runs Allowed per Game',
+        'Home/Away Indicator', 'Starting Pitcher ERA', 'Bullpen ERA',
+        'Recent Form (L10)', 'Head-to-Head Record', 'Divisional Matchup',
+        'Rest Days', 'Ballpark Factor', 'Team Streak'
+    ),
+    'NCAAF': (
+        'Points per Game', 'Points Allowed per Game', 'Yards per Play',
+        'Yards Allowed per Play', 'Turnover Margin', 'Red Zone %',
+        'Home/Away Indicator', 'Conference Opponent', 'Ranking Differential',
+        'Strength of Schedule', 'Recent Form', 'Head-to-Head Record',
+        'Bye Week Advantage', 'Coaching Experience', 'Recruiting Ranking'
+    ),
+    'NCAAB': (
+        'Adjusted Offensive Efficiency', 'Adjusted Defensive Efficiency',
+        'Effective Field Goal %', 'Turnover %', 'Offensive Rebound %',
+        'Free Throw Rate', 'Home/Away Indicator', 'Conference Opponent',
+        'NET Ranking', 'Strength of Schedule', 'Recent Form (L10)',
+        'Head-to-Head Record', 'Coaching Experience', 'Key Player Injuries'
+    )
+})
+
+WEATHER_INPUT_FEATURES = (
+    'Temperature (°F)', 'Humidity (%)', 'Wind Speed (mph)',
+    'Wind Direction', 'Precipitation (%)', 'Barometric Pressure',
+    'Weather Condition Category'
+)
+
+ENSEMBLE_INPUT_FEATURES = (
+    'Historical Performance vs Similar Teams',
+    'Momentum Indicators', 'Fatigue Metrics',
+    'Situational Performance', 'Clutch Performance Rating'
+)
+
+
 def get_model_architecture_info(model_type: str, parameters: dict) -> dict:
     """Get detailed architecture information for a model type"""
-    base_architectures = {
-        'lstm_weather': {
-            'type': 'Recurrent Neural Network (LSTM)',
-            'description': 'Long Short-Term Memory network with weather integration',
-            'layers': [
-                'Input Layer (Features + Weather)',
-                'LSTM Layer with Dropout',
-                'Dense Layer (Fully Connected)',
-                'Output Layer (Probability)'
-            ],
-            'strengths': ['Temporal patterns', 'Weather correlation', 'Sequence modeling'],
-            'optimal_for': ['Weather-dependent sports', 'Time series patterns', 'NFL/MLB outdoor games']
-        },
-        'ensemble': {
-            'type': 'Ensemble Method',
-            'description': 'Combines multiple base models for improved prediction',
-            'layers': [
-                'Base Model 1 (Random Forest)',
-                'Base Model 2 (XGBoost)',
-                'Base Model 3 (Neural Network)',
-                'Meta-Learner (Voting/Stacking)'
-            ],
-            'strengths': ['High accuracy', 'Reduced overfitting', 'Robust predictions'],
-            'optimal_for': ['Complex patterns', 'High-stakes predictions', 'Tournament play']
-        },
-        'neural': {
-            'type': 'Deep Neural Network',
-            'description': 'Multi-layer feedforward neural network',
-            'layers': [
-                'Input Layer (Features)',
-                f"Hidden Layer 1 ({parameters.get('neurons_per_layer', 64)} neurons)",
-                f"Hidden Layer 2 ({parameters.get('neurons_per_layer', 64)} neurons)",
-                'Output Layer (Probability)'
-            ],
-            'strengths': ['Pattern recognition', 'Non-linear relationships', 'Feature learning'],
-            'optimal_for': ['Complex data patterns', 'Large datasets', 'Feature interactions']
-        },
-        'statistical': {
-            'type': 'Statistical Model',
-            'description': 'Traditional statistical approach with feature engineering',
-            'layers': [
-                'Feature Engineering',
-                'Statistical Analysis',
-                'Linear/Logistic Regression',
-                'Probability Output'
-            ],
-            'strengths': ['Interpretability', 'Fast training', 'Stable performance'],
-            'optimal_for': ['Simple patterns', 'Limited data', 'Baseline models']
-        }
+    try:
+        return _model_architecture_info(model_type, frozenset(parameters.items()))
+    except TypeError:
+        # Unhashable parameter values - build without the cache
+        return _model_architecture_info.__wrapped__(model_type, parameters.items())
+
+
+@lru_cache(maxsize=256)
+def _model_architecture_info(model_type: str, parameter_items) -> dict:
+    """Build the architecture dict for a model type and its parameter items"""
+    parameters = dict(parameter_items)
+    base = MODEL_ARCHITECTURES.get(model_type, UNKNOWN_MODEL_ARCHITECTURE)
+    neurons = parameters.get('neurons_per_layer', 64)
+    architecture = {
+        'type': base['type'],
+        'description': base['description'],
+        'layers': [layer.format(neurons=neurons) for layer in base['layers']],
+        'strengths': list(base['strengths']),
+        'optimal_for': list(base['optimal_for'])
     }
     
-    architecture = base_architectures.get(model_type, {
-        'type': 'Unknown Model Type',
-        'description': 'Architecture information not available',
-        'layers': ['Input', 'Processing', 'Output'],
-        'strengths': ['Unknown'],
-        'optimal_for': ['General prediction']
-    })
-    
     # Add parameter-specific details
     if model_type == 'lstm_weather':
         architecture['parameter_details'] = {
@@ -5464,7 +6213,7 @@ def get_model_architecture_info(model_type: str, parameters: dict) -> dict:
     elif model_type == 'neural':
         architecture['parameter_details'] = {
             'Hidden Layers': parameters.get('hidden_layers', 2),
-            'Neurons per Layer': parameters.get('neurons_per_layer', 64),
+            'Neurons per Layer': neurons,
             'Activation Function': parameters.get('activation', 'relu').upper(),
             'Batch Size': parameters.get('batch_size', 32),
             'Training Epochs': parameters.get('epochs', 100)
@@ -5479,24 +6228,18 @@ def get_model_architecture_info(model_type: str, parameters: dict) -> dict:
     return architecture
 
 
+@lru_cache(maxsize=256)
 def get_training_data_info(sport: str, training_date: datetime) -> dict:
     """Get information about training data timeframe and sources"""
     # Calculate training period based on sport
-    training_periods = {
-        'NBA': {'games_per_season': 82, 'season_months': 8, 'seasons_used': 3},
-        'NFL': {'games_per_season': 17, 'season_months': 6, 'seasons_used': 5},
-        'MLB': {'games_per_season': 162, 'season_months': 6, 'seasons_used': 3},
-        'NCAAF': {'games_per_season': 12, 'season_months': 4, 'seasons_used': 4},
-        'NCAAB': {'games_per_season': 35, 'season_months': 6, 'seasons_used': 3}
-    }
-    
-    sport_info = training_periods.get(sport, training_periods['NBA'])
+    sport_info = TRAINING_PERIODS.get(sport, TRAINING_PERIODS['NBA'])
     
     # Calculate data timeframe
     end_date = training_date
     start_date = end_date - timedelta(days=sport_info['seasons_used'] * 365)
     
     total_games = sport_info['games_per_season'] * sport_info['seasons_used'] * 30  # Assume 30 teams
+    draw = next(_data_quality_draws) % DATA_QUALITY_POOL_SIZE
     
     return {
         'training_period': {
@@ -5517,78 +6260,32 @@ def get_training_data_info(sport: str, training_date: datetime) -> dict:
             'Player statistics',
             'Historical matchup data',
             'Venue information',
-            'Weather data (if applicable)' if sport in ['NFL', 'MLB', 'NCAAF'] else None
+            'Weather data (if applicable)' if sport in WEATHER_DEPENDENT_SPORTS else None
         ],
         'data_quality': {
-            'completeness': f"{np.random.randint(92, 99)}%",
-            'accuracy': f"{np.random.randint(95, 99)}%",
+            'completeness': DATA_COMPLETENESS_POOL[draw],
+            'accuracy': DATA_ACCURACY_POOL[draw],
             'recency': 'Updated after each game',
             'validation': 'Cross-validated on holdout set'
         }
     }
 
 
-def get_model_input_features(sport: str, model_type: str) -> dict:
-    """Get the input feature matrix for a model"""
-    base_features = {
-        'NBA': [
-            'Team Offensive Rating', 'Team Defensive Rating', 'Pace Factor',
-            'Field Goal %', 'Three Point %', 'Free Throw %',
-            'Rebounds per Game', 'Assists per Game', 'Turnovers per Game',
-            'Home/Away Indicator', 'Rest Days', 'Back-to-Back Games',
-            'Head-to-Head Record', 'Current Win Streak', 'Recent Form (L10)'
-        ],
-        'NFL': [
-            'Passing Yards per Game', 'Rushing Yards per Game', 'Points per Game',
-            'Passing Yards Allowed', 'Rushing Yards Allowed', 'Points Allowed',
-            'Turnover Differential', 'Red Zone Efficiency', 'Third Down %',
-            'Home/Away Indicator', 'Division Opponent', 'Rest Days',
-            'Strength of Schedule', 'Injury Report Impact', 'Head-to-Head Record'
-        ],
-        'MLB': [
-            'Team ERA', 'Team Batting Average', 'On-Base Percentage',
-            'Slugging Percentage', 'Runs per Game', 'Runs Allowed per Game',
-            'Home/Away Indicator', 'Starting Pitcher ERA', 'Bullpen ERA',
-            'Recent Form (L10)', 'Head-to-Head Record', 'Divisional Matchup',
-            'Rest Days', 'Ballpark Factor', 'Team Streak'
-        ],
-        'NCAAF': [
-            'Points per Game', 'Points Allowed per Game', 'Yards per Play',
-            'Yards Allowed per Play', 'Turnover Margin', 'Red Zone %',
-            'Home/Away Indicator', 'Conference Opponent', 'Ranking Differential',
-            'Strength of Schedule', 'Recent Form', 'Head-to-Head Record',
-            'Bye Week Advantage', 'Coaching Experience', 'Recruiting Ranking'
-        ],
-        'NCAAB': [
-            'Adjusted Offensive Efficiency', 'Adjusted Defensive Efficiency',
-            'Effective Field Goal %', 'Turnover %', 'Offensive Rebound %',
-            'Free Throw Rate', 'Home/Away Indicator', 'Conference Opponent',
-            'NET Ranking', 'Strength of Schedule', 'Recent Form (L10)',
-            'Head-to-Head Record', 'Coaching Experience', 'Key Player Injuries'
-        ]
-    }
-    
-    sport_features = base_features.get(sport, base_features['NBA'])
+def build_model_input_features(sport: str, model_type: str) -> dict:
+    """Assemble the input feature matrix for a sport and model type"""
+    sport_features = MODEL_INPUT_FEATURES[sport]
     
     # Add weather features for weather-dependent models
-    weather_features = []
-    if model_type == 'lstm_weather' and sport in ['NFL', 'MLB', 'NCAAF']:
-        weather_features = [
-            'Temperature (°F)', 'Humidity (%)', 'Wind Speed (mph)',
-            'Wind Direction', 'Precipitation (%)', 'Barometric Pressure',
-            'Weather Condition Category'
-        ]
+    weather_features = ()
+    if model_type == 'lstm_weather' and sport in WEATHER_DEPENDENT_SPORTS:
+        weather_features = WEATHER_INPUT_FEATURES
     
     # Add advanced features for ensemble models
-    advanced_features = []
+    advanced_features = ()
     if model_type == 'ensemble':
-        advanced_features = [
-            'Historical Performance vs Similar Teams',
-            'Momentum Indicators', 'Fatigue Metrics',
-            'Situational Performance', 'Clutch Performance Rating'
-        ]
+        advanced_features = ENSEMBLE_INPUT_FEATURES
     
-    all_features = sport_features + weather_features + advanced_features
+    all_features = list(sport_features + weather_features + advanced_features)
     
     return {
         'total_features': len(all_features),
@@ -5610,64 +6307,80 @@ def get_model_input_features(sport: str, model_type: str) -> dict:
 
 def generate_feature_importance(features: list) -> dict:
     """Generate mock feature importance scores"""
-    importance_scores = {}
-    
     # Generate realistic importance scores that sum to 100%
     scores = np.random.dirichlet(np.ones(len(features))) * 100
-    
-    for i, feature in enumerate(features):
-        importance_scores[feature] = round(scores[i], 1)
-    
-    return importance_scores
+    return dict(zip(features, np.round(scores, 1).tolist()))
+
+
+# Every known (sport, model type) feature matrix, assembled once at import
+MODEL_INPUT_FEATURE_SETS = MappingProxyType({
+    (sport, model_type): build_model_input_features(sport, model_type)
+    for sport in MODEL_INPUT_FEATURES
+    for model_type in TRAINING_JOB_MODEL_TYPES
+})
+
+
+def get_model_input_features(sport: str, model_type: str) -> dict:
+    """Get the input feature matrix for a model"""
+    if sport not in MODEL_INPUT_FEATURES:
+        sport = 'NBA'
+    if model_type not in TRAINING_JOB_MODEL_TYPES:
+        model_type = 'statistical'  # No weather or advanced features
+    return MODEL_INPUT_FEATURE_SETS[(sport, model_type)]
 
 
 def generate_performance_trends(entry, num_points: int = 10) -> dict:
     """Generate performance trends over time"""
-    dates = []
-    accuracies = []
-    rois = []
-    
-    # Generate dates going backwards from evaluation date
-    for i in range(num_points):
-        date = entry.evaluation_date - timedelta(days=i*7)  # Weekly intervals
-        dates.append(date.strftime('%Y-%m-%d'))
-        
-        # Generate realistic trends around the actual performance
-        accuracy_noise = np.random.normal(0, 0.02)
-        accuracy = max(0.4, min(0.9, entry.accuracy + accuracy_noise))
-        accuracies.append(round(accuracy * 100, 1))
-        
-        roi_noise = np.random.normal(0, 1.5)
-        roi = entry.roi_percentage + roi_noise
-        rois.append(round(roi, 1))
+    # Weekly points going back from the evaluation date, oldest first
+    weeks_back = np.arange(num_points - 1, -1, -1)
+    dates = (np.datetime64(entry.evaluation_date, 'D') - weeks_back * np.timedelta64(7, 'D')).astype(str).tolist()
     
-    # Reverse to chronological order
-    dates.reverse()
-    accuracies.reverse()
-    rois.reverse()
+    # Generate realistic trends around the actual performance
+    accuracies = np.round(np.clip(entry.accuracy + np.random.normal(0, 0.02, num_points), 0.4, 0.9) * 100, 1)
+    rois = np.round(entry.roi_percentage + np.random.normal(0, 1.5, num_points), 1)
+    accuracy_std = accuracies.std()
     
     return {
         'dates': dates,
-        'accuracy_trend': accuracies,
-        'roi_trend': rois,
+        'accuracy_trend': accuracies.tolist(),
+        'roi_trend': rois.tolist(),
         'trend_analysis': {
             'accuracy_direction': 'improving' if accuracies[-1] > accuracies[0] else 'declining',
             'roi_direction': 'improving' if rois[-1] > rois[0] else 'declining',
-            'volatility': 'low' if np.std(accuracies) < 2 else 'moderate' if np.std(accuracies) < 4 else 'high',
-            'consistency_score': round(100 - (np.std(accuracies) / np.mean(accuracies) * 100), 1)
+            'volatility': 'low' if accuracy_std < 2 else 'moderate' if accuracy_std < 4 else 'high',
+            'consistency_score': round(float(100 - (accuracy_std / accuracies.mean() * 100)), 1)
         }
     }
 
+# Read-only performance views, cached as encoded bodies; keys include the entry count
+# so new performance entries invalidate them
+PERFORMANCE_VIEW_CACHE_TTL = 60  # seconds
+PERFORMANCE_VIEW_CACHE_MAX_ENTRIES = 256
+_performance_view_cache = {}  # key -> (body, timestamp)
+
+def cached_performance_view(key, build):
+    """Return the encoded JSON body for a performance view, rebuilding it at most once per TTL"""
+    key = key + (len(performance_matrix.performance_data),)
+    cached = _performance_view_cache.get(key)
+    if cached is not None and time.time() - cached[1] < PERFORMANCE_VIEW_CACHE_TTL:
+        record_cache_lookup('performance_view', hit=True)
+        return cached[0]
+    record_cache_lookup('performance_view', hit=False)
+    body = encode_json(build())
+    if len(_performance_view_cache) >= PERFORMANCE_VIEW_CACHE_MAX_ENTRIES:
+        _performance_view_cache.clear()
+    _performance_view_cache[key] = (body, time.time())
+    return body
+
 @app.route('/api/performance/leaderboard/<sport>', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def get_sport_leaderboard(sport):
     """Get performance leaderboard for a specific sport"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
-        if sport.upper() not in ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']:
+        sport = sport.upper()
+        if sport not in SUPPORTED_SPORTS:
             raise ValidationError("Invalid sport")
         
         limit = int(request.args.get('limit', 10))
@@ -5675,116 +6388,136 @@ def get_sport_leaderboard(sport):
             limit = 10
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
-        leaderboard = performance_matrix.get_sport_leaderboard(sport.upper(), limit)
+        def build():
+            leaderboard = performance_matrix.get_sport_leaderboard(sport, limit)
+            return {
+                'success': True,
+                'leaderboard': leaderboard,
+                'sport': sport,
+                'total_entries': len(leaderboard)
+            }
         
-        return jsonify({
-            'success': True,
-            'leaderboard': leaderboard,
-            'sport': sport.upper(),
-            'total_entries': len(leaderboard)
-        })
+        body = cached_performance_view(('leaderboard', sport, limit), build)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get sport leaderboard: {e}")
+        logger.error("Failed to get sport leaderboard: %s", e)
         raise ValidationError(f'Failed to get sport leaderboard: {e}')
 
 @app.route('/api/performance/model-types', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def get_model_type_analysis():
     """Get performance analysis by model type"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
-        analysis = performance_matrix.get_model_type_analysis()
+        def build():
+            analysis = performance_matrix.get_model_type_analysis()
+            return {
+                'success': True,
+                'analysis': analysis,
+                'model_types_analyzed': len(analysis)
+            }
         
-        return jsonify({
-            'success': True,
-            'analysis': analysis,
-            'model_types_analyzed': len(analysis)
-        })
+        body = cached_performance_view(('model_types',), build)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get model type analysis: {e}")
+        logger.error("Failed to get model type analysis: %s", e)
         raise ValidationError(f'Failed to get model type analysis: {e}')
 
 @app.route('/api/performance/parameters', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def get_parameter_effectiveness():
     """Analyze parameter effectiveness across models"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
         model_type = request.args.get('model_type')
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
-        parameter_analysis = performance_matrix.get_parameter_effectiveness(model_type)
+        def build():
+            parameter_analysis = performance_matrix.get_parameter_effectiveness(model_type)
+            return {
+                'success': True,
+                'parameter_analysis': parameter_analysis,
+                'model_type_filter': model_type,
+                'parameters_analyzed': len(parameter_analysis)
+            }
         
-        return jsonify({
-            'success': True,
-            'parameter_analysis': parameter_analysis,
-            'model_type_filter': model_type,
-            'parameters_analyzed': len(parameter_analysis)
-        })
+        body = cached_performance_view(('parameters', model_type), build)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get parameter effectiveness: {e}")
+        logger.error("Failed to get parameter effectiveness: %s", e)
         raise ValidationError(f'Failed to get parameter effectiveness: {e}')
 
 @app.route('/api/performance/trending', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PERFORMANCE_MATRIX_AVAILABLE, 'Performance matrix')
 def get_trending_models():
     """Get models with improving performance trends"""
-    if not PERFORMANCE_MATRIX_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Performance matrix not available'}), 500
-    
     try:
         days = int(request.args.get('days', 7))
         if days < 1 or days > 30:
             days = 7
         
         # Generate demo data if empty
-        if not performance_matrix.performance_data:
-            performance_matrix.generate_demo_data()
+        performance_matrix.ensure_demo_data()
         
-        trending_models = performance_matrix.get_trending_models(days)
+        def build():
+            trending_models = performance_matrix.get_trending_models(days)
+            return {
+                'success': True,
+                'trending_models': trending_models,
+                'analysis_period_days': days,
+                'total_trending': len(trending_models)
+            }
         
-        return jsonify({
-            'success': True,
-            'trending_models': trending_models,
-            'analysis_period_days': days,
-            'total_trending': len(trending_models)
-        })
+        body = cached_performance_view(('trending', days), build)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get trending models: {e}")
+        logger.error("Failed to get trending models: %s", e)
         raise ValidationError(f'Failed to get trending models: {e}')
 
 # --- SPORT-SPECIFIC MODEL ENDPOINTS ---
 
+@lru_cache(maxsize=64)
+def sport_model_enums(sport: str, model_type: str):
+    """Coerce sport and model type strings to their sport_models enums, raising ValueError if unknown"""
+    return Sport(sport.upper()), ModelType(model_type.lower())
+
+@lru_cache(maxsize=64)
+def render_sport_model_features(sport_enum, model_type_enum) -> bytes:
+    """Encode the feature and architecture description for a sport/model type pair once"""
+    features = ModelConfig.get_features_for_sport(sport_enum, model_type_enum)
+    return encode_json({
+        'success': True,
+        'sport': sport_enum.value,
+        'model_type': model_type_enum.value,
+        'features': features,
+        'feature_count': len(features),
+        'architecture': ModelConfig.get_model_architecture(sport_enum, model_type_enum),
+        'weather_dependent': model_type_enum == ModelType.LSTM_WEATHER,
+        'supports_time_series': model_type_enum == ModelType.LSTM_WEATHER
+    })
+
 @app.route('/api/models/create-sport-model', methods=['POST'])
 @handle_errors
 @require_authentication
 @sanitize_request_data(required_fields=['sport', 'model_type'], optional_fields=['model_name'])
+@require_feature(SPORT_MODELS_AVAILABLE, 'Sport models')
 def create_sport_specific_model():
     """Create a new sport-specific model"""
-    if not SPORT_MODELS_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Sport models not available'}), 500
-    
     try:
         data = g.sanitized_request_data
         user_id = g.current_user.get('user_id')
@@ -5795,13 +6528,12 @@ def create_sport_specific_model():
         
         # Validate inputs
         try:
-            sport = Sport(sport_str)
-            model_type = ModelType(model_type_str)
+            sport, model_type = sport_model_enums(sport_str, model_type_str)
         except ValueError as e:
             raise ValidationError(f"Invalid sport or model type: {e}")
         
-        # Create unique model ID
-        model_id = f"{sport_str.lower()}_{model_type_str}_{int(datetime.now().timestamp())}"
+        # Create unique model ID - random, so ids from different gunicorn workers can't collide
+        model_id = f"{sport_str.lower()}_{model_type_str}_{uuid.uuid4().hex}"
         
         # Create model instance
         model = SportsModelFactory.create_model(sport, model_type, model_id)
@@ -5818,9 +6550,9 @@ def create_sport_specific_model():
         else:
             registry_id = model_id
         
-        logger.info(f"Sport-specific model created: {model_id} by user {user_id}")
+        logger.info("Sport-specific model created: %s by user %s", model_id, user_id)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'model_id': model_id,
             'registry_id': registry_id,
@@ -5830,56 +6562,103 @@ def create_sport_specific_model():
         }), 201
         
     except Exception as e:
-        logger.error(f"Failed to create sport model: {e}")
+        logger.error("Failed to create sport model: %s", e)
         raise ValidationError(f'Failed to create sport model: {e}')
 
 @app.route('/api/models/sport-features/<sport>/<model_type>', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(SPORT_MODELS_AVAILABLE, 'Sport models')
 def get_sport_model_features(sport, model_type):
     """Get features used by a specific sport and model type combination"""
-    if not SPORT_MODELS_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Sport models not available'}), 500
-    
     try:
         # Validate inputs
         try:
-            sport_enum = Sport(sport.upper())
-            model_type_enum = ModelType(model_type.lower())
+            sport_enum, model_type_enum = sport_model_enums(sport, model_type)
         except ValueError as e:
             raise ValidationError(f"Invalid sport or model type: {e}")
         
-        from sport_models import ModelConfig
-        features = ModelConfig.get_features_for_sport(sport_enum, model_type_enum)
-        architecture = ModelConfig.get_model_architecture(sport_enum, model_type_enum)
-        
-        return jsonify({
-            'success': True,
-            'sport': sport.upper(),
-            'model_type': model_type.lower(),
-            'features': features,
-            'feature_count': len(features),
-            'architecture': architecture,
-            'weather_dependent': model_type_enum == ModelType.LSTM_WEATHER,
-            'supports_time_series': model_type_enum == ModelType.LSTM_WEATHER
-        })
+        body = render_sport_model_features(sport_enum, model_type_enum)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Failed to get sport model features: {e}")
+        logger.error("Failed to get sport model features: %s", e)
         raise ValidationError(f'Failed to get sport model features: {e}')
 
 # --- BACKTESTING ENDPOINTS ---
 
+# Fixed prediction returned for every game when no trained model backs a backtest
+DEMO_BACKTEST_PREDICTION = MappingProxyType({
+    'home_win_probability': 0.6,
+    'away_win_probability': 0.4,
+    'predicted_outcome': 'Home Win',
+    'confidence': 0.72
+})
+
+class DemoBacktestModel:
+    """Stateless stand-in model for demo backtests"""
+
+    def predict(self, game_data):
+        return DEMO_BACKTEST_PREDICTION
+
+DEMO_BACKTEST_MODEL = DemoBacktestModel()
+
+# Backtest result fields reported in responses, grouped by rounding precision
+BACKTEST_RESULT_PRECISION = (
+    (4, ('win_rate',)),
+    (2, ('total_profit_loss', 'final_bankroll', 'roi_percentage', 'max_drawdown',
+         'max_drawdown_percentage', 'avg_win', 'avg_loss', 'largest_win', 'largest_loss',
+         'total_commission_paid', 'total_amount_wagered')),
+    (3, ('sharpe_ratio', 'sortino_ratio', 'calmar_ratio', 'profit_factor'))
+)
+STRATEGY_COMPARISON_PRECISION = (
+    (4, ('win_rate',)),
+    (2, ('total_profit_loss', 'roi_percentage', 'max_drawdown_percentage')),
+    (3, ('sharpe_ratio', 'profit_factor'))
+)
+
+def round_backtest_table(results, precision_groups) -> list:
+    """Round the metric fields of several backtest results column-wise, one NumPy round per precision group"""
+    rows = [{} for _ in results]
+    for decimals, fields in precision_groups:
+        values = np.array([[getattr(result, field) for field in fields] for result in results], dtype=float)
+        for row, rounded in zip(rows, np.round(values, decimals).tolist()):
+            row.update(zip(fields, rounded))
+    return rows
+
+def round_backtest_fields(result, precision_groups) -> dict:
+    """Round a backtest result's metric fields with one NumPy round per precision group"""
+    rounded = {}
+    for decimals, fields in precision_groups:
+        values = np.fromiter((getattr(result, field) for field in fields), dtype=float, count=len(fields))
+        rounded.update(zip(fields, np.round(values, decimals).tolist()))
+    return rounded
+
+# Optional run_backtest parameters and their defaults
+BACKTEST_REQUEST_DEFAULTS = MappingProxyType({
+    'initial_bankroll': 1000.0,
+    'betting_strategy': 'percentage',
+    'bet_amount': 2.0,
+    'min_confidence': 0.6
+})
+BACKTEST_REQUEST_NUMERIC_FIELDS = ('initial_bankroll', 'bet_amount', 'min_confidence')
+
+def parse_backtest_request(data: dict) -> dict:
+    """Merge optional backtest parameters over their defaults and coerce them to config types"""
+    params = {**BACKTEST_REQUEST_DEFAULTS, **{key: data[key] for key in BACKTEST_REQUEST_DEFAULTS if key in data}}
+    for field in BACKTEST_REQUEST_NUMERIC_FIELDS:
+        params[field] = float(params[field])
+    params['betting_strategy'] = BettingStrategy(params['betting_strategy'])
+    return params
+
 @app.route('/api/backtest/run', methods=['POST'])
 @handle_errors
 @require_authentication
 @sanitize_request_data(required_fields=['model_id', 'sport', 'start_date', 'end_date'], 
                       optional_fields=['initial_bankroll', 'betting_strategy', 'bet_amount', 'min_confidence'])
+@require_feature(BACKTESTING_AVAILABLE, 'Backtesting engine')
 def run_backtest():
     """Run backtesting simulation for a model"""
-    if not BACKTESTING_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Backtesting engine not available'}), 500
-    
     try:
         data = g.sanitized_request_data
         user_id = g.current_user.get('user_id')
@@ -5888,8 +6667,8 @@ def run_backtest():
         sport = data.get('sport').upper()
         
         # Parse dates
-        start_date = datetime.fromisoformat(data.get('start_date').replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(data.get('end_date').replace('Z', '+00:00'))
+        start_date = parse_iso_datetime(data.get('start_date'))
+        end_date = parse_iso_datetime(data.get('end_date'))
         
         if start_date >= end_date:
             raise ValidationError("Start date must be before end date")
@@ -5898,76 +6677,51 @@ def run_backtest():
             raise ValidationError("Backtest period cannot exceed 365 days")
         
         # Validate sport
-        if sport not in ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']:
+        if sport not in SUPPORTED_SPORTS:
             raise ValidationError("Invalid sport")
         
+        params = parse_backtest_request(data)
+        
         # Get or create model for backtesting
         if SPORT_MODELS_AVAILABLE:
             # Create a demo model for backtesting
-            sport_enum = Sport(sport)
-            model_type_enum = ModelType.ENSEMBLE  # Default to ensemble
+            sport_enum, model_type_enum = sport_model_enums(sport, ModelType.ENSEMBLE.value)  # Default to ensemble
             model = SportsModelFactory.create_model(sport_enum, model_type_enum, model_id)
             
             # Simulate trained model
             model.is_trained = True
             model.performance_metrics = {'accuracy': 0.68}
         else:
-            # Create a mock model for demo
-            class MockModel:
-                def predict(self, game_data):
-                    return {
-                        'home_win_probability': 0.6,
-                        'away_win_probability': 0.4,
-                        'predicted_outcome': 'Home Win',
-                        'confidence': 0.72
-                    }
-            model = MockModel()
+            model = DEMO_BACKTEST_MODEL
         
         # Create backtest configuration
         config = BacktestConfig(
             start_date=start_date.replace(tzinfo=None),
             end_date=end_date.replace(tzinfo=None),
-            initial_bankroll=float(data.get('initial_bankroll', 1000)),
-            betting_strategy=BettingStrategy(data.get('betting_strategy', 'percentage')),
-            bet_amount=float(data.get('bet_amount', 2.0)),
-            min_confidence=float(data.get('min_confidence', 0.6)),
+            **params,
             max_bet_percentage=0.1,  # Max 10% per bet
             commission_rate=0.05,    # 5% commission
-            risk_management={}
+            risk_management={},
+            keep_bet_history=False   # Only the recent tail is returned
         )
         
         # Run backtest
         result = backtesting_engine.run_backtest(model, sport, config)
         
-        logger.info(f"Backtest completed for model {model_id} by user {user_id}")
+        logger.info("Backtest completed for model %s by user %s", model_id, user_id)
         
         # Convert result to dict for JSON response
         result_dict = {
             'total_bets': result.total_bets,
             'winning_bets': result.winning_bets,
             'losing_bets': result.losing_bets,
-            'win_rate': round(result.win_rate, 4),
-            'total_profit_loss': round(result.total_profit_loss, 2),
-            'final_bankroll': round(result.final_bankroll, 2),
-            'roi_percentage': round(result.roi_percentage, 2),
-            'max_drawdown': round(result.max_drawdown, 2),
-            'max_drawdown_percentage': round(result.max_drawdown_percentage, 2),
-            'sharpe_ratio': round(result.sharpe_ratio, 3),
-            'sortino_ratio': round(result.sortino_ratio, 3),
-            'calmar_ratio': round(result.calmar_ratio, 3),
-            'profit_factor': round(result.profit_factor, 3),
-            'avg_win': round(result.avg_win, 2),
-            'avg_loss': round(result.avg_loss, 2),
-            'largest_win': round(result.largest_win, 2),
-            'largest_loss': round(result.largest_loss, 2),
+            **round_backtest_fields(result, BACKTEST_RESULT_PRECISION),
             'consecutive_wins': result.consecutive_wins,
             'consecutive_losses': result.consecutive_losses,
-            'total_commission_paid': round(result.total_commission_paid, 2),
-            'total_amount_wagered': round(result.total_amount_wagered, 2),
-            'bet_history': result.bet_history[-20:]  # Last 20 bets for display
+            'bet_history': result.recent_bets  # Last 20 bets for display
         }
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'backtest_result': result_dict,
             'model_id': model_id,
@@ -5985,7 +6739,7 @@ def run_backtest():
     except ValueError as e:
         raise ValidationError(f"Invalid parameter value: {str(e)}")
     except Exception as e:
-        logger.error(f"Backtest failed: {e}")
+        logger.error("Backtest failed: %s", e)
         raise ValidationError(f'Backtest failed: {e}')
 
 @app.route('/api/backtest/compare-strategies', methods=['POST'])
@@ -5993,11 +6747,9 @@ def run_backtest():
 @require_authentication
 @sanitize_request_data(required_fields=['model_id', 'sport', 'start_date', 'end_date'], 
                       optional_fields=['strategies', 'initial_bankroll'])
+@require_feature(BACKTESTING_AVAILABLE, 'Backtesting engine')
 def compare_betting_strategies():
     """Compare different betting strategies for a model"""
-    if not BACKTESTING_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Backtesting engine not available'}), 500
-    
     try:
         data = g.sanitized_request_data
         user_id = g.current_user.get('user_id')
@@ -6006,23 +6758,14 @@ def compare_betting_strategies():
         sport = data.get('sport').upper()
         
         # Parse dates
-        start_date = datetime.fromisoformat(data.get('start_date').replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(data.get('end_date').replace('Z', '+00:00'))
+        start_date = parse_iso_datetime(data.get('start_date'))
+        end_date = parse_iso_datetime(data.get('end_date'))
         
         # Get strategies to compare
         strategy_names = data.get('strategies', ['fixed_amount', 'percentage', 'kelly_criterion'])
         strategies = [BettingStrategy(name) for name in strategy_names]
         
-        # Create mock model
-        class MockModel:
-            def predict(self, game_data):
-                return {
-                    'home_win_probability': 0.6,
-                    'away_win_probability': 0.4,
-                    'predicted_outcome': 'Home Win',
-                    'confidence': 0.72
-                }
-        model = MockModel()
+        model = DEMO_BACKTEST_MODEL
         
         # Create base configuration
         base_config = BacktestConfig(
@@ -6034,28 +6777,23 @@ def compare_betting_strategies():
             min_confidence=0.6,
             max_bet_percentage=0.1,
             commission_rate=0.05,
-            risk_management={}
+            risk_management={},
+            keep_bet_history=False
         )
         
         # Compare strategies
         results = backtesting_engine.compare_strategies(model, sport, base_config, strategies)
         
         # Format results
-        comparison_results = {}
-        for strategy_name, result in results.items():
-            comparison_results[strategy_name] = {
-                'total_bets': result.total_bets,
-                'win_rate': round(result.win_rate, 4),
-                'total_profit_loss': round(result.total_profit_loss, 2),
-                'roi_percentage': round(result.roi_percentage, 2),
-                'max_drawdown_percentage': round(result.max_drawdown_percentage, 2),
-                'sharpe_ratio': round(result.sharpe_ratio, 3),
-                'profit_factor': round(result.profit_factor, 3)
-            }
+        rounded_rows = round_backtest_table(list(results.values()), STRATEGY_COMPARISON_PRECISION)
+        comparison_results = {
+            strategy_name: {'total_bets': result.total_bets, **rounded}
+            for (strategy_name, result), rounded in zip(results.items(), rounded_rows)
+        }
         
-        logger.info(f"Strategy comparison completed for model {model_id} by user {user_id}")
+        logger.info("Strategy comparison completed for model %s by user %s", model_id, user_id)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'strategy_comparison': comparison_results,
             'model_id': model_id,
@@ -6064,7 +6802,7 @@ def compare_betting_strategies():
         })
         
     except Exception as e:
-        logger.error(f"Strategy comparison failed: {e}")
+        logger.error("Strategy comparison failed: %s", e)
         raise ValidationError(f'Strategy comparison failed: {e}')
 
 # --- DATA PIPELINE ENDPOINTS ---
@@ -6072,109 +6810,219 @@ def compare_betting_strategies():
 @app.route('/api/data/pipeline/status', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(DATA_PIPELINE_AVAILABLE, 'Data pipeline')
 def get_data_pipeline_status():
     """Get current data pipeline status"""
-    if not DATA_PIPELINE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Data pipeline not available'}), 500
-    
     try:
         pipeline_status = data_pipeline.get_pipeline_status()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'pipeline_status': pipeline_status
         })
         
     except Exception as e:
-        logger.error(f"Failed to get pipeline status: {e}")
+        logger.error("Failed to get pipeline status: %s", e)
         raise ValidationError(f'Failed to get pipeline status: {e}')
 
 @app.route('/api/data/pipeline/run', methods=['POST'])
 @handle_errors
 @require_authentication
 @sanitize_request_data(optional_fields=['sport'])
+@require_feature(DATA_PIPELINE_AVAILABLE, 'Data pipeline')
 def run_data_pipeline():
     """Run the complete data pipeline"""
-    if not DATA_PIPELINE_AVAILABLE:
-        return jsonify({'success': False, 'message': 'Data pipeline not available'}), 500
-    
     try:
         data = g.sanitized_request_data
         sport = data.get('sport')
         
-        if sport and sport.upper() not in ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']:
+        if sport and sport.upper() not in SUPPORTED_SPORTS:
             raise ValidationError("Invalid sport specified")
         
         # Run the pipeline
         pipeline_result = data_pipeline.run_full_pipeline(sport)
         
-        logger.info(f"Data pipeline executed for sport: {sport or 'all'}")
+        logger.info("Data pipeline executed for sport: %s", sport or 'all')
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'pipeline_result': pipeline_result
         })
         
     except Exception as e:
-        logger.error(f"Failed to run data pipeline: {e}")
+        logger.error("Failed to run data pipeline: %s", e)
         raise ValidationError(f'Failed to run data pipeline: {e}')
 
+PREPROCESSING_CONFIG_RESPONSE = precompress_json({
+    'success': True,
+    'preprocessing_config': {
+        'feature_engineering': {
+            'rolling_averages': {
+                'enabled': True,
+                'windows': [3, 5, 10],
+                'features': ['points_scored', 'points_allowed', 'field_goal_percentage']
+            },
+            'momentum_indicators': {
+                'enabled': True,
+                'win_streak_weight': 0.15,
+                'recent_performance_window': 5
+            },
+            'opponent_adjustments': {
+                'enabled': True,
+                'strength_of_schedule': True,
+                'pace_adjustments': True
+            }
+        },
+        'data_cleaning': {
+            'outlier_detection': {
+                'method': 'isolation_forest',
+                'contamination': 0.05,
+                'enabled': True
+            },
+            'missing_value_handling': {
+                'numeric_strategy': 'median',
+                'categorical_strategy': 'mode',
+                'time_series_strategy': 'forward_fill'
+            }
+        },
+        'normalization': {
+            'method': 'standard_scaler',
+            'features_to_normalize': ['pace', 'offensive_rating', 'defensive_rating'],
+            'preserve_distribution': True
+        },
+        'validation_rules': {
+            'min_games_played': 5,
+            'max_score_differential': 50,
+            'required_features': ['team_strength', 'opponent_strength', 'venue']
+        }
+    }
+})
+
 @app.route('/api/data/preprocessing/config', methods=['GET'])
 @handle_errors
 @require_authentication
 def get_preprocessing_config():
     """Get data preprocessing configuration"""
-    try:
-        preprocessing_config = {
-            'feature_engineering': {
-                'rolling_averages': {
-                    'enabled': True,
-                    'windows': [3, 5, 10],
-                    'features': ['points_scored', 'points_allowed', 'field_goal_percentage']
-                },
-                'momentum_indicators': {
-                    'enabled': True,
-                    'win_streak_weight': 0.15,
-                    'recent_performance_window': 5
-                },
-                'opponent_adjustments': {
-                    'enabled': True,
-                    'strength_of_schedule': True,
-                    'pace_adjustments': True
-                }
-            },
-            'data_cleaning': {
-                'outlier_detection': {
-                    'method': 'isolation_forest',
-                    'contamination': 0.05,
-                    'enabled': True
-                },
-                'missing_value_handling': {
-                    'numeric_strategy': 'median',
-                    'categorical_strategy': 'mode',
-                    'time_series_strategy': 'forward_fill'
-                }
-            },
-            'normalization': {
-                'method': 'standard_scaler',
-                'features_to_normalize': ['pace', 'offensive_rating', 'defensive_rating'],
-                'preserve_distribution': True
-            },
-            'validation_rules': {
-                'min_games_played': 5,
-                'max_score_differential': 50,
-                'required_features': ['team_strength', 'opponent_strength', 'venue']
+    return precompressed_response(PREPROCESSING_CONFIG_RESPONSE)
+
+# Static explanations for known model input features, with a variant carrying the
+# wider points-per-game ranges of high-scoring sports
+FEATURE_EXPLANATIONS = MappingProxyType({
+    'home_win_pct': {
+        'description': 'Home team win percentage over the season',
+        'importance': 0.25,
+        'category': 'team_performance',
+        'data_type': 'numeric',
+        'range': [0.0, 1.0],
+        'interpretation': 'Higher values indicate stronger teams'
+    },
+    'away_win_pct': {
+        'description': 'Away team win percentage over the season',
+        'importance': 0.22,
+        'category': 'team_performance',
+        'data_type': 'numeric',
+        'range': [0.0, 1.0],
+        'interpretation': 'Higher values indicate stronger teams'
+    },
+    'home_team_ppg': {
+        'description': 'Home team average points per game',
+        'importance': 0.18,
+        'category': 'offensive_stats',
+        'data_type': 'numeric',
+        'range': [14.0, 45.0],
+        'interpretation': 'Higher values indicate more potent offense'
+    },
+    'away_team_ppg': {
+        'description': 'Away team average points per game',
+        'importance': 0.16,
+        'category': 'offensive_stats',
+        'data_type': 'numeric',
+        'range': [14.0, 45.0],
+        'interpretation': 'Higher values indicate more potent offense'
+    },
+    'temperature': {
+        'description': 'Game-time temperature in Fahrenheit',
+        'importance': 0.08,
+        'category': 'weather',
+        'data_type': 'numeric',
+        'range': [20.0, 100.0],
+        'interpretation': 'Extreme temperatures can affect player performance'
+    },
+    'humidity': {
+        'description': 'Relative humidity percentage',
+        'importance': 0.06,
+        'category': 'weather',
+        'data_type': 'numeric',
+        'range': [20.0, 90.0],
+        'interpretation': 'High humidity can reduce stamina and ball handling'
+    },
+    'wind_speed': {
+        'description': 'Wind speed in miles per hour',
+        'importance': 0.05,
+        'category': 'weather',
+        'data_type': 'numeric',
+        'range': [0.0, 30.0],
+        'interpretation': 'High winds affect passing and kicking accuracy'
+    }
+})
+HIGH_SCORING_SPORTS = frozenset(('NBA', 'NCAAB'))
+HIGH_SCORING_FEATURE_EXPLANATIONS = MappingProxyType({
+    feature: {**info, 'range': [80.0, 130.0]} if feature.endswith('_ppg') else info
+    for feature, info in FEATURE_EXPLANATIONS.items()
+})
+
+def build_feature_explanation(sport: str, model_type: str) -> dict:
+    """Build the feature explanation payload for a sport and model type"""
+    # Get features for the sport and model type
+    if SPORT_MODELS_AVAILABLE:
+        try:
+            sport_enum, model_type_enum = sport_model_enums(sport, model_type)
+            features = ModelConfig.get_features_for_sport(sport_enum, model_type_enum)
+        except:
+            features = ['home_win_pct', 'away_win_pct', 'home_team_ppg', 'away_team_ppg']
+    else:
+        features = ['home_win_pct', 'away_win_pct', 'home_team_ppg', 'away_team_ppg']
+    
+    # Explain each feature and roll the explanations up by category
+    explanations = HIGH_SCORING_FEATURE_EXPLANATIONS if sport in HIGH_SCORING_SPORTS else FEATURE_EXPLANATIONS
+    relevant_explanations = {}
+    categories = {}
+    for feature in features:
+        info = explanations.get(feature)
+        if info is None:
+            info = {
+                'description': f'{feature.replace("_", " ").title()}',
+                'importance': 0.1,
+                'category': 'unknown',
+                'data_type': 'numeric',
+                'interpretation': 'Feature importance varies by model'
             }
-        }
+        relevant_explanations[feature] = info
         
-        return jsonify({
-            'success': True,
-            'preprocessing_config': preprocessing_config
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get preprocessing config: {e}")
-        raise ValidationError(f'Failed to get preprocessing config: {e}')
+        category = categories.setdefault(info['category'], {'features': [], 'total_importance': 0})
+        category['features'].append(feature)
+        category['total_importance'] += info['importance']
+    
+    return {
+        'success': True,
+        'sport': sport,
+        'model_type': model_type,
+        'features': relevant_explanations,
+        'feature_categories': categories,
+        'total_features': len(features),
+        'weather_dependent': model_type == 'lstm_weather'
+    }
+
+# Encoded feature explanation bodies for every supported (sport, model_type), built at import
+FEATURE_EXPLANATION_RESPONSES = MappingProxyType({
+    (sport, model_type): precompress_json(build_feature_explanation(sport, model_type))
+    for sport in SUPPORTED_SPORTS
+    for model_type in TRAINING_JOB_MODEL_TYPES
+})
+
+# Other (sport, model_type) requests are built on first use
+FEATURE_EXPLANATION_CACHE_MAX_ENTRIES = 128
+_feature_explanation_cache = {}
 
 @app.route('/api/data/features/explain', methods=['GET'])
 @handle_errors
@@ -6185,111 +7033,19 @@ def explain_model_features():
         sport = request.args.get('sport', 'NBA').upper()
         model_type = request.args.get('model_type', 'ensemble')
         
-        # Get features for the sport and model type
-        if SPORT_MODELS_AVAILABLE:
-            try:
-                sport_enum = Sport(sport)
-                model_type_enum = ModelType(model_type)
-                from sport_models import ModelConfig
-                features = ModelConfig.get_features_for_sport(sport_enum, model_type_enum)
-            except:
-                features = ['home_win_pct', 'away_win_pct', 'home_team_ppg', 'away_team_ppg']
-        else:
-            features = ['home_win_pct', 'away_win_pct', 'home_team_ppg', 'away_team_ppg']
-        
-        # Create feature explanations
-        feature_explanations = {
-            'home_win_pct': {
-                'description': 'Home team win percentage over the season',
-                'importance': 0.25,
-                'category': 'team_performance',
-                'data_type': 'numeric',
-                'range': [0.0, 1.0],
-                'interpretation': 'Higher values indicate stronger teams'
-            },
-            'away_win_pct': {
-                'description': 'Away team win percentage over the season',
-                'importance': 0.22,
-                'category': 'team_performance',
-                'data_type': 'numeric',
-                'range': [0.0, 1.0],
-                'interpretation': 'Higher values indicate stronger teams'
-            },
-            'home_team_ppg': {
-                'description': 'Home team average points per game',
-                'importance': 0.18,
-                'category': 'offensive_stats',
-                'data_type': 'numeric',
-                'range': [80.0, 130.0] if sport in ['NBA', 'NCAAB'] else [14.0, 45.0],
-                'interpretation': 'Higher values indicate more potent offense'
-            },
-            'away_team_ppg': {
-                'description': 'Away team average points per game',
-                'importance': 0.16,
-                'category': 'offensive_stats',
-                'data_type': 'numeric',
-                'range': [80.0, 130.0] if sport in ['NBA', 'NCAAB'] else [14.0, 45.0],
-                'interpretation': 'Higher values indicate more potent offense'
-            },
-            'temperature': {
-                'description': 'Game-time temperature in Fahrenheit',
-                'importance': 0.08,
-                'category': 'weather',
-                'data_type': 'numeric',
-                'range': [20.0, 100.0],
-                'interpretation': 'Extreme temperatures can affect player performance'
-            },
-            'humidity': {
-                'description': 'Relative humidity percentage',
-                'importance': 0.06,
-                'category': 'weather',
-                'data_type': 'numeric',
-                'range': [20.0, 90.0],
-                'interpretation': 'High humidity can reduce stamina and ball handling'
-            },
-            'wind_speed': {
-                'description': 'Wind speed in miles per hour',
-                'importance': 0.05,
-                'category': 'weather',
-                'data_type': 'numeric',
-                'range': [0.0, 30.0],
-                'interpretation': 'High winds affect passing and kicking accuracy'
-            }
-        }
-        
-        # Filter explanations to only include features for this model
-        relevant_explanations = {
-            feature: feature_explanations.get(feature, {
-                'description': f'{feature.replace("_", " ").title()}',
-                'importance': 0.1,
-                'category': 'unknown',
-                'data_type': 'numeric',
-                'interpretation': 'Feature importance varies by model'
-            })
-            for feature in features
-        }
-        
-        # Calculate feature categories summary
-        categories = {}
-        for feature, info in relevant_explanations.items():
-            category = info['category']
-            if category not in categories:
-                categories[category] = {'features': [], 'total_importance': 0}
-            categories[category]['features'].append(feature)
-            categories[category]['total_importance'] += info['importance']
+        key = (sport, model_type)
+        bodies = FEATURE_EXPLANATION_RESPONSES.get(key) or _feature_explanation_cache.get(key)
+        record_cache_lookup('feature_explanation', hit=bodies is not None)
+        if bodies is None:
+            bodies = precompress_json(build_feature_explanation(sport, model_type))
+            if len(_feature_explanation_cache) >= FEATURE_EXPLANATION_CACHE_MAX_ENTRIES:
+                _feature_explanation_cache.clear()
+            _feature_explanation_cache[key] = bodies
         
-        return jsonify({
-            'success': True,
-            'sport': sport,
-            'model_type': model_type,
-            'features': relevant_explanations,
-            'feature_categories': categories,
-            'total_features': len(features),
-            'weather_dependent': model_type == 'lstm_weather'
-        })
+        return precompressed_response(bodies)
         
     except Exception as e:
-        logger.error(f"Failed to explain features: {e}")
+        logger.error("Failed to explain features: %s", e)
         raise ValidationError(f'Failed to explain features: {e}')
 
 # --- NEW PROFESSIONAL DATA PIPELINE ENDPOINTS ---
@@ -6297,14 +7053,13 @@ def explain_model_features():
 @app.route('/api/data-pipeline/sources', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
 def get_data_sources():
     """Get available data sources and their status"""
     try:
-        from professional_data_pipeline import pipeline_manager
-        
         sources_status = pipeline_manager.get_data_source_status()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'data_sources': sources_status,
             'total_sources': len(sources_status),
@@ -6312,25 +7067,24 @@ def get_data_sources():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get data sources: {e}")
+        logger.error("Failed to get data sources: %s", e)
         raise ValidationError(f'Failed to get data sources: {e}')
 
 
 @app.route('/api/data-pipeline/sources/<source_name>/toggle', methods=['POST'])
 @handle_errors
 @require_authentication
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
 def toggle_data_source_endpoint(source_name):
     """Toggle a data source on/off"""
     try:
-        from professional_data_pipeline import toggle_data_source
-        
         data = request.get_json() or {}
         enabled = data.get('enabled', True)
         
-        success = toggle_data_source(source_name, enabled)
+        success = toggle_pipeline_source(source_name, enabled)
         
         if success:
-            return jsonify({
+            return ojsonify({
                 'success': True,
                 'message': f"Data source {source_name} {'enabled' if enabled else 'disabled'}",
                 'source': source_name,
@@ -6340,40 +7094,40 @@ def toggle_data_source_endpoint(source_name):
             raise ValidationError(f"Unknown data source: {source_name}")
             
     except Exception as e:
-        logger.error(f"Failed to toggle data source: {e}")
+        logger.error("Failed to toggle data source: %s", e)
         raise ValidationError(f'Failed to toggle data source: {e}')
 
 
+# Model types the professional data pipeline prepares training data for
+DATA_JOB_MODEL_TYPES = frozenset(('lstm_weather', 'ensemble', 'neural_network', 'statistical'))
+
 @app.route('/api/data-pipeline/jobs', methods=['POST'])
 @handle_errors
 @require_authentication
 @sanitize_request_data(required_fields=['sport', 'model_type', 'data_sources'])
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
 def submit_data_job():
     """Submit a data processing job"""
     try:
-        from professional_data_pipeline import submit_data_job
-        
-        data = request.get_json()
+        data = g.sanitized_request_data
         sport = data['sport']
         model_type = data['model_type']
         data_sources = data['data_sources']
         user_id = g.current_user.get('user_id', 'demo_user')
         
         # Validate inputs
-        valid_sports = ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']
-        if sport not in valid_sports:
-            raise ValidationError(f"Invalid sport. Must be one of: {valid_sports}")
+        if sport not in SUPPORTED_SPORTS:
+            raise ValidationError(f"Invalid sport. Must be one of: {sorted(SUPPORTED_SPORTS)}")
             
-        valid_model_types = ['lstm_weather', 'ensemble', 'neural_network', 'statistical']
-        if model_type not in valid_model_types:
-            raise ValidationError(f"Invalid model type. Must be one of: {valid_model_types}")
+        if model_type not in DATA_JOB_MODEL_TYPES:
+            raise ValidationError(f"Invalid model type. Must be one of: {sorted(DATA_JOB_MODEL_TYPES)}")
             
         if not isinstance(data_sources, list) or not data_sources:
             raise ValidationError("data_sources must be a non-empty list")
         
-        job_id = submit_data_job(sport, model_type, data_sources, user_id)
+        job_id = submit_pipeline_job(sport, model_type, data_sources, user_id)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'job_id': job_id,
             'message': 'Data processing job submitted successfully',
@@ -6384,123 +7138,197 @@ def submit_data_job():
         })
         
     except Exception as e:
-        logger.error(f"Failed to submit data job: {e}")
+        logger.error("Failed to submit data job: %s", e)
         raise ValidationError(f'Failed to submit job: {e}')
 
 
 @app.route('/api/data-pipeline/jobs/<job_id>', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
 def get_job_status(job_id):
-    """Get the status of a data processing job"""
+    """Get the status of a data processing job, optionally long-polling for a progress change"""
     try:
-        from professional_data_pipeline import pipeline_manager
+        wait = request.args.get('wait', 0, type=float)
+        since_progress = request.args.get('since_progress', type=int)
         
-        job = pipeline_manager.get_job_status(job_id)
+        if wait > 0 and since_progress is not None:
+            job = pipeline_manager.wait_for_job_change(job_id, since_progress, wait)
+        else:
+            job = pipeline_manager.get_job_status(job_id)
         
         if not job:
             raise ValidationError(f"Job {job_id} not found")
         
-        # Convert job to dict for JSON serialization
-        job_data = {
-            'job_id': job.job_id,
-            'sport': job.sport,
-            'model_type': job.model_type,
-            'data_sources': [ds.value for ds in job.data_sources],
-            'status': job.status.value,
-            'progress_percent': job.progress_percent,
-            'created_at': job.created_at.isoformat(),
-            'estimated_completion': job.estimated_completion.isoformat() if job.estimated_completion else None,
-            'error_message': job.error_message,
-            'logs': job.logs[-10:],  # Last 10 log entries
-            'results_available': job.status.value == 'completed' and bool(job.results)
-        }
+        def build():
+            # Convert job to dict for JSON serialization
+            job_data = {
+                'job_id': job.job_id,
+                'sport': job.sport,
+                'model_type': job.model_type,
+                'data_sources': [ds.value for ds in job.data_sources],
+                'status': job.status.value,
+                'progress_percent': job.progress_percent,
+                'created_at': job.created_at,
+                'estimated_completion': job.estimated_completion,
+                'error_message': job.error_message,
+                'logs': list(job.logs),  # Last 10 log entries, bounded at write time
+                'results_available': job.status.value == 'completed' and bool(job.results)
+            }
+            
+            return ojsonify({
+                'success': True,
+                'job': job_data
+            }, iso_datetimes=True)
         
-        return jsonify({
-            'success': True,
-            'job': job_data
-        })
+        return revision_response(f"job|{job.job_id}|{job.revision}", build)
         
     except Exception as e:
-        logger.error(f"Failed to get job status: {e}")
+        logger.error("Failed to get job status: %s", e)
         raise ValidationError(f'Failed to get job status: {e}')
 
 
+# Encoded job listings per user, reused until the user's pipeline revision moves
+_user_jobs_body_cache = {}  # user_id -> (revision, body)
+_user_jobs_body_lock = threading.Lock()
+
+def cached_user_jobs_body(user_id, revision):
+    """Return the encoded job listing for a user, encoding it once per revision across concurrent polls"""
+    with _user_jobs_body_lock:
+        cached = _user_jobs_body_cache.get(user_id)
+        if cached is not None and cached[0] == revision:
+            record_cache_lookup('user_jobs', hit=True)
+            return cached[1]
+        record_cache_lookup('user_jobs', hit=False)
+        jobs_data = pipeline_manager.get_user_job_summaries(user_id)
+        body = encode_json({
+            'success': True,
+            'jobs': jobs_data,
+            'total_jobs': len(jobs_data)
+        })
+        _user_jobs_body_cache[user_id] = (revision, body)
+        return body
+
 @app.route('/api/data-pipeline/jobs', methods=['GET'])
 @handle_errors
 @require_authentication
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
 def get_user_jobs():
     """Get all jobs for the current user"""
     try:
-        from professional_data_pipeline import pipeline_manager
-        
         user_id = g.current_user.get('user_id', 'demo_user')
-        jobs = pipeline_manager.get_user_jobs(user_id)
+        revision = pipeline_manager.user_revisions.get(user_id, 0)
         
-        jobs_data = []
-        for job in jobs:
-            job_data = {
-                'job_id': job.job_id,
-                'sport': job.sport,
-                'model_type': job.model_type,
-                'status': job.status.value,
-                'progress_percent': job.progress_percent,
-                'created_at': job.created_at.isoformat(),
-                'data_sources_count': len(job.data_sources),
-                'has_results': bool(job.results)
-            }
-            jobs_data.append(job_data)
-            
-        return jsonify({
-            'success': True,
-            'jobs': jobs_data,
-            'total_jobs': len(jobs_data)
-        })
+        return revision_response(
+            f"jobs|{user_id}|{revision}",
+            lambda: app.response_class(cached_user_jobs_body(user_id, revision), mimetype='application/json')
+        )
         
     except Exception as e:
-        logger.error(f"Failed to get user jobs: {e}")
+        logger.error("Failed to get user jobs: %s", e)
         raise ValidationError(f'Failed to get user jobs: {e}')
 
 
+# Seconds between keepalive comments on an idle job event stream
+JOB_EVENTS_KEEPALIVE = 15
+
+@app.route('/api/data-pipeline/events', methods=['GET'])
+@handle_errors
+@require_authentication
+@require_feature(PROFESSIONAL_PIPELINE_AVAILABLE, 'Professional data pipeline')
+def stream_job_events():
+    """Stream the current user's job status changes as Server-Sent Events"""
+    user_id = g.current_user.get('user_id', 'demo_user')
+    if pipeline_manager.job_event_streams_full():
+        return ojsonify({'success': False, 'error': 'Too many open event streams, poll /api/data-pipeline/jobs instead'}, status=503)
+    
+    def generate():
+        # Subscribe on first iteration, so a response whose body is never read doesn't leak a queue
+        events = pipeline_manager.subscribe_job_events(user_id)
+        if events is None:
+            # Filled up since the check above - ask the client to reconnect later
+            yield b'retry: 30000\n\n'
+            return
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=JOB_EVENTS_KEEPALIVE)
+                except queue.Empty:
+                    yield b': keepalive\n\n'
+                    continue
+                yield b'data: ' + encode_json(event) + b'\n\n'
+        finally:
+            pipeline_manager.unsubscribe_job_events(user_id, events)
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 # --- INVESTMENT MANAGEMENT ENDPOINTS ---
 
+def require_betting_service():
+    """Return the betting service, or fail the request when it did not initialize"""
+    service = betting_service
+    if service is None:
+        raise ValidationError("Betting service not initialized")
+    return service
+
+# Optional hold_investment fields and their defaults - required ones are checked by sanitize_request_data
+BET_REQUEST_DEFAULTS = MappingProxyType({
+    'line': None,
+    'sportsbook': None,
+    'notes': '',
+    'confidence': None
+})
+BET_REQUEST_FLOAT_FIELDS = ('odds', 'amount')
+
+def parse_bet_request(data: dict) -> 'BetRequest':
+    """Build a BetRequest from a hold request body, coercing the bet type and numeric fields"""
+    try:
+        bet_type = BetType(data['bet_type'])
+    except ValueError:
+        raise ValidationError(f"Invalid bet type. Must be one of: {[t.value for t in BetType]}", field='bet_type')
+    
+    params = {**BET_REQUEST_DEFAULTS, **{key: data[key] for key in BET_REQUEST_DEFAULTS if key in data}}
+    for field in BET_REQUEST_FLOAT_FIELDS:
+        try:
+            params[field] = float(data[field])
+        except (TypeError, ValueError):
+            raise ValidationError(f"{field} must be a number", field=field)
+    
+    return BetRequest(
+        game_id=data['game_id'],
+        bet_type=bet_type,
+        selection=data['selection'],
+        model_prediction=data.get('model_prediction', {}),
+        **params
+    )
+
 @app.route('/api/investments/hold', methods=['POST'])
 @handle_errors
 @require_authentication
-@sanitize_request_data(required_fields=['game_id', 'bet_type', 'selection', 'odds', 'amount'])
+@sanitize_request_data(required_fields=['game_id', 'bet_type', 'selection', 'odds', 'amount'],
+                      optional_fields=[*BET_REQUEST_DEFAULTS, 'model_prediction'])
 def hold_investment():
     """Hold an investment for manual export and placement"""
     try:
-        from sportsbook_api import BetRequest, BetType
+        service = require_betting_service()
         
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
-        
-        data = request.get_json()
+        data = g.sanitized_request_data
         user_id = g.current_user.get('user_id', 'demo_user')
         
         # Create bet request
-        bet_request = BetRequest(
-            game_id=data['game_id'],
-            bet_type=BetType(data['bet_type']),
-            selection=data['selection'],
-            odds=float(data['odds']),
-            amount=float(data['amount']),
-            line=data.get('line'),
-            sportsbook=data.get('sportsbook'),
-            notes=data.get('notes', ''),
-            confidence=data.get('confidence'),
-            model_prediction=data.get('model_prediction', {})
-        )
+        bet_request = parse_bet_request(data)
         
-        result = betting_service.hold_investment(bet_request, user_id)
+        result = service.hold_investment(bet_request, user_id)
         
-        return jsonify(result)
+        return ojsonify(result, iso_datetimes=True)
         
     except Exception as e:
-        logger.error(f"Failed to hold investment: {e}")
+        logger.error("Failed to hold investment: %s", e)
         raise ValidationError(f'Failed to hold investment: {e}')
 
 
@@ -6508,32 +7336,26 @@ def hold_investment():
 @handle_errors
 @require_authentication
 def get_pending_investments():
-    """Get pending investments for the current user"""
+    """Get a page of pending investments for the current user (?limit=&offset=)"""
     try:
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
+        service = require_betting_service()
         
         user_id = g.current_user.get('user_id', 'demo_user')
-        investments = betting_service.get_pending_investments(user_id)
-        
-        # Convert datetime objects to ISO strings
-        for inv in investments:
-            inv['created_at'] = inv['created_at'].isoformat()
-            if 'confirmed_at' in inv:
-                inv['confirmed_at'] = inv['confirmed_at'].isoformat()
+        limit = request.args.get('limit', type=int)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        page = service.get_pending_investments_page(user_id, limit, offset)
         
-        return jsonify({
+        # Datetimes are written as ISO strings by the encoder, so rows go out untouched
+        return ojsonify({
             'success': True,
-            'investments': investments,
-            'total_count': len(investments),
-            'total_amount': sum(inv['amount'] for inv in investments),
-            'total_potential_payout': sum(inv['potential_payout'] for inv in investments)
-        })
+            'investments': page['rows'],
+            'total_count': page['total_count'],
+            'total_amount': page['total_amount'],
+            'total_potential_payout': page['total_potential_payout']
+        }, iso_datetimes=True)
         
     except Exception as e:
-        logger.error(f"Failed to get pending investments: {e}")
+        logger.error("Failed to get pending investments: %s", e)
         raise ValidationError(f'Failed to get pending investments: {e}')
 
 
@@ -6543,42 +7365,213 @@ def get_pending_investments():
 def export_investments():
     """Export pending investments to CSV"""
     try:
-        from flask import Response
-        
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
+        service = require_betting_service()
         
         user_id = g.current_user.get('user_id', 'demo_user')
-        csv_content = betting_service.export_investments_to_csv(user_id)
+        rows = service.stream_investments_csv(user_id)
+        gzipped = 'gzip' in request.accept_encodings
         
-        return Response(
-            csv_content,
+        response = Response(
+            stream_with_context(gzip_stream(rows) if gzipped else rows),
             mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment; filename=investments_{user_id}_{datetime.datetime.now().strftime("%Y%m%d")}.csv'}
+            headers={'Content-Disposition': f'attachment; filename=investments_{user_id}_{today_stamp()}.csv'}
         )
+        if gzipped:
+            response.content_encoding = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
         
     except Exception as e:
-        logger.error(f"Failed to export investments: {e}")
+        logger.error("Failed to export investments: %s", e)
         raise ValidationError(f'Failed to export investments: {e}')
 
 
+# Background CSV exports: written to a temp dir off the request thread, fetched through a signed link.
+# Each job keeps a {job_id}.json record next to its {job_id}.csv so every worker on the host sees it
+INVESTMENT_EXPORT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='investment-export')
+INVESTMENT_EXPORT_DIR = os.path.join(tempfile.gettempdir(), f"post9_investment_exports-{os.getuid() if hasattr(os, 'getuid') else 'app'}")
+INVESTMENT_EXPORT_TTL = 900  # seconds an export file and its download link stay valid
+INVESTMENT_EXPORT_MAX_PENDING = 3  # pending exports per user
+INVESTMENT_EXPORT_PURGE_INTERVAL = 60  # seconds between expired export sweeps per worker
+_INVESTMENT_EXPORT_ID = re.compile(r'[0-9a-f]{32}')
+_investment_exports_purged_at = 0.0
+
+def investment_export_signer():
+    """Signer for investment export download tokens"""
+    return URLSafeTimedSerializer(app.secret_key, salt='investment-export')
+
+def investment_export_dir():
+    """Create the export dir private to this user, refusing one someone else owns or can read"""
+    os.makedirs(INVESTMENT_EXPORT_DIR, mode=0o700, exist_ok=True)
+    if hasattr(os, 'getuid'):
+        info = os.stat(INVESTMENT_EXPORT_DIR)
+        if info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise RuntimeError(f"Export directory {INVESTMENT_EXPORT_DIR} is not private to this user")
+    return INVESTMENT_EXPORT_DIR
+
+def investment_export_path(job_id, extension):
+    """Path of an export job's record ('json') or file ('csv')"""
+    return os.path.join(INVESTMENT_EXPORT_DIR, f'{job_id}.{extension}')
+
+def save_investment_export(job_id, export):
+    """Write an export record atomically so other workers never read a partial one"""
+    tmp_path = investment_export_path(job_id, 'json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(export, f)
+    os.replace(tmp_path, investment_export_path(job_id, 'json'))
+
+def load_investment_exports():
+    """Read every export record in the export dir, keyed by job id"""
+    exports = {}
+    try:
+        names = os.listdir(INVESTMENT_EXPORT_DIR)
+    except OSError:
+        return exports
+    for name in names:
+        job_id, _, extension = name.partition('.')
+        if extension != 'json':
+            continue
+        try:
+            with open(investment_export_path(job_id, 'json'), encoding='utf-8') as f:
+                exports[job_id] = json.load(f)
+        except (OSError, ValueError):
+            continue
+    return exports
+
+def write_investment_export(service, job_id, export):
+    """Write a user's pending investments CSV to disk for a background export job"""
+    try:
+        with open(investment_export_path(job_id, 'csv'), 'w', encoding='utf-8', newline='') as f:
+            f.writelines(service.stream_investments_csv(export['user_id']))
+        export['status'] = 'ready'
+    except Exception as e:
+        logger.error("Investment export %s failed: %s", job_id, e)
+        export['status'] = 'failed'
+    save_investment_export(job_id, export)
+
+def purge_expired_investment_exports():
+    """Drop export records and files older than INVESTMENT_EXPORT_TTL, at most once per purge interval"""
+    global _investment_exports_purged_at
+    now = time.time()
+    if now - _investment_exports_purged_at < INVESTMENT_EXPORT_PURGE_INTERVAL:
+        return
+    _investment_exports_purged_at = now
+    
+    for job_id, export in load_investment_exports().items():
+        if now - export['created'] <= INVESTMENT_EXPORT_TTL:
+            continue
+        for extension in ('json', 'csv'):
+            try:
+                os.remove(investment_export_path(job_id, extension))
+            except OSError:
+                pass
+
+def get_investment_export(job_id, user_id=None):
+    """Look up an unexpired export job, optionally checking it belongs to user_id"""
+    purge_expired_investment_exports()
+    export = None
+    if _INVESTMENT_EXPORT_ID.fullmatch(job_id):
+        try:
+            with open(investment_export_path(job_id, 'json'), encoding='utf-8') as f:
+                export = json.load(f)
+        except (OSError, ValueError):
+            pass
+    if (not export or time.time() - export['created'] > INVESTMENT_EXPORT_TTL
+            or (user_id is not None and export['user_id'] != user_id)):
+        raise ValidationError(f"Export {job_id} not found")
+    return export
+
+@app.route('/api/investments/export', methods=['POST'])
+@handle_errors
+@require_authentication
+def schedule_investment_export():
+    """Schedule a background CSV export of pending investments"""
+    service = require_betting_service()
+    
+    user_id = g.current_user.get('user_id', 'demo_user')
+    investment_export_dir()
+    purge_expired_investment_exports()
+    
+    pending = sum(
+        1 for export in load_investment_exports().values()
+        if export['user_id'] == user_id and export['status'] == 'pending'
+    )
+    if pending >= INVESTMENT_EXPORT_MAX_PENDING:
+        raise ValidationError(f"At most {INVESTMENT_EXPORT_MAX_PENDING} exports can be pending at once")
+    
+    job_id = uuid.uuid4().hex
+    export = {
+        'user_id': user_id,
+        'status': 'pending',
+        'filename': f'investments_{user_id}_{today_stamp()}.csv',
+        'created': time.time()
+    }
+    save_investment_export(job_id, export)
+    INVESTMENT_EXPORT_POOL.submit(write_investment_export, service, job_id, dict(export))
+    
+    return ojsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'pending',
+        'status_url': url_for('get_investment_export_status', job_id=job_id)
+    }, status=202)
+
+
+@app.route('/api/investments/export/<job_id>', methods=['GET'])
+@handle_errors
+@require_authentication
+def get_investment_export_status(job_id):
+    """Report a background export's progress, with a signed download link once it is ready"""
+    user_id = g.current_user.get('user_id', 'demo_user')
+    export = get_investment_export(job_id, user_id)
+    
+    if export['status'] == 'failed':
+        raise ValidationError(f"Export {job_id} failed")
+    
+    if export['status'] == 'pending':
+        return ojsonify({'success': True, 'job_id': job_id, 'status': 'pending'}, status=202)
+    
+    return ojsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'ready',
+        'download_url': url_for('download_investment_export', job_id=job_id,
+                                token=investment_export_signer().dumps(job_id)),
+        'expires_in': INVESTMENT_EXPORT_TTL
+    })
+
+
+@app.route('/api/investments/export/<job_id>/download', methods=['GET'])
+@handle_errors
+def download_investment_export(job_id):
+    """Download a finished export - the signed token stands in for authentication"""
+    try:
+        signed_job_id = investment_export_signer().loads(request.args.get('token', ''), max_age=INVESTMENT_EXPORT_TTL)
+    except BadSignature:
+        raise ValidationError("Invalid or expired download link")
+    
+    if signed_job_id != job_id:
+        raise ValidationError("Invalid or expired download link")
+    
+    export = get_investment_export(job_id)
+    if export['status'] != 'ready':
+        raise ValidationError(f"Export {job_id} is not ready")
+    
+    return send_file(investment_export_path(job_id, 'csv'), mimetype='text/csv', as_attachment=True, download_name=export['filename'])
+
+
 @app.route('/api/investments/<investment_id>/confirm', methods=['POST'])
 @handle_errors
 @require_authentication
 def confirm_investment(investment_id):
     """Confirm that an investment was manually placed"""
     try:
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
+        service = require_betting_service()
         
         data = request.get_json() or {}
         user_id = g.current_user.get('user_id', 'demo_user')
         
-        result = betting_service.confirm_investment(
+        result = service.confirm_investment(
             investment_id=investment_id,
             user_id=user_id,
             actual_odds=data.get('actual_odds'),
@@ -6586,10 +7579,10 @@ def confirm_investment(investment_id):
             bet_slip_id=data.get('bet_slip_id')
         )
         
-        return jsonify(result)
+        return ojsonify(result, iso_datetimes=True)
         
     except Exception as e:
-        logger.error(f"Failed to confirm investment: {e}")
+        logger.error("Failed to confirm investment: %s", e)
         raise ValidationError(f'Failed to confirm investment: {e}')
 
 
@@ -6599,20 +7592,17 @@ def confirm_investment(investment_id):
 def edit_investment(investment_id):
     """Edit a pending investment"""
     try:
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
+        service = require_betting_service()
         
         data = request.get_json() or {}
         user_id = g.current_user.get('user_id', 'demo_user')
         
-        result = betting_service.edit_investment(investment_id, user_id, data)
+        result = service.edit_investment(investment_id, user_id, data)
         
-        return jsonify(result)
+        return ojsonify(result, iso_datetimes=True)
         
     except Exception as e:
-        logger.error(f"Failed to edit investment: {e}")
+        logger.error("Failed to edit investment: %s", e)
         raise ValidationError(f'Failed to edit investment: {e}')
 
 
@@ -6622,86 +7612,176 @@ def edit_investment(investment_id):
 def reject_investment(investment_id):
     """Reject/cancel a pending investment"""
     try:
-        # Use global betting service
-        global betting_service
-        if not betting_service:
-            raise ValidationError("Betting service not initialized")
+        service = require_betting_service()
         
         data = request.get_json() or {}
         user_id = g.current_user.get('user_id', 'demo_user')
         reason = data.get('reason', 'User cancelled')
         
-        result = betting_service.reject_investment(investment_id, user_id, reason)
+        result = service.reject_investment(investment_id, user_id, reason)
         
-        return jsonify(result)
+        return ojsonify(result, iso_datetimes=True)
         
     except Exception as e:
-        logger.error(f"Failed to reject investment: {e}")
+        logger.error("Failed to reject investment: %s", e)
         raise ValidationError(f'Failed to reject investment: {e}')
 
 
 # --- ENHANCED TRAINING ENDPOINTS ---
 
+# Optional real-training hyperparameters, passed through to the training config
+REAL_TRAINING_OPTIONAL_FIELDS = ['epochs', 'batch_size', 'learning_rate', 'hidden_units', 'dropout_rate']
+
+# Most jobs accepted by one bulk real-training request
+REAL_TRAINING_BULK_LIMIT = 50
+
+def sanitize_real_training_entry(entry, index: int) -> dict:
+    """Sanitize one bulk real-training entry the way sanitize_request_data does a request body"""
+    if not isinstance(entry, dict):
+        raise ValidationError("Each job must be an object", field=f'jobs[{index}]')
+    
+    sanitized = {}
+    for field in ['sport', 'model_type'] + REAL_TRAINING_OPTIONAL_FIELDS:
+        if field not in entry:
+            if field in ('sport', 'model_type'):
+                raise ValidationError(f"Required field '{field}' missing", field=f'jobs[{index}].{field}')
+            continue
+        value = entry[field]
+        sanitized[field] = InputSanitizer.sanitize_string(value) if isinstance(value, str) else value
+    return sanitized
+
+def build_real_training_job(data: dict, user_id: str, field_prefix: str = '') -> dict:
+    """Build a training queue job spec from one real-training request body"""
+    sport = data['sport']
+    model_type = data['model_type']
+    
+    if sport not in SUPPORTED_SPORTS:
+        raise ValidationError("Invalid sport", field=f'{field_prefix}sport')
+    
+    if model_type not in TRAINING_JOB_MODEL_TYPES:
+        raise ValidationError("Invalid model type", field=f'{field_prefix}model_type')
+    
+    # Enhanced training configuration
+    training_config = {
+        'sport': sport,
+        'model_type': model_type,
+        'use_real_data': True,
+        'use_weather_features': model_type == 'lstm_weather',
+        'epochs': data.get('epochs', 50),
+        'batch_size': data.get('batch_size', 32),
+        'learning_rate': data.get('learning_rate', 0.001),
+        'hidden_units': data.get('hidden_units', 128),
+        'dropout_rate': data.get('dropout_rate', 0.2)
+    }
+    
+    return {
+        'model_id': f"{sport}_{model_type}_model",
+        'model_type': model_type,
+        'sport': sport,
+        'user_id': user_id,
+        'training_config': training_config
+    }
+
 @app.route('/api/training/real-training', methods=['POST'])
 @handle_errors
 @require_authentication
-@sanitize_request_data(required_fields=['sport', 'model_type'])
+@sanitize_request_data(required_fields=['sport', 'model_type'], optional_fields=REAL_TRAINING_OPTIONAL_FIELDS)
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
 def start_real_training():
     """Start real model training with GPU infrastructure"""
     try:
-        from training_queue import training_queue_manager
-        
-        data = request.get_json()
-        sport = data['sport']
-        model_type = data['model_type']
         user_id = g.current_user.get('user_id', 'demo_user')
-        
-        # Enhanced training configuration
-        training_config = {
-            'sport': sport,
-            'model_type': model_type,
-            'use_real_data': True,
-            'use_weather_features': model_type == 'lstm_weather',
-            'epochs': data.get('epochs', 50),
-            'batch_size': data.get('batch_size', 32),
-            'learning_rate': data.get('learning_rate', 0.001),
-            'hidden_units': data.get('hidden_units', 128),
-            'dropout_rate': data.get('dropout_rate', 0.2)
-        }
+        job = build_real_training_job(g.sanitized_request_data, user_id)
+        training_config = job['training_config']
         
         # Submit training job
-        job_id = training_queue_manager.submit_training_job(
-            model_name=f"{sport}_{model_type}_model",
-            sport=sport,
-            epochs=training_config['epochs'],
-            user_id=user_id,
-            training_config=training_config
-        )
+        job_id, = training_queue.submit_jobs([job])
+        invalidate_queue_status_cache()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'job_id': job_id,
-            'message': f'Real training started for {sport} {model_type} model',
+            'message': f"Real training started for {job['sport']} {job['model_type']} model",
             'training_config': training_config,
             'estimated_duration': f"{training_config['epochs'] * 10} seconds"
         })
         
+    except ValidationError:
+        raise
+    except Exception as e:
+        logger.error("Failed to start real training: %s", e)
+        raise ValidationError(f'Failed to start training: {e}')
+
+
+@app.route('/api/training/real-training/bulk', methods=['POST'])
+@handle_errors
+@require_authentication
+@sanitize_request_data(required_fields=['jobs'])
+@require_feature(TRAINING_QUEUE_AVAILABLE, 'Training queue')
+def start_real_training_bulk():
+    """Start several real training jobs, e.g. a hyperparameter sweep, in one request"""
+    try:
+        user_id = g.current_user.get('user_id', 'demo_user')
+        requested = g.sanitized_request_data['jobs']
+        
+        if not isinstance(requested, list) or not requested:
+            raise ValidationError("jobs must be a non-empty list", field='jobs')
+        
+        if len(requested) > REAL_TRAINING_BULK_LIMIT:
+            raise ValidationError(f"At most {REAL_TRAINING_BULK_LIMIT} jobs per request", field='jobs')
+        
+        # Build every spec before queueing anything, so one bad entry rejects the whole batch
+        jobs = [
+            build_real_training_job(sanitize_real_training_entry(entry, i), user_id, field_prefix=f'jobs[{i}].')
+            for i, entry in enumerate(requested)
+        ]
+        job_ids = training_queue.submit_jobs(jobs)
+        invalidate_queue_status_cache()
+        
+        logger.info("%d real training jobs submitted by user %s", len(job_ids), user_id)
+        
+        return ojsonify({
+            'success': True,
+            'job_ids': job_ids,
+            'total_jobs': len(job_ids)
+        }, status=201)
+        
+    except ValidationError:
+        raise
     except Exception as e:
-        logger.error(f"Failed to start real training: {e}")
+        logger.error("Failed to start bulk real training: %s", e)
         raise ValidationError(f'Failed to start training: {e}')
 
 
+# GPU probes are slow and identical across callers; concurrent polls share one probe
+GPU_STATUS_TTL = 1.5  # seconds
+_gpu_status_cache = None  # (gpu_status, timestamp)
+_gpu_status_lock = threading.Lock()
+
+def get_cached_gpu_status():
+    """Return the GPU status, probing at most once per TTL across concurrent polls"""
+    global _gpu_status_cache
+    with _gpu_status_lock:
+        if _gpu_status_cache is not None:
+            gpu_status, timestamp = _gpu_status_cache
+            if time.monotonic() - timestamp < GPU_STATUS_TTL:
+                record_cache_lookup('gpu_status', hit=True)
+                return gpu_status
+        record_cache_lookup('gpu_status', hit=False)
+        from real_model_training import get_gpu_status
+        gpu_status = get_gpu_status()
+        _gpu_status_cache = (gpu_status, time.monotonic())
+        return gpu_status
+
 @app.route('/api/training/gpu-status', methods=['GET'])
 @handle_errors
 @require_authentication
 def get_gpu_status():
     """Get current GPU status and availability"""
     try:
-        from real_model_training import get_gpu_status
-        
-        gpu_status = get_gpu_status()
+        gpu_status = get_cached_gpu_status()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'gpus': gpu_status,
             'total_gpus': len(gpu_status),
@@ -6709,12 +7789,17 @@ def get_gpu_status():
         })
         
     except Exception as e:
-        logger.error(f"Failed to get GPU status: {e}")
+        logger.error("Failed to get GPU status: %s", e)
         raise ValidationError(f'Failed to get GPU status: {e}')
 
 
 # Main execution guard - only run when script is executed directly
 if __name__ == '__main__':
-    # The app has already been created and initialized above
-    # Just run it directly on port 5001 to avoid conflicts
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # Local development only - serve with `gunicorn production:application` (gevent workers,
+    # see gunicorn.conf.py) so streaming and long-poll endpoints don't hold the only thread.
+    # The debugger/reloader is opt-in via FLASK_DEBUG=true.
+    debug = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
+    if socketio:
+        socketio.run(app, host=config.host, port=config.port, debug=debug)
+    else:
+        app.run(host=config.host, port=config.port, debug=debug, threaded=True)
\ No newline at end of file
@@ -7,7 +7,8 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import json
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 
@@ -18,7 +19,7 @@ class BettingStrategy(Enum):
     CONFIDENCE_BASED = "confidence_based"
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestConfig:
     """Configuration for backtesting simulation"""
     start_date: datetime
@@ -30,9 +31,10 @@ class BacktestConfig:
     max_bet_percentage: float
     commission_rate: float
     risk_management: Dict[str, Any]
+    keep_bet_history: bool = True  # False keeps only the recent_bets tail
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Results from a backtesting simulation"""
     total_bets: int
@@ -59,6 +61,11 @@ class BacktestResult:
     daily_returns: List[float]
     equity_curve: List[float]
     bet_history: List[Dict[str, Any]]
+    recent_bets: List[Dict[str, Any]] = field(default_factory=list)
+
+
+# Number of most recent bet records always kept on a BacktestResult
+RECENT_BETS_LIMIT = 20
 
 
 class BacktestingEngine:
@@ -199,17 +206,18 @@ class BacktestingEngine:
         
         return games_df, odds_df
     
-    def run_backtest(self, model, sport: str, config: BacktestConfig) -> BacktestResult:
-        """Run backtesting simulation"""
-        
-        # Get or generate historical data
+    def _get_historical_data(self, sport: str, config: BacktestConfig) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Get loaded historical games and odds for a sport, generating demo data if none are loaded"""
         if sport not in self.historical_data:
             games_df, odds_df = self.generate_demo_data(sport, config.start_date, config.end_date)
             self.historical_data[sport] = games_df
             self.odds_data[sport] = odds_df
-        else:
-            games_df = self.historical_data[sport]
-            odds_df = self.odds_data[sport]
+        return self.historical_data[sport], self.odds_data[sport]
+    
+    def run_backtest(self, model, sport: str, config: BacktestConfig) -> BacktestResult:
+        """Run backtesting simulation"""
+        
+        games_df, odds_df = self._get_historical_data(sport, config)
         
         # Filter data by date range
         mask = (games_df['date'] >= config.start_date) & (games_df['date'] <= config.end_date)
@@ -231,6 +239,7 @@ class BacktestingEngine:
         max_drawdown = 0
         
         bet_history = []
+        recent_bets = deque(maxlen=RECENT_BETS_LIMIT)
         daily_returns = []
         equity_curve = [bankroll]
         
@@ -348,7 +357,9 @@ class BacktestingEngine:
                     'commission': commission
                 }
                 
-                bet_history.append(bet_record)
+                recent_bets.append(bet_record)
+                if config.keep_bet_history:
+                    bet_history.append(bet_record)
                 
             except Exception as e:
                 # Skip this game if prediction fails
@@ -391,7 +402,8 @@ class BacktestingEngine:
             total_amount_wagered=total_wagered,
             daily_returns=daily_returns,
             equity_curve=equity_curve,
-            bet_history=bet_history
+            bet_history=bet_history,
+            recent_bets=list(recent_bets)
         )
     
     def _calculate_bet_amount(self, strategy: BettingStrategy, bankroll: float, 
@@ -452,18 +464,11 @@ class BacktestingEngine:
         """Compare different betting strategies"""
         results = {}
         
+        # Load the shared history once up front rather than inside the first run
+        self._get_historical_data(sport, base_config)
+        
         for strategy in strategies:
-            config = BacktestConfig(
-                start_date=base_config.start_date,
-                end_date=base_config.end_date,
-                initial_bankroll=base_config.initial_bankroll,
-                betting_strategy=strategy,
-                bet_amount=base_config.bet_amount,
-                min_confidence=base_config.min_confidence,
-                max_bet_percentage=base_config.max_bet_percentage,
-                commission_rate=base_config.commission_rate,
-                risk_management=base_config.risk_management
-            )
+            config = replace(base_config, betting_strategy=strategy)
             
             result = self.run_backtest(model, sport, config)
             results[strategy.value] = result
@@ -41,6 +41,9 @@ class MLConfig:
     max_training_samples: int = 10000
     default_confidence_threshold: float = 0.65
     enable_model_caching: bool = True
+    max_batch_size: int = 32
+    batch_timeout_ms: int = 5
+    warm_demo_data: bool = True
 
 @dataclass
 class AppConfig:
@@ -110,7 +113,10 @@ class ConfigManager:
             model_storage_path=os.getenv('MODEL_STORAGE_PATH', './models'),
             max_training_samples=int(os.getenv('MAX_TRAINING_SAMPLES', '10000')),
             default_confidence_threshold=float(os.getenv('DEFAULT_CONFIDENCE_THRESHOLD', '0.65')),
-            enable_model_caching=os.getenv('ENABLE_MODEL_CACHING', 'true').lower() == 'true'
+            enable_model_caching=os.getenv('ENABLE_MODEL_CACHING', 'true').lower() == 'true',
+            max_batch_size=int(os.getenv('MAX_BATCH_SIZE', '32')),
+            batch_timeout_ms=int(os.getenv('BATCH_TIMEOUT_MS', '5')),
+            warm_demo_data=os.getenv('WARM_DEMO_DATA', 'true').lower() == 'true'
         )
         
         return AppConfig(
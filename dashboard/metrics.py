@@ -0,0 +1,104 @@
+"""
+Prometheus metrics for Post9
+Prediction latency, Firestore round trips, cache hit rates and demo/ML branch counts
+"""
+import contextlib
+import hmac
+import logging
+import os
+
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
+
+logger = logging.getLogger(__name__)
+
+# prometheus_client is optional - metrics become no-ops without it
+try:
+    from prometheus_client import CollectorRegistry, Counter, Histogram, make_wsgi_app, multiprocess
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+class NoopMetric:
+    """Stand-in for a Prometheus metric when prometheus_client is not installed"""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def observe(self, value: float):
+        pass
+
+    def time(self):
+        return contextlib.nullcontext()
+
+
+if PROMETHEUS_AVAILABLE:
+    PREDICTION_LATENCY = Histogram(
+        'post9_predict_seconds', 'Model prediction latency', ['path']
+    )
+    FIRESTORE_LATENCY = Histogram(
+        'post9_firestore_rtt_seconds', 'Firestore round-trip latency', ['op']
+    )
+    JSON_ENCODE_LATENCY = Histogram(
+        'post9_json_encode_seconds', 'Response JSON encoding time', ['encoder'],
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+    )
+    CACHE_REQUESTS = Counter(
+        'post9_cache_requests_total', 'In-process cache lookups', ['cache', 'result']
+    )
+    MODEL_ENDPOINT_REQUESTS = Counter(
+        'post9_model_endpoint_requests_total', 'Model endpoint requests by serving mode', ['endpoint', 'mode']
+    )
+else:
+    PREDICTION_LATENCY = NoopMetric()
+    FIRESTORE_LATENCY = NoopMetric()
+    JSON_ENCODE_LATENCY = NoopMetric()
+    CACHE_REQUESTS = NoopMetric()
+    MODEL_ENDPOINT_REQUESTS = NoopMetric()
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count an in-process cache hit or miss"""
+    CACHE_REQUESTS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+
+def record_model_request(endpoint: str, demo: bool):
+    """Count a model endpoint request served from the demo or the ML branch"""
+    MODEL_ENDPOINT_REQUESTS.labels(endpoint=endpoint, mode='demo' if demo else 'ml').inc()
+
+
+def metrics_wsgi_app():
+    """WSGI app exposing metrics, aggregated across gunicorn workers when PROMETHEUS_MULTIPROC_DIR is set"""
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        # Single process - the default registry already holds every metric
+        return make_wsgi_app()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return make_wsgi_app(registry)
+
+
+def require_metrics_token(metrics_app, token: str):
+    """Wrap a WSGI app so it only answers requests carrying 'Authorization: Bearer <token>'"""
+    expected = f'Bearer {token}'
+
+    def guarded(environ, start_response):
+        if not hmac.compare_digest(environ.get('HTTP_AUTHORIZATION', ''), expected):
+            start_response('401 Unauthorized', [('Content-Type', 'text/plain'), ('WWW-Authenticate', 'Bearer')])
+            return [b'Unauthorized\n']
+        return metrics_app(environ, start_response)
+    return guarded
+
+
+def mount_metrics_endpoint(app):
+    """Serve Prometheus metrics at /metrics alongside the Flask app, for scrapers holding METRICS_TOKEN"""
+    if not PROMETHEUS_AVAILABLE:
+        logger.info("prometheus_client not installed - /metrics endpoint disabled")
+        return
+    token = os.getenv('METRICS_TOKEN')
+    if not token:
+        logger.info("METRICS_TOKEN not set - /metrics endpoint disabled")
+        return
+    app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {'/metrics': require_metrics_token(metrics_wsgi_app(), token)})
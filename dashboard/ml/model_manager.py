@@ -8,7 +8,7 @@ import pickle
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import threading
 import time
 
@@ -33,6 +33,7 @@ class MLModelManager:
         self.active_models = {}
         self.model_metadata = {}
         self.training_jobs = {}
+        self.progress_callbacks = {}  # job_id -> callback(job_id, event) for pushed progress updates
         self.performance_history = {}
         
         if ML_IMPORTS_AVAILABLE:
@@ -131,7 +132,8 @@ class MLModelManager:
         except Exception as e:
             raise Exception(f"Failed to create model: {e}")
     
-    def train_model_async(self, model_id: str, training_config: Dict[str, Any]) -> str:
+    def train_model_async(self, model_id: str, training_config: Dict[str, Any],
+                          progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> str:
         """Start asynchronous model training"""
         if model_id in self.training_jobs:
             if self.training_jobs[model_id]['status'] == 'training':
@@ -148,6 +150,8 @@ class MLModelManager:
             'error': None,
             'logs': []
         }
+        if progress_callback:
+            self.progress_callbacks[job_id] = progress_callback
         
         # Start training in background thread
         training_thread = threading.Thread(
@@ -164,6 +168,7 @@ class MLModelManager:
         try:
             self.training_jobs[job_id]['status'] = 'training'
             self.training_jobs[job_id]['progress'] = 10
+            self._notify_progress(job_id, 'progress', stage='started')
             
             metadata = self.model_metadata[model_id]
             
@@ -177,6 +182,7 @@ class MLModelManager:
             
             self.training_jobs[job_id]['progress'] = 30
             self.training_jobs[job_id]['logs'].append(f"Generated {len(training_data)} training samples")
+            self._notify_progress(job_id, 'progress', stage='data_ready')
             
             # Create model instance
             if metadata['model_type'] == 'neural':
@@ -205,6 +211,7 @@ class MLModelManager:
                 )
             
             self.training_jobs[job_id]['progress'] = 80
+            self._notify_progress(job_id, 'progress', stage='saving')
             
             # Save trained model
             model_path = os.path.join(self.models_dir, model_id)
@@ -234,12 +241,35 @@ class MLModelManager:
             self.training_jobs[job_id]['progress'] = 100
             self.training_jobs[job_id]['end_time'] = datetime.now().isoformat()
             self.training_jobs[job_id]['logs'].append("Training completed successfully")
+            self._notify_progress(job_id, 'completed', performance_metrics=training_results)
             
         except Exception as e:
             self.training_jobs[job_id]['status'] = 'failed'
             self.training_jobs[job_id]['error'] = str(e)
             self.training_jobs[job_id]['logs'].append(f"Training failed: {e}")
             print(f"Training failed for model {model_id}: {e}")
+            self._notify_progress(job_id, 'error', error=str(e))
+        finally:
+            self.progress_callbacks.pop(job_id, None)
+    
+    def _notify_progress(self, job_id: str, event_type: str, **details):
+        """Push a progress/completed/error event to the job's progress callback, if any"""
+        callback = self.progress_callbacks.get(job_id)
+        if not callback:
+            return
+        
+        job = self.training_jobs[job_id]
+        event = {
+            'type': event_type,
+            'job_id': job_id,
+            'status': job['status'],
+            'progress': job['progress'],
+            **details
+        }
+        try:
+            callback(job_id, event)
+        except Exception as e:
+            print(f"Training progress callback failed for job {job_id}: {e}")
     
     def get_training_status(self, job_id: str) -> Dict[str, Any]:
         """Get status of training job"""
@@ -279,38 +309,44 @@ class MLModelManager:
     
     def predict_game(self, model_id: str, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make prediction using specified model"""
+        return self.predict_batch(model_id, [game_data])[0]
+    
+    def predict_batch(self, model_id: str, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Make predictions for several games with one model call where the model supports it"""
         if model_id not in self.active_models:
             # Try to load the model
             if not self._load_model(model_id):
-                return {'error': 'Model not available'}
+                return [{'error': 'Model not available'} for _ in games]
         
+        model = self.active_models[model_id]
         try:
-            model = self.active_models[model_id]
-            prediction = model.predict_game(game_data)
-            
-            # Log prediction for performance tracking
-            if model_id not in self.performance_history:
-                self.performance_history[model_id] = {
-                    'predictions': [],
-                    'last_prediction': datetime.now().isoformat()
-                }
-            
-            self.performance_history[model_id]['predictions'].append({
-                'game_data': game_data,
-                'prediction': prediction,
-                'timestamp': datetime.now().isoformat()
-            })
-            self.performance_history[model_id]['last_prediction'] = datetime.now().isoformat()
-            
-            # Keep only last 100 predictions
-            if len(self.performance_history[model_id]['predictions']) > 100:
-                self.performance_history[model_id]['predictions'] = \
-                    self.performance_history[model_id]['predictions'][-100:]
-            
-            return prediction
-            
-        except Exception as e:
-            return {'error': f'Prediction failed: {e}'}
+            if hasattr(model, 'predict_games'):
+                predictions = model.predict_games(games)
+            else:
+                predictions = [model.predict_game(game_data) for game_data in games]
+        except Exception:
+            # Score each game on its own so one bad input doesn't fail the whole batch
+            predictions = []
+            for game_data in games:
+                try:
+                    predictions.append(model.predict_game(game_data))
+                except Exception as e:
+                    predictions.append({'error': f'Prediction failed: {e}'})
+        
+        # Log predictions for performance tracking
+        history = self.performance_history.setdefault(model_id, {'predictions': []})
+        timestamp = datetime.now().isoformat()
+        history['predictions'].extend(
+            {'game_data': game_data, 'prediction': prediction, 'timestamp': timestamp}
+            for game_data, prediction in zip(games, predictions)
+        )
+        history['last_prediction'] = timestamp
+        
+        # Keep only last 100 predictions
+        if len(history['predictions']) > 100:
+            history['predictions'] = history['predictions'][-100:]
+        
+        return predictions
     
     def get_model_performance(self, model_id: str) -> Dict[str, Any]:
         """Get model performance metrics and history"""
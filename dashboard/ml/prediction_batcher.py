@@ -0,0 +1,98 @@
+"""
+Prediction Micro-Batching
+Coalesces concurrent single-game predictions into batched model calls
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List
+
+
+class PredictionBatcherFull(RuntimeError):
+    """Raised when every dispatcher slot is taken by other models"""
+
+
+class PredictionBatcher:
+    """Groups concurrent predictions per model into one predict_batch call"""
+    
+    def __init__(self, predict_batch: Callable[[str, List[Dict[str, Any]]], List[Dict[str, Any]]],
+                 max_batch_size: int = 32, batch_timeout_ms: int = 5,
+                 max_models: int = 32, idle_timeout: float = 60.0):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_timeout = batch_timeout_ms / 1000
+        self.max_models = max(1, max_models)
+        self.idle_timeout = idle_timeout
+        self.queues = {}
+        self.lock = threading.Lock()
+    
+    def submit(self, model_id: str, game_data: Dict[str, Any]) -> Future:
+        """Queue a single prediction and return a future resolved when its batch has been scored"""
+        future = Future()
+        with self.lock:
+            # Enqueue under the lock so an idle dispatcher can't retire the queue in between
+            self._get_queue(model_id).put((game_data, future))
+        return future
+    
+    def predict(self, model_id: str, game_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a single prediction and block until its batch has been scored"""
+        return self.submit(model_id, game_data).result()
+    
+    def _get_queue(self, model_id: str) -> queue.Queue:
+        """Get the request queue for a model, starting its dispatcher on first use (caller holds the lock)"""
+        if model_id not in self.queues:
+            if len(self.queues) >= self.max_models:
+                raise PredictionBatcherFull('Too many models with pending predictions')
+            self.queues[model_id] = queue.Queue()
+            dispatcher = threading.Thread(
+                target=self._dispatch,
+                args=(model_id, self.queues[model_id]),
+                name=f"predict-batcher-{model_id}"
+            )
+            dispatcher.daemon = True
+            dispatcher.start()
+        return self.queues[model_id]
+    
+    def _dispatch(self, model_id: str, requests: queue.Queue):
+        """Drain up to max_batch_size requests (or until the batch timeout) and score them together"""
+        while True:
+            try:
+                batch = [requests.get(timeout=self.idle_timeout)]
+            except queue.Empty:
+                with self.lock:
+                    # Retire idle dispatchers; the next request for this model starts a new one
+                    if requests.empty():
+                        del self.queues[model_id]
+                        return
+                continue
+            
+            deadline = time.monotonic() + self.batch_timeout
+            try:
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(requests.get(timeout=remaining))
+            except queue.Empty:
+                pass
+            
+            games = [game_data for game_data, _ in batch]
+            for (_, future), prediction in zip(batch, self._score(model_id, games)):
+                future.set_result(prediction)
+    
+    def _score(self, model_id: str, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score a batch, falling back to one call per game so a bad input only fails itself"""
+        try:
+            return self.predict_batch(model_id, games)
+        except Exception as e:
+            if len(games) == 1:
+                return [{'error': f'Prediction failed: {e}'}]
+        
+        predictions = []
+        for game_data in games:
+            try:
+                predictions.append(self.predict_batch(model_id, [game_data])[0])
+            except Exception as e:
+                predictions.append({'error': f'Prediction failed: {e}'})
+        return predictions
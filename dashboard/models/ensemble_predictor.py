@@ -301,56 +301,71 @@ class SportsEnsemblePredictor:
     
     def predict_game(self, game_data: Dict) -> Dict:
         """Predict outcome for a single game using ensemble"""
+        return self.predict_games([game_data])[0]
+    
+    def predict_games(self, games: List[Dict]) -> List[Dict]:
+        """Predict outcomes for several games with one vectorized pass through the ensemble"""
         if not self.is_trained:
-            return {'error': 'Model not trained yet'}
+            return [{'error': 'Model not trained yet'} for _ in games]
+        
+        # Feature selection depends on which keys are present, so mixed inputs are predicted separately
+        if len({frozenset(game) for game in games}) > 1:
+            return [self.predict_games([game])[0] for game in games]
         
         # Convert to DataFrame
-        df = pd.DataFrame([game_data])
+        df = pd.DataFrame(games)
         
         # Prepare features
         X = self.prepare_features(df)
         X_scaled = self.scaler.transform(X)
         
         # Get ensemble prediction
-        ensemble_proba = self.ensemble_model.predict_proba(X_scaled)[0]
-        ensemble_pred = self.ensemble_model.predict(X_scaled)[0]
+        ensemble_proba = self.ensemble_model.predict_proba(X_scaled)
+        ensemble_pred = self.ensemble_model.predict(X_scaled)
         
         # Get individual model predictions
-        individual_predictions = {}
+        individual_batches = {}
         for name, model in self.models.items():
             try:
-                pred_proba = model.predict_proba(X_scaled)[0]
-                individual_predictions[name] = {
-                    'probabilities': pred_proba.tolist(),
-                    'predicted_class': int(model.predict(X_scaled)[0])
-                }
+                individual_batches[name] = (model.predict_proba(X_scaled), model.predict(X_scaled))
             except:
                 pass  # Skip models that might have issues
         
-        # Get neural network prediction if available
-        if self.use_neural and self.neural_predictor and self.neural_predictor.is_trained:
-            try:
-                neural_pred = self.neural_predictor.predict_game(game_data)
-                if 'error' not in neural_pred:
-                    individual_predictions['neural_network'] = neural_pred
-            except:
-                pass
-        
-        # Map prediction back to label
-        predicted_label = self.label_encoder.inverse_transform([ensemble_pred])[0]
-        confidence = float(np.max(ensemble_proba))
+        # Map predictions back to labels
+        predicted_labels = self.label_encoder.inverse_transform(ensemble_pred)
         
-        return {
-            'ensemble_prediction': predicted_label,
-            'confidence': confidence,
-            'ensemble_probabilities': {
-                label: float(prob) 
-                for label, prob in zip(self.label_encoder.classes_, ensemble_proba)
-            },
-            'individual_predictions': individual_predictions,
-            'sport': self.sport,
-            'model_type': 'ensemble'
-        }
+        results = []
+        for row, game_data in enumerate(games):
+            individual_predictions = {
+                name: {
+                    'probabilities': pred_proba[row].tolist(),
+                    'predicted_class': int(pred[row])
+                }
+                for name, (pred_proba, pred) in individual_batches.items()
+            }
+            
+            # Get neural network prediction if available
+            if self.use_neural and self.neural_predictor and self.neural_predictor.is_trained:
+                try:
+                    neural_pred = self.neural_predictor.predict_game(game_data)
+                    if 'error' not in neural_pred:
+                        individual_predictions['neural_network'] = neural_pred
+                except:
+                    pass
+            
+            results.append({
+                'ensemble_prediction': predicted_labels[row],
+                'confidence': float(np.max(ensemble_proba[row])),
+                'ensemble_probabilities': {
+                    label: float(prob) 
+                    for label, prob in zip(self.label_encoder.classes_, ensemble_proba[row])
+                },
+                'individual_predictions': individual_predictions,
+                'sport': self.sport,
+                'model_type': 'ensemble'
+            })
+        
+        return results
     
     def get_feature_importance_ensemble(self) -> Dict:
         """Get feature importance from ensemble models"""
@@ -7,6 +7,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import json
+import threading
 from dataclasses import dataclass
 from enum import Enum
 
@@ -50,6 +51,10 @@ class ModelPerformanceMatrix:
     
     def __init__(self):
         self.performance_data: List[ModelPerformanceEntry] = []
+        self.entries_by_model: Dict[str, List[ModelPerformanceEntry]] = {}
+        self.latest_by_model: Dict[str, ModelPerformanceEntry] = {}
+        self._demo_checked = False
+        self._demo_lock = threading.Lock()
         self.model_metadata: Dict[str, Dict] = {}
         self.benchmark_metrics: Dict[str, float] = {
             'minimum_accuracy': 0.55,
@@ -63,6 +68,11 @@ class ModelPerformanceMatrix:
     def add_performance_entry(self, entry: ModelPerformanceEntry):
         """Add a new performance entry"""
         self.performance_data.append(entry)
+        self.entries_by_model.setdefault(entry.model_id, []).append(entry)
+        
+        latest = self.latest_by_model.get(entry.model_id)
+        if latest is None or entry.evaluation_date > latest.evaluation_date:
+            self.latest_by_model[entry.model_id] = entry
         
         # Update model metadata
         if entry.model_id not in self.model_metadata:
@@ -141,13 +151,13 @@ class ModelPerformanceMatrix:
         comparison_data = {}
         
         for model_id in model_ids:
-            model_entries = [entry for entry in self.performance_data if entry.model_id == model_id]
+            model_entries = self.entries_by_model.get(model_id)
             
             if not model_entries:
                 continue
             
             # Get latest entry
-            latest_entry = max(model_entries, key=lambda x: x.evaluation_date)
+            latest_entry = self.latest_by_model[model_id]
             
             # Calculate historical performance
             accuracies = [entry.accuracy for entry in model_entries]
@@ -362,6 +372,16 @@ class ModelPerformanceMatrix:
         
         return comparison
     
+    def ensure_demo_data(self):
+        """Generate demo data once if no performance entries exist, even under concurrent requests"""
+        if self._demo_checked:
+            return
+        with self._demo_lock:
+            if not self._demo_checked:
+                if not self.performance_data:
+                    self.generate_demo_data()
+                self._demo_checked = True
+    
     def generate_demo_data(self):
         """Generate demo performance data for testing"""
         sports = ['NBA', 'NFL', 'MLB', 'NCAAF', 'NCAAB']
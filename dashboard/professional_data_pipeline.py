@@ -6,16 +6,28 @@ import os
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Deque, Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import threading
 from concurrent.futures import ThreadPoolExecutor, Future
 import queue
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Long-poll limits for job status requests
+JOB_STATUS_MAX_WAIT = 30  # seconds
+MAX_JOB_STATUS_WAITERS = 16
+
+# Log lines kept per job - only the most recent ones are ever shown
+JOB_LOG_LIMIT = 10
+
+# Pending job events held per event-stream subscriber before new ones are dropped
+JOB_EVENT_QUEUE_SIZE = 100
+MAX_JOB_EVENT_STREAMS = 64  # open event streams per process
+
 
 class DataSourceType(Enum):
     """Available data source types"""
@@ -40,6 +52,9 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+TERMINAL_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
 @dataclass
 class DataSourceConfig:
     """Configuration for a data source"""
@@ -71,13 +86,15 @@ class ProcessingJob:
     progress_percent: int = 0
     error_message: Optional[str] = None
     results: Dict[str, Any] = field(default_factory=dict)
-    logs: List[str] = field(default_factory=list)
+    logs: Deque[str] = field(default_factory=lambda: deque(maxlen=JOB_LOG_LIMIT))
     estimated_completion: Optional[datetime] = None
+    revision: int = 0  # Bumped on every visible change, for status ETags
     
     def add_log(self, message: str):
         """Add a log entry with timestamp"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         self.logs.append(f"[{timestamp}] {message}")
+        self.revision += 1
 
 
 class DataSource:
@@ -295,10 +312,18 @@ class DataPipelineManager:
     def __init__(self):
         self.data_sources = {}
         self.jobs = {}
+        self.jobs_by_user = {}  # user_id -> list of job ids, in submission order
+        self.job_summaries = {}  # job_id -> listing dict, rebuilt when the job changes
+        self.user_revisions = {}  # user_id -> counter bumped when any of the user's listing entries change
         self.job_queue = queue.PriorityQueue()
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.running_jobs = {}
         self.logger = logging.getLogger(__name__)
+        self.job_changed = threading.Condition()
+        self.status_waiters = threading.BoundedSemaphore(MAX_JOB_STATUS_WAITERS)
+        self.event_subscribers = {}  # user_id -> list of event queues
+        self.event_stream_count = 0
+        self.subscribers_lock = threading.Lock()
         
         # Initialize default data sources
         self._initialize_default_sources()
@@ -383,6 +408,9 @@ class DataPipelineManager:
         )
         
         self.jobs[job_id] = job
+        self.jobs_by_user.setdefault(user_id, []).append(job_id)
+        self.job_summaries[job_id] = self._job_summary(job)
+        self.user_revisions[user_id] = self.user_revisions.get(user_id, 0) + 1
         
         # Add to processing queue (priority based on data source priorities)
         max_priority = max([self._get_source_priority(ds) for ds in data_sources], default=1)
@@ -396,6 +424,64 @@ class DataPipelineManager:
         
         return job_id
         
+    @staticmethod
+    def _job_summary(job: ProcessingJob) -> Dict[str, Any]:
+        """Build the listing entry for a job"""
+        return {
+            'job_id': job.job_id,
+            'sport': job.sport,
+            'model_type': job.model_type,
+            'status': job.status.value,
+            'progress_percent': job.progress_percent,
+            'created_at': job.created_at.isoformat(),
+            'data_sources_count': len(job.data_sources),
+            'has_results': bool(job.results)
+        }
+        
+    def _notify_job_change(self, job: ProcessingJob):
+        """Refresh the job's listing entry, wake long-polling status requests and push it to the owner's streams"""
+        event = self._job_summary(job)
+        self.job_summaries[job.job_id] = event
+        job.revision += 1
+        self.user_revisions[job.user_id] = self.user_revisions.get(job.user_id, 0) + 1
+        
+        with self.job_changed:
+            self.job_changed.notify_all()
+            
+        with self.subscribers_lock:
+            subscribers = list(self.event_subscribers.get(job.user_id, ()))
+        for events in subscribers:
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                # Slow client - it will resync from the jobs listing when it reconnects
+                pass
+                
+    def job_event_streams_full(self) -> bool:
+        """Whether MAX_JOB_EVENT_STREAMS event queues are already registered"""
+        with self.subscribers_lock:
+            return self.event_stream_count >= MAX_JOB_EVENT_STREAMS
+        
+    def subscribe_job_events(self, user_id: str) -> Optional[queue.Queue]:
+        """Register an event queue receiving the user's job status changes, or None when streams are full"""
+        events = queue.Queue(maxsize=JOB_EVENT_QUEUE_SIZE)
+        with self.subscribers_lock:
+            if self.event_stream_count >= MAX_JOB_EVENT_STREAMS:
+                return None
+            self.event_stream_count += 1
+            self.event_subscribers.setdefault(user_id, []).append(events)
+        return events
+        
+    def unsubscribe_job_events(self, user_id: str, events: queue.Queue):
+        """Remove an event queue registered by subscribe_job_events"""
+        with self.subscribers_lock:
+            user_queues = self.event_subscribers.get(user_id, [])
+            if events in user_queues:
+                user_queues.remove(events)
+                self.event_stream_count -= 1
+            if not user_queues:
+                self.event_subscribers.pop(user_id, None)
+            
     def _get_source_priority(self, source_type: DataSourceType) -> int:
         """Get priority for a data source type"""
         for source in self.data_sources.values():
@@ -433,6 +519,7 @@ class DataPipelineManager:
         try:
             job.status = JobStatus.RUNNING
             job.add_log("Starting data collection...")
+            self._notify_job_change(job)
             
             collected_data = {}
             total_sources = len(job.data_sources)
@@ -463,6 +550,7 @@ class DataPipelineManager:
                         
                     completed_sources += 1
                     job.progress_percent = int((completed_sources / total_sources) * 80)  # 80% for data collection
+                    self._notify_job_change(job)
                     
                 except Exception as e:
                     job.add_log(f"✗ Failed to fetch {source_type.value}: {str(e)}")
@@ -475,12 +563,14 @@ class DataPipelineManager:
             job.progress_percent = 100
             job.status = JobStatus.COMPLETED
             job.add_log("Job completed successfully!")
+            self._notify_job_change(job)
             
         except Exception as e:
             job.status = JobStatus.FAILED
             job.error_message = str(e)
             job.add_log(f"Job failed: {str(e)}")
             self.logger.error(f"Job {job.job_id} failed: {e}")
+            self._notify_job_change(job)
             
     def _find_enabled_source(self, source_type: DataSourceType) -> Optional[DataSource]:
         """Find an enabled source of the given type"""
@@ -543,9 +633,32 @@ class DataPipelineManager:
         """Get the status of a job"""
         return self.jobs.get(job_id)
         
+    def wait_for_job_change(self, job_id: str, since_progress: int, timeout: float) -> Optional[ProcessingJob]:
+        """Block until a job's progress moves past since_progress or it finishes, up to timeout seconds"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        
+        # Over the waiter cap, answer immediately rather than tie up another worker thread
+        if not self.status_waiters.acquire(blocking=False):
+            return job
+        try:
+            with self.job_changed:
+                self.job_changed.wait_for(
+                    lambda: job.progress_percent != since_progress or job.status in TERMINAL_JOB_STATUSES,
+                    timeout=min(timeout, JOB_STATUS_MAX_WAIT)
+                )
+        finally:
+            self.status_waiters.release()
+        return job
+        
     def get_user_jobs(self, user_id: str) -> List[ProcessingJob]:
         """Get all jobs for a user"""
-        return [job for job in self.jobs.values() if job.user_id == user_id]
+        return [self.jobs[job_id] for job_id in self.jobs_by_user.get(user_id, ())]
+        
+    def get_user_job_summaries(self, user_id: str) -> List[Dict[str, Any]]:
+        """Get the listing entries for all of a user's jobs"""
+        return [self.job_summaries[job_id] for job_id in self.jobs_by_user.get(user_id, ())]
         
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a job"""
@@ -554,6 +667,7 @@ class DataPipelineManager:
             if job.status in [JobStatus.PENDING, JobStatus.RUNNING]:
                 job.status = JobStatus.CANCELLED
                 job.add_log("Job cancelled by user")
+                self._notify_job_change(job)
                 return True
         return False
         
@@ -62,6 +62,15 @@ class BetOutcome(Enum):
     CANCELLED = "C"
 
 
+# Enum values resolved once at import, so consumers avoid iterating EnumMeta per call
+MODEL_STATUS_VALUES = tuple(status.value for status in ModelStatus)
+INVESTOR_STATUS_VALUES = tuple(status.value for status in InvestorStatus)
+STRATEGY_TYPE_VALUES = tuple(stype.value for stype in StrategyType)
+SPORT_VALUES = tuple(sport.value for sport in Sport)
+MARKET_TYPE_VALUES = tuple(market.value for market in MarketType)
+BET_OUTCOME_VALUES = tuple(outcome.value for outcome in BetOutcome)
+
+
 @dataclass
 class PerformanceMetrics:
     """Standardized performance tracking metrics"""
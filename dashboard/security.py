@@ -4,6 +4,7 @@ Professional security and authentication system for Post9
 import hashlib
 import hmac
 import jwt
+import os
 import time
 import secrets
 import logging
@@ -14,15 +15,33 @@ from typing import Dict, Optional, Any
 from flask import request, g, current_app
 from error_handling import AuthenticationError, AuthorizationError, ValidationError
 
+# Redis is optional - rate limiting falls back to in-process counters without it
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def create_redis_client():
+    """Create a Redis client from REDIS_URL, or None when Redis is not configured"""
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url or not REDIS_AVAILABLE:
+        return None
+    try:
+        return redis.Redis.from_url(redis_url)
+    except Exception as e:
+        logger.warning(f"Failed to create Redis client, using in-memory rate limiting: {e}")
+        return None
+
 class SecurityManager:
     """Centralized security management"""
     
     def __init__(self, secret_key: str, token_expiry_hours: int = 24):
         self.secret_key = secret_key
         self.token_expiry_hours = token_expiry_hours
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = RateLimiter(redis_client=create_redis_client())
     
     def generate_api_key(self, user_id: str, permissions: list = None) -> str:
         """Generate secure API key for user"""
@@ -99,8 +118,9 @@ class SecurityManager:
 class RateLimiter:
     """Rate limiting for API endpoints"""
     
-    def __init__(self):
-        self.requests = {}  # In production, use Redis
+    def __init__(self, redis_client=None):
+        self.redis = redis_client
+        self.requests = {}  # In-memory fallback when Redis is not configured
         self.cleanup_interval = 3600  # 1 hour
         self.last_cleanup = time.time()
     
@@ -108,6 +128,12 @@ class RateLimiter:
         """Check if request is within rate limit"""
         now = time.time()
         
+        if self.redis is not None:
+            try:
+                return self._is_allowed_redis(identifier, limit, window, now)
+            except Exception as e:
+                logger.warning(f"Redis rate limiting failed, using in-memory counters: {e}")
+        
         # Cleanup old entries periodically
         if now - self.last_cleanup > self.cleanup_interval:
             self._cleanup_old_entries()
@@ -130,6 +156,15 @@ class RateLimiter:
         
         return False
     
+    def _is_allowed_redis(self, identifier: str, limit: int, window: int, now: float) -> bool:
+        """Fixed-window rate limit check using a single Redis INCR/EXPIRE round trip"""
+        key = f"rate_limit:{identifier}:{window}:{int(now // window)}"
+        pipe = self.redis.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, window)
+        count, _ = pipe.execute()
+        return count <= limit
+    
     def _cleanup_old_entries(self):
         """Remove old rate limit entries"""
         now = time.time()
@@ -270,7 +305,7 @@ def rate_limit(requests_per_hour: int = 1000):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Get identifier (user ID or IP address)
+            # Get identifier (user ID or IP address - IP when applied before authentication)
             identifier = getattr(g, 'current_user', {}).get('user_id') or request.remote_addr
             
             rate_limiter = current_app.security_manager.rate_limiter
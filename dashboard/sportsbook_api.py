@@ -7,7 +7,7 @@ import requests
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import time
@@ -329,6 +329,7 @@ class BettingExecutionService:
         self.sportsbooks = {}
         self.default_sportsbook = None
         self.pending_investments = {}  # Store investments for manual processing
+        self.pending_totals = {}  # user_id -> [total amount, total potential payout], kept on write
         
         # Log important safety message
         logger.info("[SAFETY] LIVE BETTING DISABLED FOR SAFETY [SAFETY]")
@@ -367,6 +368,9 @@ class BettingExecutionService:
             self.pending_investments[user_id] = []
             
         self.pending_investments[user_id].append(investment)
+        totals = self.pending_totals.setdefault(user_id, [0.0, 0.0])
+        totals[0] += investment['amount']
+        totals[1] += investment['potential_payout']
         
         logger.info(f"Investment held for manual placement: {investment_id}")
         
@@ -396,26 +400,40 @@ class BettingExecutionService:
         """Get pending investments for a user"""
         return self.pending_investments.get(user_id, [])
         
+    def get_pending_investments_page(self, user_id: str, limit: Optional[int] = None,
+                                     offset: int = 0) -> Dict[str, Any]:
+        """Get a page of a user's pending investments with totals across all of them"""
+        investments = self.pending_investments.get(user_id, [])
+        total_amount, total_potential_payout = self.pending_totals.get(user_id, (0.0, 0.0))
+        end = None if limit is None else offset + max(limit, 0)
+        
+        return {
+            'rows': investments[offset:end],
+            'total_count': len(investments),
+            'total_amount': total_amount,
+            'total_potential_payout': total_potential_payout
+        }
+        
     def export_investments_to_csv(self, user_id: str) -> str:
         """Export user's pending investments to CSV format"""
-        investments = self.get_pending_investments(user_id)
+        return "".join(self.stream_investments_csv(user_id))
+        
+    def stream_investments_csv(self, user_id: str) -> Iterator[str]:
+        """Yield user's pending investments as CSV, header first then one row at a time"""
+        # Snapshot the list so investments added mid-export don't disturb iteration
+        investments = list(self.get_pending_investments(user_id))
         
         if not investments:
-            return "No pending investments to export"
+            yield "No pending investments to export"
+            return
             
-        # Create CSV content
-        csv_lines = [
-            "Investment ID,Game,Market Type,Selection,Odds,Amount,Potential Payout,Sportsbook,Created At,Notes"
-        ]
+        yield "Investment ID,Game,Market Type,Selection,Odds,Amount,Potential Payout,Sportsbook,Created At,Notes"
         
         for inv in investments:
-            csv_line = f"{inv['id']},{inv['game']},{inv['market_type']},{inv['selection']}," \
-                      f"{inv['odds']},{inv['amount']:.2f},{inv['potential_payout']:.2f}," \
-                      f"{inv['sportsbook']},{inv['created_at'].strftime('%Y-%m-%d %H:%M:%S')}," \
-                      f"\"{inv['notes']}\""
-            csv_lines.append(csv_line)
-            
-        return "\n".join(csv_lines)
+            yield f"\n{inv['id']},{inv['game']},{inv['market_type']},{inv['selection']}," \
+                  f"{inv['odds']},{inv['amount']:.2f},{inv['potential_payout']:.2f}," \
+                  f"{inv['sportsbook']},{inv['created_at'].strftime('%Y-%m-%d %H:%M:%S')}," \
+                  f"\"{inv['notes']}\""
         
     def confirm_investment(self, investment_id: str, user_id: str, 
                           actual_odds: Optional[float] = None,
@@ -460,6 +478,8 @@ class BettingExecutionService:
         for inv in investments:
             if inv['id'] == investment_id and inv['status'] == 'pending_export':
                 
+                previous_amount, previous_payout = inv['amount'], inv['potential_payout']
+                
                 # Update allowed fields
                 updatable_fields = ['amount', 'odds', 'selection', 'sportsbook', 'notes']
                 for field in updatable_fields:
@@ -470,6 +490,10 @@ class BettingExecutionService:
                 inv['potential_payout'] = inv['amount'] * inv['odds']
                 inv['updated_at'] = datetime.now()
                 
+                totals = self.pending_totals[user_id]
+                totals[0] += inv['amount'] - previous_amount
+                totals[1] += inv['potential_payout'] - previous_payout
+                
                 logger.info(f"Investment edited: {investment_id}")
                 
                 return {
@@ -152,15 +152,27 @@ class TrainingQueueManager:
     def submit_job(self, model_id: str, model_type: str, sport: str, user_id: str,
                    training_config: Dict[str, Any]) -> str:
         """Submit a new training job to the queue"""
-        job = TrainingJob(model_id, model_type, sport, user_id, training_config)
-        
-        self.jobs[job.job_id] = job
-        self.queue.append(job.job_id)
+        return self.submit_jobs([{
+            'model_id': model_id,
+            'model_type': model_type,
+            'sport': sport,
+            'user_id': user_id,
+            'training_config': training_config
+        }])[0]
+    
+    def submit_jobs(self, job_specs: List[Dict[str, Any]]) -> List[str]:
+        """Submit several training jobs, adding them to the queue in one step"""
+        jobs = [TrainingJob(**spec) for spec in job_specs]
         
         # Log job submission
-        job.logs.append(f"Job submitted to queue at {datetime.now().strftime('%H:%M:%S')}")
+        submitted_at = datetime.now().strftime('%H:%M:%S')
+        for job in jobs:
+            job.logs.append(f"Job submitted to queue at {submitted_at}")
+        
+        self.jobs.update((job.job_id, job) for job in jobs)
+        self.queue.extend(job.job_id for job in jobs)
         
-        return job.job_id
+        return [job.job_id for job in jobs]
     
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific job"""
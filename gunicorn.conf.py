@@ -0,0 +1,57 @@
+"""
+Gunicorn configuration for Post9
+Picked up automatically when gunicorn is started from the repository root
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+# One worker process (one interpreter) per CPU; the model manager is shared inside each worker.
+# Data pipeline jobs and their /api/data-pipeline/events streams are per worker too: an event stream
+# only hears about jobs run by the worker serving it, so clients should resync from the jobs listing
+# Flask-SocketIO (/socket.io) with more than one worker needs sticky sessions at the load balancer
+# and REDIS_URL as its message queue; see DEPLOYMENT.md
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+
+# Cooperative gevent workers keep serving while requests wait on Firestore and external APIs
+try:
+    import gevent  # noqa: F401
+    worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+except ImportError:
+    worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'sync')
+
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+
+# Keep BLAS/OpenMP to one thread per worker so N workers don't oversubscribe the CPUs
+raw_env = [
+    f"OMP_NUM_THREADS={os.getenv('OMP_NUM_THREADS', '1')}",
+    f"MKL_NUM_THREADS={os.getenv('MKL_NUM_THREADS', '1')}",
+    f"OPENBLAS_NUM_THREADS={os.getenv('OPENBLAS_NUM_THREADS', '1')}",
+]
+
+
+# With PROMETHEUS_MULTIPROC_DIR set, workers write metrics to files there and /metrics sums them,
+# so a scrape covers every worker rather than whichever one answered it
+def on_starting(server):
+    """Clear metric files left by a previous run"""
+    metrics_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if not metrics_dir:
+        return
+    os.makedirs(metrics_dir, mode=0o700, exist_ok=True)
+    for name in os.listdir(metrics_dir):
+        if name.endswith('.db'):
+            os.remove(os.path.join(metrics_dir, name))
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live metrics so they stop being aggregated"""
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        return
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
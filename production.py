@@ -10,6 +10,10 @@ from pathlib import Path
 # Suppress TensorFlow oneDNN verbose messages
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 
+# One BLAS/OpenMP thread per worker process - parallelism comes from gunicorn workers
+for thread_var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(thread_var, '1')
+
 # Add the dashboard directory to Python path
 dashboard_dir = Path(__file__).parent / "dashboard"
 sys.path.insert(0, str(dashboard_dir))
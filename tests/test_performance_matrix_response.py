@@ -0,0 +1,40 @@
+"""
+Checks that /api/performance/matrix still returns what Flask's stdlib jsonify produced
+Run from the repository root: python -m unittest discover tests
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dashboard'))
+
+import app as dashboard_app  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+
+class PerformanceMatrixResponseTest(unittest.TestCase):
+    """The orjson-encoded matrix body must match the old jsonify output field for field"""
+
+    @unittest.skipUnless(dashboard_app.PERFORMANCE_MATRIX_AVAILABLE, 'performance matrix not available')
+    def test_matrix_matches_stdlib_jsonify(self):
+        client = dashboard_app.app.test_client()
+        response = client.get('/api/performance/matrix?user_id=matrix_check&days_back=365')
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.get_data())
+        self.assertTrue(body['matrix'])
+
+        # Rebuild the rows the way the endpoint did before, and encode them with stdlib jsonify
+        matrix_df = dashboard_app.performance_matrix.get_performance_matrix(None, None, 365)
+        with dashboard_app.app.app_context():
+            expected = json.loads(DefaultJSONProvider(dashboard_app.app).dumps(matrix_df.to_dict('records')))
+
+        self.assertEqual(body['matrix'], expected)
+        # Dates stay strings and floats keep full precision
+        row = body['matrix'][0]
+        self.assertIsInstance(row['Training Date'], str)
+        self.assertIsInstance(row['Evaluation Date'], str)
+
+
+if __name__ == '__main__':
+    unittest.main()